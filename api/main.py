@@ -2,16 +2,17 @@
 FastAPI backend service for legal document analysis
 """
 
-from fastapi import FastAPI, File, UploadFile, HTTPException, BackgroundTasks
-from fastapi.responses import FileResponse, JSONResponse
+from fastapi import FastAPI, File, UploadFile, HTTPException, BackgroundTasks, Request, Query
+from fastapi.responses import FileResponse, JSONResponse, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from pydantic import BaseModel
 from typing import List, Optional, Dict, Any
 import os
 import tempfile
-import shutil
 from pathlib import Path
 import uuid
+import hashlib
 from datetime import datetime
 import json
 
@@ -33,9 +34,15 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compress status payloads and text results (YAML/Markdown) for clients that accept it
+app.add_middleware(GZipMiddleware, minimum_size=1000, compresslevel=6)
+
 # Store for tracking analysis jobs
 analysis_jobs = {}
 
+# Uploaded files by (sha256 hex digest, file extension), so repeat uploads can be skipped
+uploaded_files = {}
+
 
 class AnalysisRequest(BaseModel):
     """Request model for document analysis"""
@@ -133,41 +140,96 @@ async def upload_document(file: UploadFile = File(...)):
         file_extension = Path(file.filename).suffix
         file_path = upload_dir / f"{file_id}{file_extension}"
         
+        # Hash while copying so the stored file can be found again by content
+        digest = hashlib.sha256()
         with open(file_path, "wb") as buffer:
-            shutil.copyfileobj(file.file, buffer)
+            for chunk in iter(lambda: file.file.read(1024 * 1024), b""):
+                digest.update(chunk)
+                buffer.write(chunk)
         
-        return {
+        upload_info = {
             "file_id": file_id,
             "file_path": str(file_path),
             "original_name": file.filename,
-            "size": file_path.stat().st_size
+            "size": file_path.stat().st_size,
+            "sha256": digest.hexdigest()
         }
+        uploaded_files[(upload_info["sha256"], file_extension.lower())] = upload_info
+        return upload_info
     
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@app.get("/api/jobs/{job_id}", response_model=JobStatus)
-async def get_job_status(job_id: str):
+@app.get("/api/upload/{sha256}")
+async def find_uploaded_document(sha256: str, filename: str = ""):
+    """
+    Look up a previously uploaded document by content hash
+    filename: name of the file being uploaded; only its extension is used
+    """
+    upload_info = uploaded_files.get((sha256.lower(), Path(filename).suffix.lower()))
+    if not upload_info or not Path(upload_info["file_path"]).exists():
+        raise HTTPException(status_code=404, detail="File not found")
+    
+    return upload_info
+
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """
+    Check an If-None-Match header against an ETag using weak comparison
+    if_none_match: comma-separated entity tags (weak or strong), or "*"
+    """
+    if not if_none_match:
+        return False
+    tags = {tag.strip() for tag in if_none_match.split(",")}
+    if "*" in tags:
+        return True
+    opaque = etag.removeprefix("W/")
+    return any(tag.removeprefix("W/") == opaque for tag in tags)
+
+
+@app.get("/api/jobs/{job_id}", response_model=None)
+async def get_job_status(
+    job_id: str,
+    request: Request,
+    history_limit: int = Query(10, ge=0),
+    fields: Optional[str] = None
+):
     """
     Get status of analysis job
+    history_limit: number of most recent progress_history entries to return
+    fields: comma-separated JobStatus fields to return (job_id and status are always included)
+    Returns a JobStatus object, or only the requested subset of its keys when fields is given.
+    Supports conditional requests: an unchanged status answers If-None-Match with 304.
+    The ETag is weak, since GZipMiddleware may re-encode the body.
     """
     if job_id not in analysis_jobs:
         raise HTTPException(status_code=404, detail="Job not found")
     
     job = analysis_jobs[job_id]
+    history = job.get("progress_history", [])
     
-    return JobStatus(
+    status = JobStatus(
         job_id=job_id,
         status=job["status"],
         progress=job.get("progress", 0.0),
         current_node=job.get("current_node"),
         current_message=job.get("current_message"),
         llm_output=job.get("llm_output"),
-        progress_history=job.get("progress_history", [])[-10:],  # Last 10 entries
+        progress_history=history[-history_limit:] if history_limit else [],
         result=job.get("result"),
         error=job.get("error")
     )
+    
+    include = None
+    if fields:
+        include = {"job_id", "status"} | {name.strip() for name in fields.split(",")}
+    body = status.model_dump_json(include=include)
+    etag = f'W/"{hashlib.sha1(body.encode()).hexdigest()}"'
+    if _etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers={"ETag": etag})
+    
+    return Response(content=body, media_type="application/json", headers={"ETag": etag})
 
 
 @app.get("/api/jobs/{job_id}/download/{file_type}")
@@ -5,7 +5,7 @@ This module provides the base class and common functionality for all critic agen
 in the contract analysis workflow.
 """
 
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Tuple
 from dataclasses import dataclass, field
 from enum import Enum
 import os
@@ -31,6 +31,44 @@ class ValidationResult:
     should_retry: bool = False
     retry_params: Dict[str, Any] = field(default_factory=dict)
 
+# Critic tuning read from the environment once, keyed by critic name.
+# Call reload_critic_configs() after changing the environment.
+_CRITIC_CONFIGS: Dict[str, Dict[str, Any]] = {}
+
+
+def _parse_env_setting(env_var: str, default: str, kind: type) -> Any:
+    """Read one environment setting, converting it to the given type."""
+    raw = os.getenv(env_var, default)
+    if kind is bool:
+        return raw.lower() == "true"
+    return kind(raw)
+
+
+def get_critic_config(name: str, settings: Dict[str, Tuple[str, str, type]]) -> Dict[str, Any]:
+    """
+    Return cached settings for a critic, reading them on first use.
+    
+    Args:
+        name: Name of the critic (e.g., "citation")
+        settings: Setting name -> (environment variable, default, type)
+        
+    Returns:
+        Dict of setting name to parsed value
+    """
+    config = _CRITIC_CONFIGS.get(name)
+    if config is None:
+        config = {
+            key: _parse_env_setting(env_var, default, kind)
+            for key, (env_var, default, kind) in settings.items()
+        }
+        _CRITIC_CONFIGS[name] = config
+    return config
+
+
+def reload_critic_configs() -> None:
+    """Drop every cached critic config so the next use re-reads the environment."""
+    _CRITIC_CONFIGS.clear()
+
 class BaseCritic:
     """Base class for all critic agents"""
     
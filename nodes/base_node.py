@@ -9,51 +9,21 @@ status updates, and UI communication capabilities.
 import time
 import traceback
 from abc import ABC, abstractmethod
+from collections import deque
 from typing import Dict, Any, Optional, Callable, List
 from datetime import datetime
-from enum import Enum
 import threading
 
-
-class NodeStatus(Enum):
-    """Node execution statuses"""
-    PENDING = "pending"
-    RUNNING = "running"
-    COMPLETED = "completed"
-    FAILED = "failed"
-    SKIPPED = "skipped"
-    RETRYING = "retrying"
-
-
-class ProgressUpdate:
-    """Structured progress update from a node"""
-    def __init__(self,
-                 node_name: str,
-                 status: NodeStatus,
-                 message: str,
-                 progress: Optional[float] = None,
-                 details: Optional[Dict[str, Any]] = None):
-        self.node_name = node_name
-        self.status = status
-        self.message = message
-        self.progress = progress  # 0.0 to 1.0
-        self.details = details or {}
-        self.timestamp = datetime.now()
-    
-    def to_dict(self) -> Dict[str, Any]:
-        return {
-            'node_name': self.node_name,
-            'status': self.status.value,
-            'message': self.message,
-            'progress': self.progress,
-            'details': self.details,
-            'timestamp': self.timestamp.isoformat()
-        }
+# Re-exported: nodes and the API import the progress types from here
+from utils.progress import NodeStatus, ProgressUpdate
 
 
 class ProgressReporter:
     """Thread-safe progress reporter for UI communication"""
     
+    # Most recent updates kept for get_history(); older ones are dropped
+    HISTORY_LIMIT = 1000
+    
     _instance = None
     _lock = threading.Lock()
     
@@ -67,7 +37,7 @@ class ProgressReporter:
     def __init__(self):
         if not self._initialized:
             self.callbacks: List[Callable] = []
-            self.history: List[ProgressUpdate] = []
+            self.history: deque = deque(maxlen=self.HISTORY_LIMIT)
             self._initialized = True
     
     def register_callback(self, callback: Callable[[ProgressUpdate], None]):
@@ -88,8 +58,8 @@ class ProgressReporter:
         self.callbacks.clear()
     
     def get_history(self) -> List[ProgressUpdate]:
-        """Get all progress updates"""
-        return self.history.copy()
+        """Get the most recent progress updates (up to HISTORY_LIMIT)"""
+        return list(self.history)
 
 
 class BaseNode(ABC):
@@ -3,14 +3,27 @@ Citation Critic Agent for Contract Analysis Workflow
 Validates citations and triggers conditional reruns if quality issues are found
 """
 
-import os
 from typing import Dict, Any
 from workflows.state import ContractAnalysisState
 from utils.error_handler import handle_node_errors
+from nodes.base_critic import get_critic_config
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Environment tuning: setting -> (variable, default, type)
+_SETTINGS = {
+    'min_confidence': ('CITATION_MIN_CONFIDENCE', '0.6', float),
+    'require_anchors': ('CITATION_REQUIRE_ANCHORS', 'true', bool),
+    'max_unknown': ('CITATION_MAX_UNKNOWN', '3', int),
+    'max_reruns': ('CITATION_MAX_RERUNS', '3', int),
+}
+
+
+def _get_config() -> Dict[str, Any]:
+    """Return cached citation critic settings, reading them on first use."""
+    return get_critic_config('citation', _SETTINGS)
+
 
 class CitationCritic:
     """
@@ -26,7 +39,8 @@ class CitationCritic:
     def __init__(self, 
                  min_confidence: float = 0.6,
                  require_page_anchors: bool = True,
-                 max_unknown_locations: int = 3):
+                 max_unknown_locations: int = 3,
+                 citation_tracker=None):
         """
         Initialize the citation critic.
         
@@ -34,12 +48,15 @@ class CitationCritic:
             min_confidence: Minimum acceptable confidence score
             require_page_anchors: Whether page anchors are required
             max_unknown_locations: Maximum allowed "Unknown location" citations
+            citation_tracker: Tracker to validate against; defaults to the shared one
         """
         self.min_confidence = min_confidence
         self.require_page_anchors = require_page_anchors
         self.max_unknown_locations = max_unknown_locations
         self.validation_results = {}
         self.issues_found = []
+        self._injected_tracker = citation_tracker
+        self.citation_tracker = None
         
     def validate_citations(self, state: ContractAnalysisState) -> Dict[str, Any]:
         """
@@ -61,6 +78,11 @@ class CitationCritic:
         }
         self.issues_found = []
         
+        # Use the tracker given at construction, else the shared one
+        self.citation_tracker = self._injected_tracker
+        if self.citation_tracker is None:
+            self.citation_tracker = self._get_global_tracker()
+        
         # Check questionnaire citations
         self._validate_questionnaire_citations(state)
         
@@ -132,11 +154,16 @@ class CitationCritic:
                     self._validate_single_citation(citation_id, f"question_{question_id}")
                     
         # Store citation tracker data if available
+        if self.citation_tracker is not None:
+            self.validation_results['total_citations'] = len(self.citation_tracker.citations)
+    
+    def _get_global_tracker(self):
+        """Return the shared citation tracker, if it can be imported."""
         try:
             from utils.citation_tracker import citation_tracker
-            self.validation_results['total_citations'] = len(citation_tracker.citations)
+            return citation_tracker
         except ImportError:
-            pass
+            return None
     
     def _validate_rule_citations(self, state: ContractAnalysisState):
         """Validate citations in rule compliance results."""
@@ -162,46 +189,45 @@ class CitationCritic:
     
     def _validate_single_citation(self, citation_id: str, location: str):
         """Validate a single citation by ID."""
-        try:
-            from utils.citation_tracker import citation_tracker
-            
-            if citation_id not in citation_tracker.citations:
-                self.issues_found.append({
-                    "type": "invalid_citation",
-                    "location": location,
-                    "severity": "high",
-                    "message": f"Citation ID '{citation_id}' not found in tracker"
-                })
-                return
-            
-            citation = citation_tracker.citations[citation_id]
-            
-            # Check for unknown location
-            if "unknown location" in citation.location.lower():
-                self.validation_results['unknown_locations'] += 1
-                self.issues_found.append({
-                    "type": "unknown_location",
-                    "location": location,
-                    "severity": "medium",
-                    "message": f"Citation has unknown location: {citation_id}"
-                })
-            
-            # Check for page anchor
-            if self.require_page_anchors and not citation.page_number:
-                self.validation_results['missing_page_anchors'] += 1
-                self.issues_found.append({
-                    "type": "missing_page_anchor",
-                    "location": location,
-                    "severity": "medium",
-                    "message": f"Citation missing page anchor: {citation_id}"
-                })
-                
-            # Check confidence
-            if citation.confidence < self.min_confidence:
-                self.validation_results['low_confidence'] += 1
-                
-        except ImportError:
+        citation_tracker = self.citation_tracker
+        if citation_tracker is None:
             logger.warning("Could not import citation_tracker for validation")
+            return
+        
+        if citation_id not in citation_tracker.citations:
+            self.issues_found.append({
+                "type": "invalid_citation",
+                "location": location,
+                "severity": "high",
+                "message": f"Citation ID '{citation_id}' not found in tracker"
+            })
+            return
+        
+        citation = citation_tracker.citations[citation_id]
+        
+        # Check for unknown location
+        if "unknown location" in citation.location.lower():
+            self.validation_results['unknown_locations'] += 1
+            self.issues_found.append({
+                "type": "unknown_location",
+                "location": location,
+                "severity": "medium",
+                "message": f"Citation has unknown location: {citation_id}"
+            })
+        
+        # Check for page anchor
+        if self.require_page_anchors and not citation.page_number:
+            self.validation_results['missing_page_anchors'] += 1
+            self.issues_found.append({
+                "type": "missing_page_anchor",
+                "location": location,
+                "severity": "medium",
+                "message": f"Citation missing page anchor: {citation_id}"
+            })
+            
+        # Check confidence
+        if citation.confidence < self.min_confidence:
+            self.validation_results['low_confidence'] += 1
     
     def _validate_citation_dict(self, citation: Dict[str, Any], location: str):
         """Validate a citation dictionary directly."""
@@ -336,10 +362,11 @@ def citation_critic_node(state: ContractAnalysisState) -> Dict[str, Any]:
     """
     print("\n--- CITATION CRITIC ANALYSIS ---")
     
-    # Get configuration from environment
-    min_confidence = float(os.getenv('CITATION_MIN_CONFIDENCE', '0.6'))
-    require_anchors = os.getenv('CITATION_REQUIRE_ANCHORS', 'true').lower() == 'true'
-    max_unknown = int(os.getenv('CITATION_MAX_UNKNOWN', '3'))
+    # Get configuration
+    config = _get_config()
+    min_confidence = config['min_confidence']
+    require_anchors = config['require_anchors']
+    max_unknown = config['max_unknown']
     
     # Track attempts
     attempts = state.get('citation_critic_attempts', 0) + 1
@@ -376,7 +403,7 @@ def citation_critic_node(state: ContractAnalysisState) -> Dict[str, Any]:
             print(f"    [{rec['priority']}] {rec['message']}")
     
     # Determine if rerun is needed
-    max_reruns = int(os.getenv('CITATION_MAX_RERUNS', '3'))
+    max_reruns = config['max_reruns']
     needs_rerun = (
         not validation_results['validation_passed'] and 
         attempts < max_reruns and (
@@ -3,14 +3,26 @@ Classification Coverage Critic Agent
 Validates sentence classification quality and triggers retries with adjusted parameters
 """
 
-import os
 from typing import Dict, Any, List, Optional
 from workflows.state import ContractAnalysisState
 from utils.error_handler import handle_node_errors
+from nodes.base_critic import get_critic_config
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Environment tuning: setting -> (variable, default, type)
+_SETTINGS = {
+    'min_coverage': ('CLASSIFICATION_MIN_COVERAGE', '0.3', float),
+    'min_confidence': ('CLASSIFICATION_MIN_CONFIDENCE', '0.5', float),
+    'max_reruns': ('CLASSIFICATION_MAX_RERUNS', '2', int),
+}
+
+
+def _get_config() -> Dict[str, Any]:
+    """Return cached classification critic settings, reading them on first use."""
+    return get_critic_config('classification', _SETTINGS)
+
 
 class ClassificationCoverageCritic:
     """
@@ -88,17 +100,21 @@ class ClassificationCoverageCritic:
             self.validation_results['issues'] = self.issues_found
             return self.validation_results
         
+        # Pull the per-sentence fields into columns once for all checks
+        classes_column = [sentence_data.get('classes', []) for sentence_data in classified]
+        confidence_column = [sentence_data.get('confidence', 0) for sentence_data in classified]
+        
         # Analyze classification coverage
-        self._analyze_coverage(classified)
+        self._analyze_coverage(classes_column)
         
         # Check critical terms
-        self._check_critical_terms(classified)
+        self._check_critical_terms(classes_column)
         
         # Analyze confidence distribution
-        self._analyze_confidence(classified)
+        self._analyze_confidence(confidence_column)
         
         # Detect document type
-        self._detect_document_type(classified, state)
+        self._detect_document_type(classes_column, state)
         
         # Determine severity
         self._determine_severity()
@@ -108,17 +124,15 @@ class ClassificationCoverageCritic:
         
         return self.validation_results
     
-    def _analyze_coverage(self, classified: List[Dict[str, Any]]):
+    def _analyze_coverage(self, classes_column: List[List[str]]):
         """Analyze classification coverage statistics."""
-        total = len(classified)
+        total = len(classes_column)
         self.validation_results['total_sentences'] = total
         
         classified_count = 0
         no_class_count = 0
         
-        for sentence_data in classified:
-            classes = sentence_data.get('classes', [])
-            
+        for classes in classes_column:
             if not classes or 'no-class' in classes or 'none' in classes:
                 no_class_count += 1
             else:
@@ -138,12 +152,11 @@ class ClassificationCoverageCritic:
                 "message": f"Only {coverage:.1%} of sentences classified (minimum: {self.min_coverage:.1%})"
             })
     
-    def _check_critical_terms(self, classified: List[Dict[str, Any]]):
+    def _check_critical_terms(self, classes_column: List[List[str]]):
         """Check if critical terms are covered."""
         found_terms = set()
         
-        for sentence_data in classified:
-            classes = sentence_data.get('classes', [])
+        for classes in classes_column:
             for term in classes:
                 if term and term != 'no-class' and term != 'none':
                     # Normalize term name
@@ -172,17 +185,12 @@ class ClassificationCoverageCritic:
                 "message": f"Missing {len(critical_missing)} critical terms: {', '.join(critical_missing[:3])}..."
             })
     
-    def _analyze_confidence(self, classified: List[Dict[str, Any]]):
+    def _analyze_confidence(self, confidences: List[float]):
         """Analyze confidence score distribution."""
-        confidences = []
-        low_conf_count = 0
-        
-        for sentence_data in classified:
-            confidence = sentence_data.get('confidence', 0)
-            confidences.append(confidence)
-            
-            if confidence < self.min_confidence and confidence > 0:
-                low_conf_count += 1
+        low_conf_count = sum(
+            1 for confidence in confidences
+            if confidence < self.min_confidence and confidence > 0
+        )
         
         # Calculate average confidence
         avg_confidence = sum(confidences) / len(confidences) if confidences else 0
@@ -198,14 +206,14 @@ class ClassificationCoverageCritic:
             })
         
         # Check if too many low confidence
-        if low_conf_count > len(classified) * 0.3:
+        if low_conf_count > len(confidences) * 0.3:
             self.issues_found.append({
                 "type": "many_low_confidence",
                 "severity": "medium",
                 "message": f"{low_conf_count} sentences have low confidence (30% threshold)"
             })
     
-    def _detect_document_type(self, classified: List[Dict[str, Any]], state: ContractAnalysisState):
+    def _detect_document_type(self, classes_column: List[List[str]], state: ContractAnalysisState):
         """Detect special document types that need different handling."""
         document_text = state.get('document_text', '').lower()
         
@@ -219,8 +227,7 @@ class ClassificationCoverageCritic:
             amendment_terms = ['modification', 'amendment', 'addendum', 'supplement']
             found_amendment = False
             
-            for sentence_data in classified:
-                classes = sentence_data.get('classes', [])
+            for classes in classes_column:
                 if any(term in str(classes).lower() for term in amendment_terms):
                     found_amendment = True
                     break
@@ -233,12 +240,12 @@ class ClassificationCoverageCritic:
                 })
         
         # Check for short document
-        if len(classified) < 20:
+        if len(classes_column) < 20:
             indicators.append('short_document')
             self.issues_found.append({
                 "type": "short_document",
                 "severity": "low",
-                "message": f"Document is very short ({len(classified)} sentences)"
+                "message": f"Document is very short ({len(classes_column)} sentences)"
             })
         
         self.validation_results['document_type_indicators'] = indicators
@@ -346,9 +353,10 @@ def classification_coverage_critic_node(state: ContractAnalysisState) -> Dict[st
     print("\n--- CLASSIFICATION COVERAGE CRITIC ---")
     
     # Get configuration
-    min_coverage = float(os.getenv('CLASSIFICATION_MIN_COVERAGE', '0.3'))
-    min_confidence = float(os.getenv('CLASSIFICATION_MIN_CONFIDENCE', '0.5'))
-    max_reruns = int(os.getenv('CLASSIFICATION_MAX_RERUNS', '2'))
+    config = _get_config()
+    min_coverage = config['min_coverage']
+    min_confidence = config['min_confidence']
+    max_reruns = config['max_reruns']
     
     # Track attempts
     attempts = state.get('classification_critic_attempts', 0) + 1
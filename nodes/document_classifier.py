@@ -28,18 +28,22 @@ from utils.classification_output_writer import save_classification_results
 
 # ===== EFFICIENT CLASSIFICATION FUNCTIONS (merged from document_classifier_efficient.py) =====
 
+# Legal keywords that indicate contract-relevant content
+LEGAL_KEYWORDS = [
+    'shall', 'agree', 'contract', 'agreement', 'party', 'parties',
+    'terminate', 'termination', 'liable', 'liability', 'rights', 'obligations',
+    'payment', 'fee', 'confidential', 'intellectual', 'property',
+    'indemnify', 'damages', 'breach', 'notice', 'governing', 'law',
+    'amendment', 'modify', 'assign', 'transfer', 'expire', 'renew'
+]
+
+# Single alternation so each sentence is scanned once rather than once per keyword
+_LEGAL_KEYWORD_PATTERN = re.compile('|'.join(re.escape(k) for k in LEGAL_KEYWORDS))
+
+
 def smart_filter_sentences(sentences: List[str], min_length: int = 40) -> List[str]:
     """Filter sentences to only those likely to contain contract terms."""
     
-    # Legal keywords that indicate contract-relevant content
-    legal_keywords = [
-        'shall', 'agree', 'contract', 'agreement', 'party', 'parties',
-        'terminate', 'termination', 'liable', 'liability', 'rights', 'obligations',
-        'payment', 'fee', 'confidential', 'intellectual', 'property',
-        'indemnify', 'damages', 'breach', 'notice', 'governing', 'law',
-        'amendment', 'modify', 'assign', 'transfer', 'expire', 'renew'
-    ]
-    
     filtered_sentences = []
     
     for sentence in sentences:
@@ -55,7 +59,7 @@ def smart_filter_sentences(sentences: List[str], min_length: int = 40) -> List[s
             
         # Include if contains legal keywords
         sentence_lower = sentence_clean.lower()
-        if any(keyword in sentence_lower for keyword in legal_keywords):
+        if _LEGAL_KEYWORD_PATTERN.search(sentence_lower):
             filtered_sentences.append(sentence_clean)
             continue
             
@@ -649,65 +653,70 @@ def load_document_data(state: Dict[str, Any], document_type: str) -> tuple:
         return sentences, output_key_prefix
         
     elif document_type == "reference":
-        # Reference document needs to be loaded from file
-        reference_doc_path = state.get('reference_document_path', '')
-        if not reference_doc_path:
-            print("  No reference document path provided")
-            return [], "reference_"
-        
-        # Check if it's a PDF file that needs conversion
-        if reference_doc_path.lower().endswith('.pdf'):
-            print("  Reference document is PDF - converting to text first")
-            try:
-                # Import here to avoid circular imports
-                from nodes.pdf_to_markdown import convert_pdf_to_markdown
-                
-                # Convert PDF using existing converter
-                temp_state = {
-                    "target_document_path": reference_doc_path,
-                    "processed_document_path": ""
-                }
-                
-                conversion_result = convert_pdf_to_markdown(temp_state)
-                
-                if not conversion_result.get("processed_document_path"):
-                    raise Exception("PDF conversion failed - no processed document path returned")
-                
-                processed_path = conversion_result["processed_document_path"]
-                
-                # Read converted content
-                with open(processed_path, 'r', encoding='utf-8') as f:
-                    reference_document_text = f.read()
-                
-                # Store in state for future use
-                state['reference_document_text'] = reference_document_text
-                
-                print("  Successfully converted PDF reference document")
-                print(f"    - Text length: {len(reference_document_text)} characters")
-                
-            except Exception as e:
-                print(f"  ERROR converting reference PDF: {e}")
-                return [], "reference_"
+        # Prefer reference text already held in state; only read the file otherwise
+        reference_document_text = state.get('reference_document_text') or ''
+        if reference_document_text:
+            print("  Using in-memory reference document text")
         else:
-            # Handle non-PDF files (original logic)
-            try:
-                # Try UTF-8 first
-                with open(reference_doc_path, 'r', encoding='utf-8') as f:
-                    reference_document_text = f.read()
-            except UnicodeDecodeError:
+            # Reference document needs to be loaded from file
+            reference_doc_path = state.get('reference_document_path', '')
+            if not reference_doc_path:
+                print("  No reference document path provided")
+                return [], "reference_"
+            
+            # Check if it's a PDF file that needs conversion
+            if reference_doc_path.lower().endswith('.pdf'):
+                print("  Reference document is PDF - converting to text first")
                 try:
-                    # Try with different encoding
-                    with open(reference_doc_path, 'r', encoding='latin-1') as f:
+                    # Import here to avoid circular imports
+                    from nodes.pdf_to_markdown import convert_pdf_to_markdown
+                    
+                    # Convert PDF using existing converter
+                    temp_state = {
+                        "target_document_path": reference_doc_path,
+                        "processed_document_path": ""
+                    }
+                    
+                    conversion_result = convert_pdf_to_markdown(temp_state)
+                    
+                    if not conversion_result.get("processed_document_path"):
+                        raise Exception("PDF conversion failed - no processed document path returned")
+                    
+                    processed_path = conversion_result["processed_document_path"]
+                    
+                    # Read converted content
+                    with open(processed_path, 'r', encoding='utf-8') as f:
                         reference_document_text = f.read()
+                    
+                    # Store in state for future use
+                    state['reference_document_text'] = reference_document_text
+                    
+                    print("  Successfully converted PDF reference document")
+                    print(f"    - Text length: {len(reference_document_text)} characters")
+                    
+                except Exception as e:
+                    print(f"  ERROR converting reference PDF: {e}")
+                    return [], "reference_"
+            else:
+                # Handle non-PDF files (original logic)
+                try:
+                    # Try UTF-8 first
+                    with open(reference_doc_path, 'r', encoding='utf-8') as f:
+                        reference_document_text = f.read()
+                except UnicodeDecodeError:
+                    try:
+                        # Try with different encoding
+                        with open(reference_doc_path, 'r', encoding='latin-1') as f:
+                            reference_document_text = f.read()
+                    except Exception as e:
+                        print(f"  ERROR reading reference file {reference_doc_path}: {e}")
+                        return [], "reference_"
                 except Exception as e:
                     print(f"  ERROR reading reference file {reference_doc_path}: {e}")
                     return [], "reference_"
-            except Exception as e:
-                print(f"  ERROR reading reference file {reference_doc_path}: {e}")
-                return [], "reference_"
-            
-            # Store in state
-            state['reference_document_text'] = reference_document_text
+                
+                # Store in state
+                state['reference_document_text'] = reference_document_text
         
         # Extract sentences from reference document using improved extraction
         sentences = _extract_sentences_improved(reference_document_text)
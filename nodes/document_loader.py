@@ -3,7 +3,12 @@ import yaml
 import logging
 from workflows.state import ContractAnalysisState
 from utils.document_metadata_extractor import document_metadata_extractor
-from utils.sentence_page_mapper import sentence_page_mapper
+from utils.sentence_page_mapper import SentencePageMapper
+
+# Sentence boundaries tuned for legal document formatting
+SENTENCE_BOUNDARY_RE = re.compile(
+    r'(?<=[.!?])\s+(?=[A-Z])|(?<=\n)(?=[A-Z])|(?<=\)\.)\s+(?=[A-Z])'
+)
 
 def clean_text(text: str) -> str:
     """
@@ -88,10 +93,7 @@ def extract_sentences(document_text: str) -> list[str]:
             
         # Regular text - split on sentence boundaries
         # Enhanced pattern that better handles legal document formatting
-        potential_sentences = re.split(
-            r'(?<=[.!?])\s+(?=[A-Z])|(?<=\n)(?=[A-Z])|(?<=\)\.)\s+(?=[A-Z])',
-            paragraph
-        )
+        potential_sentences = SENTENCE_BOUNDARY_RE.split(paragraph)
         
         for sentence in potential_sentences:
             sentence = sentence.strip()
@@ -186,7 +188,9 @@ def load_and_prep_document(state: ContractAnalysisState) -> dict:
     sentences_with_pages = None
     if '[[page=' in original_document_text:
         print("  Mapping sentences to pages...")
-        sentences_with_pages = sentence_page_mapper.map_sentences_to_pages(
+        # A mapper per document: the mapper keeps per-document state and
+        # documents may be loaded concurrently
+        sentences_with_pages = SentencePageMapper().map_sentences_to_pages(
             sentences, original_document_text
         )
         print(f"    Mapped {len(sentences_with_pages)} sentences to pages")
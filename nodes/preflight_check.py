@@ -7,13 +7,14 @@ to ensure accurate connectivity testing.
 """
 
 import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Any, List, Optional
 from datetime import datetime
 from workflows.state import ContractAnalysisState
 from utils.granite_client import granite_client, GraniteAPIError
 import os
 import yaml
-from utils.error_handler import handle_node_errors
+from utils.error_handler import handle_node_errors, FatalNodeError
 
 
 class ModelEndpointTest:
@@ -40,6 +41,76 @@ class ModelEndpointTest:
         }
 
 
+# Probe timeouts (connect, read) in seconds; probes fail fast instead of
+# going through the client's multi-attempt backoff
+PROBE_TIMEOUT = (5.0, 30.0)
+
+
+def _probe_completion(prompt: str, max_tokens: int) -> str:
+    """
+    Send one chat completion through granite_client, without retries.
+    """
+    return granite_client.call_api(
+        prompt,
+        max_tokens=max_tokens,
+        temperature=0.0,
+        timeout=PROBE_TIMEOUT,
+        max_attempts=1
+    )
+
+
+# Circuit breaker settings for endpoint probes
+CIRCUIT_FAILURE_THRESHOLD = 3
+CIRCUIT_OPEN_SECONDS = 30.0
+CIRCUIT_MAX_BACKOFF = 12
+
+
+class CircuitState:
+    """Consecutive-failure tracking for a single probed endpoint."""
+    
+    def __init__(self):
+        self.consecutive_failures = 0
+        self.opened_at: Optional[float] = None
+        self.backoff_mult = 1
+    
+    def is_open(self) -> bool:
+        if self.opened_at is None:
+            return False
+        return time.monotonic() - self.opened_at < CIRCUIT_OPEN_SECONDS * self.backoff_mult
+    
+    def record_success(self) -> None:
+        self.consecutive_failures = 0
+        self.opened_at = None
+        self.backoff_mult = 1
+    
+    def record_failure(self) -> None:
+        self.consecutive_failures += 1
+        if self.consecutive_failures >= CIRCUIT_FAILURE_THRESHOLD:
+            # Re-opening an already tripped circuit doubles the wait
+            if self.opened_at is not None:
+                self.backoff_mult = min(self.backoff_mult * 2, CIRCUIT_MAX_BACKOFF)
+            self.opened_at = time.monotonic()
+
+
+# Process-local circuit state keyed by probe name and endpoint URL
+_circuit: Dict[str, CircuitState] = {}
+
+
+def _run_probe(name: str, probe) -> ModelEndpointTest:
+    """Run a probe unless its endpoint circuit is open."""
+    key = f"{name}@{granite_client.chat_url}"
+    circuit = _circuit.setdefault(key, CircuitState())
+    if circuit.is_open():
+        return ModelEndpointTest(name=name, status="offline", error="circuit_open")
+    
+    result = probe()
+    if result.status in ("error", "timeout"):
+        circuit.record_failure()
+    else:
+        circuit.record_success()
+    return result
+
+
 def _load_preflight_prompts() -> Dict[str, str]:
     base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
     path = os.path.join(base_dir, "prompts", "preflight.yaml")
@@ -64,12 +135,7 @@ def test_granite_endpoint() -> ModelEndpointTest:
     
     start_time = time.time()
     try:
-        response = granite_client.call_api(
-            prompt=test_prompt,
-            max_tokens=10,
-            temperature=0.0,
-            return_metadata=False
-        )
+        response = _probe_completion(test_prompt, max_tokens=10)
         response_time = time.time() - start_time
         
         response_str = str(response).strip() if response else ""
@@ -114,12 +180,7 @@ def test_json_capability() -> ModelEndpointTest:
     start_time = time.time()
     try:
         # Test with Granite since it's our primary model
-        response = granite_client.call_api(
-            prompt=test_prompt,
-            max_tokens=50,
-            temperature=0.0,
-            return_metadata=False
-        )
+        response = _probe_completion(test_prompt, max_tokens=50)
         response_time = time.time() - start_time
         
         if response:
@@ -171,7 +232,7 @@ def test_json_capability() -> ModelEndpointTest:
         )
 
 
-@handle_node_errors
+@handle_node_errors("preflight_check")
 def preflight_check(state: ContractAnalysisState) -> Dict[str, Any]:
     """
     Perform preflight checks to verify model endpoint connectivity.
@@ -194,29 +255,36 @@ def preflight_check(state: ContractAnalysisState) -> Dict[str, Any]:
     test_results: List[ModelEndpointTest] = []
     total_start = time.time()
     
-    # Test Granite endpoint
+    # Build the probe list up front and run them concurrently so wall-clock
+    # time is the slowest endpoint rather than the sum of all of them
+    probes = []
     if 'granite' in required_models:
         print("Testing Granite endpoint...")
-        granite_test = test_granite_endpoint()
-        test_results.append(granite_test)
-        status_emoji = "✓" if granite_test.status == "success" else "✗"
-        print(f"  {status_emoji} Granite: {granite_test.status} ({granite_test.response_time:.2f}s)")
-        
+        probes.append(("granite", test_granite_endpoint))
         # Also test JSON capability with Granite
-        json_test = test_json_capability()
-        test_results.append(json_test)
-        if json_test.status == "success":
-            print("  ✓ JSON capability: verified")
-        elif json_test.status == "warning":
-            print(f"  ⚠ JSON capability: {json_test.error}")
+        probes.append(("json_capability", test_json_capability))
+    
+    if probes:
+        with ThreadPoolExecutor(max_workers=len(probes)) as executor:
+            test_results = list(executor.map(lambda p: _run_probe(*p), probes))
+    
+    for test in test_results:
+        if test.name == "json_capability":
+            if test.status == "success":
+                print("  ✓ JSON capability: verified")
+            elif test.status == "warning":
+                print(f"  ⚠ JSON capability: {test.error}")
+            else:
+                print(f"  ✗ JSON capability: {test.error}")
         else:
-            print(f"  ✗ JSON capability: {json_test.error}")
+            status_emoji = "✓" if test.status == "success" else "✗"
+            print(f"  {status_emoji} {test.name.capitalize()}: {test.status} ({test.response_time:.2f}s)")
     
     total_time = time.time() - total_start
     
     # Analyze results
     successful_models = [t.name for t in test_results if t.status == "success"]
-    failed_models = [t.name for t in test_results if t.status == "error"]
+    failed_models = [t.name for t in test_results if t.status in ("error", "offline")]
     warning_models = [t.name for t in test_results if t.status == "warning"]
     
     # Determine overall success
@@ -261,8 +329,8 @@ def preflight_check(state: ContractAnalysisState) -> Dict[str, Any]:
         if failed_models:
             print("Failed models:")
             for test in test_results:
-                if test.status == "error":
+                if test.status in ("error", "offline"):
                     print(f"  - {test.name}: {test.error}")
-        raise RuntimeError("Preflight checks failed. Please check model configurations and try again.")
+        raise FatalNodeError("Preflight checks failed. Please check model configurations and try again.")
     
     return state
\ No newline at end of file
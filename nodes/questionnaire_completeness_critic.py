@@ -3,14 +3,26 @@ Questionnaire Completeness Critic Agent
 Validates questionnaire answer quality and triggers targeted retries
 """
 
-import os
 from typing import Dict, Any, List, Optional
 from workflows.state import ContractAnalysisState
 from utils.error_handler import handle_node_errors
+from nodes.base_critic import get_critic_config
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Environment tuning: setting -> (variable, default, type)
+_SETTINGS = {
+    'max_not_specified': ('QUESTIONNAIRE_MAX_NOT_SPECIFIED', '0.4', float),
+    'min_confidence': ('QUESTIONNAIRE_MIN_CONFIDENCE', '0.6', float),
+    'max_reruns': ('QUESTIONNAIRE_MAX_RERUNS', '2', int),
+}
+
+
+def _get_config() -> Dict[str, Any]:
+    """Return cached questionnaire critic settings, reading them on first use."""
+    return get_critic_config('questionnaire', _SETTINGS)
+
 
 class QuestionnaireCompletenessCritic:
     """
@@ -442,9 +454,10 @@ def questionnaire_completeness_critic_node(state: ContractAnalysisState) -> Dict
     print("\n--- QUESTIONNAIRE COMPLETENESS CRITIC ---")
     
     # Get configuration
-    max_not_specified = float(os.getenv('QUESTIONNAIRE_MAX_NOT_SPECIFIED', '0.4'))
-    min_confidence = float(os.getenv('QUESTIONNAIRE_MIN_CONFIDENCE', '0.6'))
-    max_reruns = int(os.getenv('QUESTIONNAIRE_MAX_RERUNS', '2'))
+    config = _get_config()
+    max_not_specified = config['max_not_specified']
+    min_confidence = config['min_confidence']
+    max_reruns = config['max_reruns']
     
     # Track attempts
     attempts = state.get('questionnaire_critic_attempts', 0) + 1
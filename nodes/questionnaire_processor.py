@@ -2,6 +2,7 @@ import yaml
 import json
 import tiktoken
 import os
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Any, Tuple, cast
 from workflows.state import ContractAnalysisState, ClassifiedSentence
 from utils.granite_client import granite_client, GraniteAPIError
@@ -27,13 +28,40 @@ def count_tokens(text: str, model: str = "gpt-4") -> int:
         encoding = tiktoken.get_encoding("cl100k_base")
         return len(encoding.encode(text))
 
+def index_sentences_by_class(classified: List[ClassifiedSentence]) -> Dict[str, List[int]]:
+    """
+    Build a class label -> sentence positions index, once per document.
+    Lets per-question lookups touch only matching sentences instead of rescanning the list.
+    """
+    index: Dict[str, List[int]] = {}
+    for pos, sentence_data in enumerate(classified):
+        for label in set(sentence_data.get('classes', []) or []):
+            index.setdefault(label, []).append(pos)
+    return index
+
+
+def select_sentences_by_classes(classified: List[ClassifiedSentence],
+                                terms: Any,
+                                class_index: Dict[str, List[int]] | None = None) -> List[Dict[str, Any]]:
+    """Sentences carrying any of the given class labels, in document order."""
+    if class_index is None:
+        class_index = index_sentences_by_class(classified)
+    positions = set()
+    for term in terms:
+        positions.update(class_index.get(term, ()))
+    return [cast(Dict[str, Any], classified[pos]) for pos in sorted(positions)]
+
+
 def get_relevant_sentences_for_question(question_id: str, 
                                        target_classified: List[ClassifiedSentence], 
                                        reference_classified: List[ClassifiedSentence], 
-                                       terminology_data: List[Dict[str, Any]] | Dict[str, Any]) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+                                       terminology_data: List[Dict[str, Any]] | Dict[str, Any],
+                                       target_index: Dict[str, List[int]] | None = None,
+                                       reference_index: Dict[str, List[int]] | None = None) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
     """
     Get sentences relevant to a specific question based on relevant_terms field.
     Returns (target_sentences, reference_sentences) as full sentence dictionaries.
+    Pass indexes from index_sentences_by_class() to reuse them across questions.
     """
     # Determine relevant terms based on available terminology structure
     relevant_terms: List[str] = []
@@ -70,29 +98,17 @@ def get_relevant_sentences_for_question(question_id: str,
     if not relevant_terms:
         return [], []
     
-    target_sentences: List[Dict[str, Any]] = []
-    reference_sentences: List[Dict[str, Any]] = []
-    
     # Find sentences classified with relevant terms in target document
-    for sentence_data in target_classified:
-        sentence_classes = sentence_data.get('classes', [])
-        for term in relevant_terms:
-            if term in sentence_classes:
-                # Include full sentence data with page info
-                sentence_dict = cast(Dict[str, Any], sentence_data)
-                # Debug: Check if page info is present
-                if not sentence_dict.get('page') and not sentence_dict.get('page_number'):
-                    print(f"    ⚠️ WARNING: Sentence missing page info for term '{term}'")
-                target_sentences.append(sentence_dict)
-                break
+    target_sentences = select_sentences_by_classes(target_classified, relevant_terms, target_index)
+    for sentence_dict in target_sentences:
+        # Debug: Check if page info is present
+        if not sentence_dict.get('page') and not sentence_dict.get('page_number'):
+            sentence_classes = sentence_dict.get('classes', [])
+            term = next(t for t in relevant_terms if t in sentence_classes)
+            print(f"    ⚠️ WARNING: Sentence missing page info for term '{term}'")
     
     # Find sentences classified with relevant terms in reference document
-    for sentence_data in reference_classified:
-        sentence_classes = sentence_data.get('classes', [])
-        for term in relevant_terms:
-            if term in sentence_classes:
-                reference_sentences.append(cast(Dict[str, Any], sentence_data))
-                break
+    reference_sentences = select_sentences_by_classes(reference_classified, relevant_terms, reference_index)
     
     return target_sentences, reference_sentences
 
@@ -201,15 +217,53 @@ def create_question_prompt(question: Dict[str, Any], target_sentences: List[str]
     
     return prompt
 
+def create_answer_citations(
+    question_prompt: str,
+    answer: str,
+    source_sentences: List[Dict[str, Any]],
+    all_target_classified: List[Dict[str, Any]] = None
+) -> List[str]:
+    """Create citations linking an answer to its source sentences; returns the citation IDs."""
+    citations = citation_tracker.create_citation_from_match(
+        question_prompt, answer, source_sentences
+    )
+    
+    # Enhance citations with better page info if available
+    if citations and all_target_classified:
+        citations = fallback_citation_creator.enhance_citations_with_context(
+            citations, all_target_classified, window_size=2
+        )
+    
+    # Debug: Check citation creation
+    if not citations and source_sentences:
+        print(f"    ⚠️ No citations created despite {len(source_sentences)} source sentences")
+    elif citations:
+        pages_found = 0
+        for c in citations:
+            if c.page_number:
+                pages_found += 1
+        if pages_found > 0:
+            print(f"    ✓ Created {len(citations)} citations, {pages_found} with page anchors")
+        else:
+            print(f"    ⚠️ Created {len(citations)} citations but none have page anchors")
+    
+    return [c.citation_id for c in citations]
+
 def answer_single_question(
     question: Dict[str, Any],
     target_sentences: List[Dict[str, Any]],
     reference_sentences: List[Dict[str, Any]],
     terminology_data: List[Dict[str, Any]],
     use_dual_model: bool = True,
-    all_target_classified: List[Dict[str, Any]] = None
+    all_target_classified: List[Dict[str, Any]] = None,
+    create_citations: bool = True
 ) -> Dict[str, Any]:
-    """Process a single question using relevant sentences."""
+    """
+    Process a single question using relevant sentences.
+    
+    With create_citations=False the citations are left empty so the caller can
+    create them later with create_answer_citations (in a deterministic order).
+    """
     question_id = question.get('id', '')
     
     # Load template
@@ -347,31 +401,12 @@ def answer_single_question(
                     "section_name": None
                 })
         
-        citations = citation_tracker.create_citation_from_match(
-            question_prompt, answer, source_sentences_for_citation
-        )
-        
-        # Enhance citations with better page info if available
-        if citations and all_target_classified:
-            citations = fallback_citation_creator.enhance_citations_with_context(
-                citations, all_target_classified, window_size=2
+        citation_ids = []
+        if create_citations:
+            citation_ids = create_answer_citations(
+                question_prompt, answer, source_sentences_for_citation, all_target_classified
             )
         
-        citation_ids = [c.citation_id for c in citations]
-        
-        # Debug: Check citation creation
-        if not citations and source_sentences_for_citation:
-            print(f"    ⚠️ No citations created despite {len(source_sentences_for_citation)} source sentences")
-        elif citations:
-            pages_found = 0
-            for c in citations:
-                if c.page_number:
-                    pages_found += 1
-            if pages_found > 0:
-                print(f"    ✓ Created {len(citations)} citations, {pages_found} with page anchors")
-            else:
-                print(f"    ⚠️ Created {len(citations)} citations but none have page anchors")
-        
         # Assess risk level for relevant questions
         risk_assessment = None
         risk_relevant_questions = [
@@ -404,7 +439,7 @@ def answer_single_question(
                 "type": "llm",
                 "prompt_tokens": prompt_tokens,
                 "response_metadata": response_metadata,
-                "citation_count": len(citations),
+                "citation_count": len(citation_ids),
                 "risk_assessed": risk_assessment is not None
             }
         }
@@ -421,7 +456,9 @@ def answer_single_question(
 
 def process_questionnaire(state: ContractAnalysisState) -> dict:
     """
-    Process the questionnaire by answering each question one at a time using classified sentences.
+    Process the questionnaire using classified sentences.
+    Questions are answered concurrently (QUESTIONNAIRE_PARALLEL workers, default 2);
+    citations are created afterwards in questionnaire order.
     """
     print("--- PROCESSING QUESTIONNAIRE ---")
     
@@ -445,6 +482,12 @@ def process_questionnaire(state: ContractAnalysisState) -> dict:
     questionnaire_responses = {}
     total_questions = 0
     
+    # Index both documents by class once instead of rescanning them per question
+    target_index = index_sentences_by_class(target_classified)
+    reference_index = index_sentences_by_class(reference_classified)
+    
+    # First pass: select sentences for every question (cheap, sequential)
+    prepared = []
     for section_key, section_data in questionnaire_data['contract_evaluation'].items():
         print(f"\nProcessing section: {section_data['title']}")
         questionnaire_responses[section_key] = {
@@ -460,7 +503,8 @@ def process_questionnaire(state: ContractAnalysisState) -> dict:
             
             # Get relevant sentences for this question from both documents
             target_sentences, reference_sentences = get_relevant_sentences_for_question(
-                question_id, target_classified, reference_classified, terminology_data
+                question_id, target_classified, reference_classified, terminology_data,
+                target_index=target_index, reference_index=reference_index
             )
             
             print(f"    Target sentences: {len(target_sentences)}, Reference sentences: {len(reference_sentences)}")
@@ -482,62 +526,86 @@ def process_questionnaire(state: ContractAnalysisState) -> dict:
                     # Use first chunk for now (could iterate through all)
                     target_sentences = target_chunks[0]
             
-            # Answer the question with enhanced response
-            answer_result = answer_single_question(
-                question, target_sentences, reference_sentences, terminology_data,
-                use_dual_model=True, all_target_classified=target_classified
+            prepared.append((section_key, question, target_sentences, reference_sentences))
+    
+    # Second pass: answer questions concurrently; each one is an independent LLM call
+    max_workers = max(1, int(os.getenv('QUESTIONNAIRE_PARALLEL', '2')))
+    print(f"\nAnswering {len(prepared)} questions ({max_workers} in parallel)...")
+    
+    def _answer(item):
+        _, question, target_sentences, reference_sentences = item
+        return answer_single_question(
+            question, target_sentences, reference_sentences, terminology_data,
+            use_dual_model=True, all_target_classified=target_classified,
+            create_citations=False
+        )
+    
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        answer_results = list(executor.map(_answer, prepared))
+    
+    # Third pass: assemble responses in questionnaire order
+    for (section_key, question, target_sentences, reference_sentences), answer_result in zip(prepared, answer_results):
+        question_id = question['id']
+        
+        # Citation IDs are allocated here, in questionnaire order, not in completion order
+        if isinstance(answer_result, dict) and (answer_result.get("processing_metadata") or {}).get("type") == "llm":
+            citation_ids = create_answer_citations(
+                question.get('prompt', ''), answer_result["answer"],
+                answer_result.get("source_sentences", []), target_classified
             )
-            
-            # Extract answer text for display
-            if isinstance(answer_result, dict):
-                answer_text = answer_result.get("answer", "Error: No answer")
-                confidence = answer_result.get("confidence", 0)
-                citations = answer_result.get("citations", [])
-                extraction_confidence = answer_result.get("extraction_confidence", {})
-                risk_assessment = answer_result.get("risk_assessment")
-                processing_metadata = answer_result.get("processing_metadata", {})
-            else:
-                # Backward compatibility
-                answer_text = answer_result
-                confidence = 0.5
-                citations = []
-                extraction_confidence = {}
-                risk_assessment = None
-                processing_metadata = {}
-            
-            # Store the enhanced response
-            question_response = {
-                'id': question_id,
-                'prompt': question['prompt'],
-                'guideline': question['guideline'],
-                'answer': answer_text,
-                'confidence': confidence,
-                'extraction_confidence': extraction_confidence,
-                'citations': citations,
-                'risk_assessment': risk_assessment,
-                'target_sentences_count': len(target_sentences),
-                'reference_sentences_count': len(reference_sentences),
-                'processing_metadata': processing_metadata
-            }
-            # Add answer source indicator
-            ptype = (processing_metadata or {}).get('type')
-            question_response['answer_source'] = 'Deterministic' if ptype == 'deterministic' else 'LLM'
-            
-            # Add risk display for console output
-            risk_display = ""
-            if risk_assessment:
-                risk_level = risk_assessment.get("risk_level", "Unknown")
-                risk_score = risk_assessment.get("risk_score", 0)
-                red_flag_count = risk_assessment.get("red_flag_count", 0)
-                risk_display = f" [Risk: {risk_level} ({risk_score:.0f})"
-                if red_flag_count > 0:
-                    risk_display += f", {red_flag_count} red flags"
-                risk_display += "]"
-            
-            questionnaire_responses[section_key]['questions'].append(question_response)
-            confidence_display = f" (conf: {confidence:.1f})" if confidence > 0 else ""
-            full_display = confidence_display + risk_display
-            print(f"    Answer: {answer_text[:100]}...{full_display}" if len(answer_text) > 100 else f"    Answer: {answer_text}{full_display}")
+            answer_result["citations"] = citation_ids
+            answer_result["processing_metadata"]["citation_count"] = len(citation_ids)
+        
+        # Extract answer text for display
+        if isinstance(answer_result, dict):
+            answer_text = answer_result.get("answer", "Error: No answer")
+            confidence = answer_result.get("confidence", 0)
+            citations = answer_result.get("citations", [])
+            extraction_confidence = answer_result.get("extraction_confidence", {})
+            risk_assessment = answer_result.get("risk_assessment")
+            processing_metadata = answer_result.get("processing_metadata", {})
+        else:
+            # Backward compatibility
+            answer_text = answer_result
+            confidence = 0.5
+            citations = []
+            extraction_confidence = {}
+            risk_assessment = None
+            processing_metadata = {}
+        
+        # Store the enhanced response
+        question_response = {
+            'id': question_id,
+            'prompt': question['prompt'],
+            'guideline': question['guideline'],
+            'answer': answer_text,
+            'confidence': confidence,
+            'extraction_confidence': extraction_confidence,
+            'citations': citations,
+            'risk_assessment': risk_assessment,
+            'target_sentences_count': len(target_sentences),
+            'reference_sentences_count': len(reference_sentences),
+            'processing_metadata': processing_metadata
+        }
+        # Add answer source indicator
+        ptype = (processing_metadata or {}).get('type')
+        question_response['answer_source'] = 'Deterministic' if ptype == 'deterministic' else 'LLM'
+        
+        # Add risk display for console output
+        risk_display = ""
+        if risk_assessment:
+            risk_level = risk_assessment.get("risk_level", "Unknown")
+            risk_score = risk_assessment.get("risk_score", 0)
+            red_flag_count = risk_assessment.get("red_flag_count", 0)
+            risk_display = f" [Risk: {risk_level} ({risk_score:.0f})"
+            if red_flag_count > 0:
+                risk_display += f", {red_flag_count} red flags"
+            risk_display += "]"
+        
+        questionnaire_responses[section_key]['questions'].append(question_response)
+        confidence_display = f" (conf: {confidence:.1f})" if confidence > 0 else ""
+        full_display = confidence_display + risk_display
+        print(f"  {question_id}: {answer_text[:100]}...{full_display}" if len(answer_text) > 100 else f"  {question_id}: {answer_text}{full_display}")
     
     print(f"\nCompleted questionnaire processing: {total_questions} questions answered")
     
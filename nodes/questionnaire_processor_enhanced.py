@@ -5,11 +5,12 @@ This module processes questionnaires with comprehensive decision tracking,
 providing clear attribution for how each answer was determined.
 """
 
+import functools
 import yaml
 import json
 import os
 import time
-from typing import Dict, List, Any, Tuple, Optional, cast
+from typing import Dict, List, Any, Tuple, Optional
 from workflows.state import ContractAnalysisState, ClassifiedSentence
 from utils.granite_client import granite_client, GraniteAPIError
 from utils.citation_tracker import citation_tracker
@@ -29,19 +30,34 @@ from nodes.questionnaire_processor import (
     count_tokens,
     split_sentences_by_tokens,
     load_prompt_template,
-    create_question_prompt
+    create_question_prompt,
+    index_sentences_by_class,
+    select_sentences_by_classes
 )
 
 
+@functools.lru_cache(maxsize=64)
+def _expand_term_aliases(terms: Tuple[str, ...]) -> frozenset:
+    """Canonical terms plus all of their known aliases."""
+    aliases = get_term_aliases()
+    expanded = set(terms)
+    for t in terms:
+        expanded |= aliases.get(t, set())
+    return frozenset(expanded)
+
+
 def get_relevant_sentences_with_attribution(
     question_id: str, 
     target_classified: List[ClassifiedSentence], 
     reference_classified: List[ClassifiedSentence], 
-    terminology_data: List[Dict[str, Any]] | Dict[str, Any]
+    terminology_data: List[Dict[str, Any]] | Dict[str, Any],
+    target_index: Optional[Dict[str, List[int]]] = None,
+    reference_index: Optional[Dict[str, List[int]]] = None
 ) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]], List[str]]:
     """
     Enhanced version that also returns the terms that were searched for.
     Returns (target_sentences, reference_sentences, searched_terms)
+    Pass indexes from index_sentences_by_class() to reuse them across questions.
     """
     # Determine relevant terms based on available terminology structure
     relevant_terms: List[str] = []
@@ -76,34 +92,16 @@ def get_relevant_sentences_with_attribution(
             relevant_terms = []
     
     # Alias expansion: include known aliases for the canonical terms
-    aliases = get_term_aliases()
-    expanded_terms = set(relevant_terms)
-    for t in relevant_terms:
-        expanded_terms |= aliases.get(t, set())
+    expanded_terms = _expand_term_aliases(tuple(relevant_terms))
     relevant_terms = list(expanded_terms)
 
     # If no relevant terms specified, this question doesn't need classification-based search
     if not relevant_terms:
         return [], [], []
     
-    target_sentences: List[Dict[str, Any]] = []
-    reference_sentences: List[Dict[str, Any]] = []
-    
-    # Find sentences classified with relevant terms in target document
-    for sentence_data in target_classified:
-        sentence_classes = sentence_data.get('classes', [])
-        for term in relevant_terms:
-            if term in sentence_classes:
-                target_sentences.append(cast(Dict[str, Any], sentence_data))
-                break
-    
-    # Find sentences classified with relevant terms in reference document
-    for sentence_data in reference_classified:
-        sentence_classes = sentence_data.get('classes', [])
-        for term in relevant_terms:
-            if term in sentence_classes:
-                reference_sentences.append(cast(Dict[str, Any], sentence_data))
-                break
+    # Find sentences classified with relevant terms in both documents
+    target_sentences = select_sentences_by_classes(target_classified, expanded_terms, target_index)
+    reference_sentences = select_sentences_by_classes(reference_classified, expanded_terms, reference_index)
     
     return target_sentences, reference_sentences, relevant_terms
 
@@ -539,6 +537,10 @@ def process_questionnaire_enhanced(state: ContractAnalysisState) -> dict:
     # If classification did not produce any target sentences, mark as unavailable
     classification_unavailable = (len(target_classified) == 0)
 
+    # Index both documents by class once instead of rescanning them per question
+    target_index = index_sentences_by_class(target_classified)
+    reference_index = index_sentences_by_class(reference_classified)
+
     # Process each section and question
     questionnaire_responses = {}
     total_questions = 0
@@ -559,7 +561,8 @@ def process_questionnaire_enhanced(state: ContractAnalysisState) -> dict:
             # Get relevant sentences with attribution tracking
             target_sentences, reference_sentences, searched_terms = \
                 get_relevant_sentences_with_attribution(
-                    question_id, target_classified, reference_classified, terminology_data
+                    question_id, target_classified, reference_classified, terminology_data,
+                    target_index=target_index, reference_index=reference_index
                 )
             
             print(f"    Searched terms: {searched_terms}")
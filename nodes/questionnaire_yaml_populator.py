@@ -1,5 +1,6 @@
 import yaml
 import os
+import uuid
 import pandas as pd
 from datetime import datetime
 from typing import Dict, Any, List, Sequence
@@ -1087,8 +1088,8 @@ def questionnaire_yaml_populator_node(state: Dict[str, Any]) -> Dict[str, Any]:
         if state.get('extracted_entities') is not None:
             analysis_data['extracted_entities'] = state.get('extracted_entities')
         
-        # Generate run ID and create outputs
-        run_id = datetime.now().strftime('%Y%m%d_%H%M%S')
+        # Generate a run ID unique across concurrent runs and create outputs
+        run_id = f"{datetime.now().strftime('%Y%m%d_%H%M%S_%f')}_{uuid.uuid4().hex[:8]}"
         
         # Create organized outputs using the new system
         # Respect environment override to persist master template across runs
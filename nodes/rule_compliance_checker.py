@@ -1,5 +1,6 @@
 from typing import Dict, Any, List
 import json
+import re
 
 from workflows.state import ContractAnalysisState
 from utils.retrieval import env_top_k, get_candidates_for_rule
@@ -8,6 +9,11 @@ from utils.granite_client import GraniteAPIError
 import os
 from utils.model_calling import call_with_rules_schema_retry
 
+# Fallback for responses that wrap the JSON object in extra prose
+_JSON_OBJECT_RE = re.compile(r'\{[^{}]*"status"[^{}]*\}', re.S)
+_PAGE_ANCHOR_RE = re.compile(r"\[\[page=(\d+)]]")
+_VALID_STATUSES = frozenset({"compliant", "non_compliant", "not_applicable", "unknown"})
+
 
 def _format_target_clauses(candidates: List[Dict[str, Any]]) -> str:
 	lines: List[str] = []
@@ -45,10 +51,16 @@ def _build_prompt(rule: Dict[str, Any], candidates: List[Dict[str, Any]], templa
 
 def _parse_result(text: str) -> Dict[str, Any]:
 	try:
-		data = json.loads(text)
+		try:
+			data = json.loads(text)
+		except ValueError:
+			match = _JSON_OBJECT_RE.search(text)
+			if not match:
+				raise
+			data = json.loads(match.group(0))
 		# Minimal normalization
 		status = str(data.get("status", "unknown")).lower()
-		if status not in {"compliant", "non_compliant", "not_applicable", "unknown"}:
+		if status not in _VALID_STATUSES:
 			status = "unknown"
 		data["status"] = status
 		return data
@@ -63,8 +75,7 @@ def _parse_result(text: str) -> Dict[str, Any]:
 
 def _extract_anchor(text: str) -> str:
 	"""Extract [[page=N]] anchor if present."""
-	import re as _re
-	match = _re.search(r"\[\[page=(\d+)]]", text or "")
+	match = _PAGE_ANCHOR_RE.search(text or "")
 	return f"[[page={match.group(1)}]]" if match else ""
 
 
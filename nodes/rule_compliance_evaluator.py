@@ -95,11 +95,13 @@ class RuleComplianceEvaluator(BatchProcessingNode):
             
         relevant_sections = []
         sentences = document_text.split('.')
+        # Lowercase keywords once rather than once per sentence
+        keywords_lower = [keyword.lower() for keyword in keywords]
         
         for idx, sentence in enumerate(sentences):
             sentence_lower = sentence.lower()
             # Check if any keyword appears in the sentence
-            if any(keyword.lower() in sentence_lower for keyword in keywords):
+            if any(keyword in sentence_lower for keyword in keywords_lower):
                 # Get surrounding context (previous and next sentence)
                 start_idx = max(0, idx - 1)
                 end_idx = min(len(sentences), idx + 2)
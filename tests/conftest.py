@@ -1,6 +1,8 @@
 import os
 import sys
 
+import pytest
+
 # Ensure the app package is importable in tests
 ROOT = os.path.dirname(os.path.abspath(__file__))
 REPO_ROOT = os.path.dirname(ROOT)
@@ -13,3 +15,22 @@ if os.path.isdir(APP_ROOT) and APP_ROOT not in sys.path:
 # Also add repository root as a fallback
 if REPO_ROOT not in sys.path:
     sys.path.insert(0, REPO_ROOT)
+
+
+@pytest.fixture(autouse=True)
+def fresh_citation_tracker():
+    """Reset the shared citation tracker so tests can run in any order or worker."""
+    from utils.citation_tracker import citation_tracker
+
+    citation_tracker.citations = {}
+    citation_tracker.sentence_registry = {}
+    citation_tracker.next_citation_id = 1
+    yield citation_tracker
+
+
+@pytest.fixture(scope="session")
+def granite_client():
+    """Shared Granite client, so one pooled HTTP session serves every test in a worker."""
+    from utils.granite_client import granite_client as client
+
+    return client
@@ -11,6 +11,7 @@ from typing import Dict, Any
 # Add project root to path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
+from nodes.base_critic import reload_critic_configs
 from nodes.citation_critic import citation_critic_node, should_rerun_citations
 from utils.citation_tracker import citation_tracker, CitationType
 
@@ -173,6 +174,7 @@ def test_critic_with_issues():
     os.environ['CITATION_REQUIRE_ANCHORS'] = 'true'
     os.environ['CITATION_MAX_UNKNOWN'] = '1'  # Stricter: only 1 unknown allowed
     os.environ['CITATION_MAX_RERUNS'] = '3'
+    reload_critic_configs()
     
     # Run critic
     result = citation_critic_node(state)
@@ -253,6 +255,7 @@ def test_max_reruns():
     state['citation_critic_attempts'] = 2  # Already attempted twice
     
     os.environ['CITATION_MAX_RERUNS'] = '3'
+    reload_critic_configs()
     
     # Run critic
     result = citation_critic_node(state)
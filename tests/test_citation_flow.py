@@ -203,6 +203,50 @@ def test_questionnaire_citations():
     return success
 
 
+def test_questionnaire_citation_order():
+    """Test concurrent questionnaire answers get citation IDs in questionnaire order"""
+    print("\nTesting questionnaire citation ID order...")
+    import os
+    import time
+    import nodes.questionnaire_processor as qp
+    
+    calls = []
+    
+    def fake_call_api(prompt, **kwargs):
+        # Earlier questions finish later, so completion order is reversed
+        calls.append(prompt)
+        time.sleep(max(0, 0.2 - 0.01 * len(calls)))
+        return '{"answer": "Not specified"}'
+    
+    original_call_api = qp.granite_client.call_api
+    original_count_tokens = qp.count_tokens
+    original_parallel = os.environ.get('QUESTIONNAIRE_PARALLEL')
+    qp.granite_client.call_api = fake_call_api
+    # Word count stands in for tiktoken, which downloads its encoding on first use
+    qp.count_tokens = lambda text, model="gpt-4": len(text.split())
+    os.environ['QUESTIONNAIRE_PARALLEL'] = '4'
+    try:
+        result = qp.process_questionnaire({'classified_sentences': [], 'reference_classified_sentences': []})
+    finally:
+        qp.granite_client.call_api = original_call_api
+        qp.count_tokens = original_count_tokens
+        if original_parallel is None:
+            os.environ.pop('QUESTIONNAIRE_PARALLEL', None)
+        else:
+            os.environ['QUESTIONNAIRE_PARALLEL'] = original_parallel
+    
+    citation_numbers = [
+        int(citation_id.split('_')[1])
+        for section in result['questionnaire_responses'].values()
+        for question in section['questions']
+        for citation_id in question['citations']
+    ]
+    success = len(citation_numbers) > 1 and citation_numbers == sorted(citation_numbers)
+    print(f"  {'✅' if success else '❌'} Citation numbers in questionnaire order: {citation_numbers}")
+    assert success
+    return success
+
+
 def test_report_generation_with_citations():
     """Test that compliance reports include citations with anchors"""
     print("\nTesting report generation with citations...")
@@ -313,6 +357,7 @@ def main():
     results.append(("Citation Creation with Pages", test_citation_creation_with_pages()))
     results.append(("Compliance Result Citations", test_compliance_result_citations()))
     results.append(("Questionnaire Citations", test_questionnaire_citations()))
+    results.append(("Questionnaire Citation Order", test_questionnaire_citation_order()))
     results.append(("Report Generation", test_report_generation_with_citations()))
     
     # Summary
@@ -5,15 +5,14 @@ Test Granite 3.3 function calling capabilities
 
 import os
 import json
-from utils.granite_client import GraniteClient
 
 # Set up environment
 os.environ['FORCE_GRANITE'] = 'true'
 
-def test_function_calling():
+def test_function_calling(granite_client):
     """Test if Granite 3.3 supports function calling"""
     
-    client = GraniteClient()
+    client = granite_client
     print(f"Testing model: {client.model_name}")
     print(f"API endpoint: {client.api_url}\n")
     
@@ -196,4 +195,5 @@ Respond ONLY with the JSON object, no additional text."""
 
 
 if __name__ == "__main__":
-    test_function_calling()
\ No newline at end of file
+    from utils.granite_client import granite_client
+    test_function_calling(granite_client)
\ No newline at end of file
@@ -4,23 +4,60 @@ Comprehensive test for the multi-critic system
 Tests PDF, Classification, Questionnaire, and Citation critics working together
 """
 
+import contextlib
+import copy
+import functools
+import io
 import os
+import re
 import sys
-from typing import Dict, Any
+from unittest import mock
+from typing import Dict, Any, List, Tuple
 
 # Add project root to path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 # Import all critics
+from nodes.base_critic import reload_critic_configs
 from nodes.pdf_conversion_critic import PDFConversionCritic, pdf_conversion_critic_node
 from nodes.classification_coverage_critic import ClassificationCoverageCritic, classification_coverage_critic_node
 from nodes.questionnaire_completeness_critic import QuestionnaireCompletenessCritic, questionnaire_completeness_critic_node
 from nodes.citation_critic import CitationCritic, citation_critic_node
-from utils.citation_tracker import citation_tracker, CitationType
+from nodes.document_loader import extract_sentences
+from utils.citation_tracker import Citation, CitationTracker, CitationType
 
+# Page anchors inserted by the PDF converter, e.g. [[page=2]]
+_PAGE_ANCHOR_RE = re.compile(r'\[\[page=\d+\]\]')
 
-def create_test_state_good() -> Dict[str, Any]:
-    """Create a test state with good quality throughout."""
+
+def _split_sentences(text: str) -> List[str]:
+    """Split document text into sentences the way the document loader does."""
+    return extract_sentences(_PAGE_ANCHOR_RE.sub('', text))
+
+
+# Sentences that appear both as classified sentences and as citation sources
+_TERMINATION_SENTENCE = sys.intern("Either party may terminate this agreement with 30 days written notice.")
+_LIABILITY_SENTENCE = sys.intern("Total liability shall not exceed the fees paid in the last 12 months.")
+
+
+# Shared critic instances keyed by class and constructor settings
+_CRITIC_CACHE: Dict[Tuple[type, frozenset], Any] = {}
+
+
+def _get_critic(cls, **kwargs):
+    """Return a shared critic instance for the given class and settings."""
+    key = (cls, frozenset(
+        (name, tuple(value) if isinstance(value, list) else value)
+        for name, value in kwargs.items()
+    ))
+    if key not in _CRITIC_CACHE:
+        _CRITIC_CACHE[key] = cls(**kwargs)
+    return _CRITIC_CACHE[key]
+
+
+@functools.lru_cache(maxsize=1)
+def _build_good_state_template() -> Tuple[Dict[str, Any], Tuple[Citation, ...]]:
+    """Build the canonical good-quality state once, along with its citations."""
     
     # Good PDF conversion
     document_text = """[[page=1]]
@@ -56,14 +93,14 @@ This agreement shall be governed by the laws of New York.
             "page_number": 1
         },
         {
-            "sentence": "Either party may terminate this agreement with 30 days written notice.",
+            "sentence": _TERMINATION_SENTENCE,
             "classes": ["termination"],
             "confidence": 0.90,
             "page": 2,
             "page_number": 2
         },
         {
-            "sentence": "Total liability shall not exceed the fees paid in the last 12 months.",
+            "sentence": _LIABILITY_SENTENCE,
             "classes": ["limitation_of_liability"],
             "confidence": 0.88,
             "page": 2,
@@ -85,22 +122,24 @@ This agreement shall be governed by the laws of New York.
         }
     ]
     
-    # Create good citations
-    citation_tracker.citations = {}
-    citation_tracker.next_citation_id = 1
+    # Create good citations on a private tracker so the template has no global side effects
+    tracker = CitationTracker()
+    ids = tracker.reserve_ids(2)
     
-    cit1 = citation_tracker.create_citation(
-        source_text="Either party may terminate this agreement with 30 days written notice.",
+    cit1 = tracker.create_citation(
+        source_text=_TERMINATION_SENTENCE,
         citation_type=CitationType.DIRECT_QUOTE,
         page_number=2,
-        confidence=0.90
+        confidence=0.90,
+        citation_number=ids[0]
     )
     
-    cit2 = citation_tracker.create_citation(
-        source_text="Total liability shall not exceed the fees paid in the last 12 months.",
+    cit2 = tracker.create_citation(
+        source_text=_LIABILITY_SENTENCE,
         citation_type=CitationType.DIRECT_QUOTE,
         page_number=2,
-        confidence=0.88
+        confidence=0.88,
+        citation_number=ids[1]
     )
     
     # Good questionnaire responses
@@ -161,10 +200,10 @@ This agreement shall be governed by the laws of New York.
         }
     }
     
-    return {
+    state = {
         "document_text": document_text,
         "processed_document_path": "/tmp/test_good.md",
-        "document_sentences": document_text.split("\n"),
+        "document_sentences": _split_sentences(document_text),
         "classified_sentences": classified_sentences,
         "questionnaire_responses": questionnaire_responses,
         "pdf_critic_attempts": 0,
@@ -172,10 +211,24 @@ This agreement shall be governed by the laws of New York.
         "questionnaire_critic_attempts": 0,
         "citation_critic_attempts": 0
     }
+    return state, tuple(tracker.citations.values())
 
 
-def create_test_state_with_issues() -> Dict[str, Any]:
-    """Create a test state with various quality issues."""
+def create_test_state_good() -> Tuple[Dict[str, Any], CitationTracker]:
+    """Create a test state with good quality throughout, plus its citation tracker."""
+    template, citations = _build_good_state_template()
+    
+    # Seed a per-state tracker with the template citations
+    tracker = CitationTracker()
+    tracker.citations = {c.citation_id: copy.copy(c) for c in citations}
+    tracker.next_citation_id = len(citations) + 1
+    
+    return copy.deepcopy(template), tracker
+
+
+@functools.lru_cache(maxsize=1)
+def _build_issues_state_template() -> Dict[str, Any]:
+    """Build the canonical poor-quality state once."""
     
     # Poor PDF conversion (no page anchors, lots of images)
     document_text = """
@@ -267,7 +320,7 @@ LIABILITY exceed fees
     return {
         "document_text": document_text,
         "processed_document_path": "/tmp/test_poor.md",
-        "document_sentences": document_text.split("\n"),
+        "document_sentences": _split_sentences(document_text),
         "classified_sentences": classified_sentences,
         "questionnaire_responses": questionnaire_responses,
         "pdf_critic_attempts": 0,
@@ -277,18 +330,60 @@ LIABILITY exceed fees
     }
 
 
+def create_test_state_with_issues() -> Tuple[Dict[str, Any], CitationTracker]:
+    """Create a test state with various quality issues, plus an empty citation tracker."""
+    return copy.deepcopy(_build_issues_state_template()), CitationTracker()
+
+
+def _use_tracker(tracker: CitationTracker):
+    """Stand in a test's tracker for the shared one the critic nodes read."""
+    return mock.patch('utils.citation_tracker.citation_tracker', tracker)
+
+
+# Default-settings validator for each critic, keyed by result name
+_VALIDATORS = {
+    'pdf': ("PDF Conversion", PDFConversionCritic, 'validate_conversion'),
+    'classification': ("Classification", ClassificationCoverageCritic, 'validate_classification'),
+    'questionnaire': ("Questionnaire", QuestionnaireCompletenessCritic, 'validate_questionnaire'),
+    'citation': ("Citations", CitationCritic, 'validate_citations'),
+}
+
+
+def _validate_all(state: Dict[str, Any], tracker: CitationTracker) -> Dict[str, Dict[str, Any]]:
+    """Run every critic with default settings against one state."""
+    with _use_tracker(tracker):
+        return {
+            key: getattr(_get_critic(cls), method)(state)
+            for key, (_, cls, method) in _VALIDATORS.items()
+        }
+
+
+def _buffered_output(func):
+    """Collect a test's console output and write it to stdout in one call."""
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        buf = io.StringIO()
+        try:
+            with contextlib.redirect_stdout(buf):
+                return func(*args, **kwargs)
+        finally:
+            sys.stdout.write(buf.getvalue())
+    return wrapper
+
+
+@_buffered_output
 def test_all_critics_pass():
     """Test when all critics pass validation."""
     print("\n" + "="*70)
     print("TEST 1: All Critics Pass (Good Quality)")
     print("="*70)
     
-    state = create_test_state_good()
+    state, tracker = create_test_state_good()
     results = {}
     
     # Test PDF Critic (with adjusted threshold for test)
     print("\n1. PDF Conversion Critic:")
-    pdf_critic = PDFConversionCritic(min_text_length=200)  # Lower for test
+    pdf_critic = _get_critic(PDFConversionCritic, min_text_length=200)  # Lower for test
     pdf_results = pdf_critic.validate_conversion(state)
     results['pdf'] = pdf_results
     print(f"   - Text length: {pdf_results['text_length']} chars")
@@ -297,7 +392,8 @@ def test_all_critics_pass():
     
     # Test Classification Critic (with adjusted thresholds)
     print("\n2. Classification Coverage Critic:")
-    class_critic = ClassificationCoverageCritic(
+    class_critic = _get_critic(
+        ClassificationCoverageCritic,
         min_coverage=0.3,
         critical_terms=['term', 'termination', 'liability']  # Only require basic terms
     )
@@ -309,7 +405,7 @@ def test_all_critics_pass():
     
     # Test Questionnaire Critic
     print("\n3. Questionnaire Completeness Critic:")
-    quest_critic = QuestionnaireCompletenessCritic()
+    quest_critic = _get_critic(QuestionnaireCompletenessCritic)
     quest_results = quest_critic.validate_questionnaire(state)
     results['questionnaire'] = quest_results
     print(f"   - Not specified ratio: {quest_results['not_specified_ratio']:.1%}")
@@ -320,7 +416,8 @@ def test_all_critics_pass():
     print("\n4. Citation Critic:")
     cite_critic = CitationCritic(
         min_confidence=0.5,
-        max_unknown_locations=5  # More lenient for test
+        max_unknown_locations=5,  # More lenient for test
+        citation_tracker=tracker
     )
     cite_results = cite_critic.validate_citations(state)
     results['citation'] = cite_results
@@ -329,29 +426,29 @@ def test_all_critics_pass():
     print(f"   - Validation passed: {cite_results['validation_passed']}")
     
     # Overall assessment
-    all_passed = all([
-        results['pdf']['validation_passed'],
-        results['classification']['validation_passed'],
-        results['questionnaire']['validation_passed'],
-        results['citation']['validation_passed']
-    ])
+    all_passed = all(
+        results[key]['validation_passed']
+        for key in ('pdf', 'classification', 'questionnaire', 'citation')
+    )
     
     print(f"\n✅ Overall Result: {'ALL CRITICS PASSED' if all_passed else 'SOME CRITICS FAILED'}")
     assert all_passed, "Expected all critics to pass with good quality state"
 
 
+@_buffered_output
 def test_all_critics_fail():
     """Test when all critics detect issues."""
     print("\n" + "="*70)
     print("TEST 2: All Critics Detect Issues (Poor Quality)")
     print("="*70)
     
-    state = create_test_state_with_issues()
+    state, tracker = create_test_state_with_issues()
     
     # Set strict thresholds
     os.environ['PDF_MIN_TEXT_LENGTH'] = '500'
     os.environ['CLASSIFICATION_MIN_COVERAGE'] = '0.5'
     os.environ['QUESTIONNAIRE_MAX_NOT_SPECIFIED'] = '0.3'
+    reload_critic_configs()
     
     results = {}
     
@@ -381,48 +478,51 @@ def test_all_critics_fail():
     
     # Test Citation Critic
     print("\n4. Citation Critic:")
-    cite_result = citation_critic_node(state)
+    with _use_tracker(tracker):
+        cite_result = citation_critic_node(state)
     results['citation'] = cite_result['citation_validation_results']
     print(f"   - Issues found: {len(results['citation']['issues'])}")
     print(f"   - Severity: {results['citation']['severity']}")
     print(f"   - Needs rerun: {cite_result['needs_citation_rerun']}")
     
     # Check that issues were detected
-    total_issues = sum([
-        len(results['pdf']['issues']),
-        len(results['classification']['issues']),
-        len(results['questionnaire']['issues']),
+    total_issues = (
+        len(results['pdf']['issues']) +
+        len(results['classification']['issues']) +
+        len(results['questionnaire']['issues']) +
         len(results['citation']['issues'])
-    ])
+    )
     
     print(f"\n⚠️ Total Issues Detected: {total_issues}")
     assert total_issues > 10, "Expected many issues to be detected"
     
     # Check that reruns are triggered
-    reruns_triggered = sum([
-        pdf_result['needs_pdf_rerun'],
-        class_result['needs_classification_rerun'],
-        quest_result['needs_questionnaire_rerun'],
-        cite_result['needs_citation_rerun']
-    ])
+    reruns_triggered = (
+        bool(pdf_result['needs_pdf_rerun']) +
+        bool(class_result['needs_classification_rerun']) +
+        bool(quest_result['needs_questionnaire_rerun']) +
+        bool(cite_result['needs_citation_rerun'])
+    )
     
     print(f"⚡ Reruns Triggered: {reruns_triggered}/4 critics")
     assert reruns_triggered >= 3, "Expected at least 3 critics to trigger reruns"
 
 
+@_buffered_output
 def test_retry_limits():
     """Test that retry limits are respected."""
     print("\n" + "="*70)
     print("TEST 3: Retry Limits Are Respected")
     print("="*70)
     
-    state = create_test_state_with_issues()
+    state, _ = create_test_state_with_issues()
     
     # Set higher retry limits to allow reruns
     os.environ['PDF_MAX_RERUNS'] = '2'
     os.environ['CLASSIFICATION_MAX_RERUNS'] = '2'
     os.environ['QUESTIONNAIRE_MAX_RERUNS'] = '2'
     os.environ['CITATION_MAX_RERUNS'] = '2'
+    reload_critic_configs()
     
     print("\n1. First attempt - should trigger reruns:")
     state['pdf_critic_attempts'] = 0
@@ -435,55 +535,43 @@ def test_retry_limits():
     result2 = pdf_conversion_critic_node(state)
     print(f"   PDF: Attempt {result2['pdf_critic_attempts']}, needs rerun: {result2['needs_pdf_rerun']}")
     assert not result2['needs_pdf_rerun'], "Should not rerun after max attempts"
+    assert result2['pdf_validation_results'].keys() == result1['pdf_validation_results'].keys(), \
+        "Skipped validation should keep the full results shape"
+    
+    print("\n3. Single allowed attempt - critic still validates once:")
+    os.environ['PDF_MAX_RERUNS'] = '1'
+    reload_critic_configs()
+    state['pdf_critic_attempts'] = 0
+    result3 = pdf_conversion_critic_node(state)
+    print(f"   PDF: Attempt {result3['pdf_critic_attempts']}, skipped: {result3['pdf_validation_results']['skipped']}")
+    assert not result3['pdf_validation_results']['skipped'], "First attempt should always validate"
+    assert not result3['pdf_validation_results']['validation_passed'], "Validation should detect issues"
+    os.environ['PDF_MAX_RERUNS'] = '2'
+    reload_critic_configs()
     
     print("\n✅ Retry limits are properly enforced")
 
 
+@_buffered_output
 def test_critic_recommendations():
     """Test that critics provide useful recommendations."""
     print("\n" + "="*70)
     print("TEST 4: Critic Recommendations")
     print("="*70)
     
-    state = create_test_state_with_issues()
+    state, tracker = create_test_state_with_issues()
     
-    # Get recommendations from each critic
-    pdf_critic = PDFConversionCritic()
-    pdf_results = pdf_critic.validate_conversion(state)
-    
-    class_critic = ClassificationCoverageCritic()
-    class_results = class_critic.validate_classification(state)
-    
-    quest_critic = QuestionnaireCompletenessCritic()
-    quest_results = quest_critic.validate_questionnaire(state)
-    
-    cite_critic = CitationCritic()
-    cite_results = cite_critic.validate_citations(state)
+    # Get recommendations from every critic in one pass
+    results = _validate_all(state, tracker)
     
     print("\n📋 Recommendations Generated:")
     
-    print("\nPDF Conversion:")
-    for rec in pdf_results['recommendations']:
-        print(f"  [{rec['priority']}] {rec['message']}")
-    
-    print("\nClassification:")
-    for rec in class_results['recommendations']:
-        print(f"  [{rec['priority']}] {rec['message']}")
-    
-    print("\nQuestionnaire:")
-    for rec in quest_results['recommendations']:
-        print(f"  [{rec['priority']}] {rec['message']}")
+    for key, (label, _, _) in _VALIDATORS.items():
+        print(f"\n{label}:")
+        for rec in results[key]['recommendations']:
+            print(f"  [{rec['priority']}] {rec['message']}")
     
-    print("\nCitations:")
-    for rec in cite_results['recommendations']:
-        print(f"  [{rec['priority']}] {rec['message']}")
-    
-    total_recommendations = (
-        len(pdf_results['recommendations']) +
-        len(class_results['recommendations']) +
-        len(quest_results['recommendations']) +
-        len(cite_results['recommendations'])
-    )
+    total_recommendations = sum(len(result['recommendations']) for result in results.values())
     
     print(f"\n✅ Total Recommendations: {total_recommendations}")
     assert total_recommendations > 5, "Expected multiple recommendations for poor quality state"
@@ -521,8 +609,14 @@ def main():
         return 1
     except Exception as e:
         print(f"\n❌ UNEXPECTED ERROR: {e}")
-        import traceback
-        traceback.print_exc()
+        if os.environ.get('TEST_VERBOSE'):
+            import traceback
+            traceback.print_exc()
+        else:
+            tb = sys.exc_info()[2]
+            while tb.tb_next:
+                tb = tb.tb_next
+            print(f"   at {tb.tb_frame.f_code.co_filename}:{tb.tb_lineno} (set TEST_VERBOSE=1 for full traceback)")
         return 1
 
 
@@ -9,7 +9,7 @@ import sys
 # Add project root to path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-from utils.citation_tracker import citation_tracker
+from utils.citation_tracker import CitationTracker
 from utils.sentence_page_mapper import sentence_page_mapper
 
 def test_page_anchor_flow():
@@ -49,21 +49,21 @@ Liability limitations are described."""
         print(f"  Page {item['page']}: {item['sentence'][:50]}...")
     
     # 4. Simulate classified sentences with page info
-    classified_sentences = []
-    for item in sentences_with_pages:
-        classified_sentences.append({
+    classified_sentences = [
+        {
             "sentence": item["sentence"],
             "page": item["page"],
             "page_number": item["page"],  # Include both for compatibility
             "classes": ["termination"] if "termination" in item["sentence"].lower() else ["general"]
-        })
+        }
+        for item in sentences_with_pages
+    ]
     
     # 5. Test citation creation with page info
     print("\n2. Testing citation creation with page anchors:")
     
-    # Clear any existing citations
-    citation_tracker.citations = {}
-    citation_tracker.next_citation_id = 1
+    # Use a fresh tracker so this test does not share global citation state
+    citation_tracker = CitationTracker()
     
     # Create citations from classified sentences
     test_answer = "The termination clause appears in the document"
@@ -4,7 +4,7 @@ Test script to verify page anchor propagation through the pipeline.
 """
 
 import sys
-from utils.sentence_page_mapper import sentence_page_mapper
+from utils.sentence_page_mapper import SentencePageMapper, sentence_page_mapper
 from utils.citation_tracker import citation_tracker
 
 def test_sentence_page_mapping():
@@ -52,6 +52,28 @@ Final sentence on page 3.
     return success
 
 
+def test_position_mapping_for_other_text():
+    """Test that clean positions map correctly for a text other than the last one indexed."""
+    print("\nTesting clean-to-original position mapping across documents...")
+    
+    mapper = SentencePageMapper()
+    mapper.extract_page_boundaries("[[page=1]] Only one anchor here.")
+    
+    other_text = "Intro [[page=1]] [[page=2]] [[page=3]] Target sentence."
+    clean_text = mapper.ANCHOR_PATTERN.sub('', other_text)
+    position = mapper._map_to_original_position(
+        clean_text.find("Target sentence."), other_text, clean_text
+    )
+    
+    success = position == other_text.find("Target sentence.")
+    if success:
+        print("  ✅ Position mapped against the text it was given")
+    else:
+        print(f"  ❌ Mapped to {position}, expected {other_text.find('Target sentence.')}")
+    assert success
+    return success
+
+
 def test_citation_with_pages():
     """Test that citations include page anchors."""
     print("\nTesting citation creation with page anchors...")
@@ -161,6 +183,7 @@ def main():
     
     # Run tests
     results.append(("Sentence to Page Mapping", test_sentence_page_mapping()))
+    results.append(("Position Mapping Across Documents", test_position_mapping_for_other_text()))
     results.append(("Citation with Pages", test_citation_with_pages()))
     results.append(("Questionnaire Page Propagation", test_questionnaire_page_propagation()))
     
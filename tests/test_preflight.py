@@ -8,16 +8,17 @@ to verify model endpoint connectivity.
 
 import sys
 import os
-import json
 from datetime import datetime
+from pathlib import Path
 
 # Add the project root to Python path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 from nodes.preflight_check import preflight_check
+from utils.json_io import dump_json
 
-def test_preflight_check():
-    """Test the preflight check node."""
+def test_preflight_check(tmp_path: Path):
+    """Test the preflight check node, saving its results under tmp_path."""
     print("=" * 60)
     print("TESTING PREFLIGHT CHECK NODE")
     print("=" * 60)
@@ -71,15 +72,12 @@ def test_preflight_check():
                 for error in errors:
                     print(f"  - {error}")
         
-        # Save results to file for inspection (under data/output/preflight)
+        # Save results to file for inspection
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        app_root = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
-        base_dir = os.path.join(app_root, "data", "output", "preflight")
-        os.makedirs(base_dir, exist_ok=True)
-        output_file = os.path.join(base_dir, f"preflight_test_results_{timestamp}.json")
+        tmp_path.mkdir(parents=True, exist_ok=True)
+        output_file = str(tmp_path / f"preflight_test_results_{timestamp}.json")
         
-        with open(output_file, 'w') as f:
-            json.dump(result, f, indent=2, default=str)
+        dump_json(result, output_file)
         
         print(f"\nResults saved to: {output_file}")
         
@@ -94,7 +92,9 @@ def test_preflight_check():
 if __name__ == "__main__":
     print("Starting preflight check test...")
     
-    success = test_preflight_check()
+    # Keep results from manual runs under data/output/preflight
+    app_root = Path(__file__).resolve().parent.parent
+    success = test_preflight_check(app_root / "data" / "output" / "preflight")
     
     print("\n" + "=" * 60)
     if success:
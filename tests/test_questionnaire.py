@@ -12,6 +12,7 @@ sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
 from nodes.questionnaire_processor import process_questionnaire
 from nodes.document_classifier import classify_reference_sentences as classify_reference_document
+from nodes.document_loader import extract_sentences
 from workflows.state import ContractAnalysisState
 
 def create_test_state():
@@ -62,8 +63,7 @@ def create_test_state():
     This Agreement may not be assigned without the prior written consent of both parties.
     """
     
-    # Create temporary reference document
-    ref_doc_path = "/tmp/test_reference.txt"
+    # Reference document is passed in memory; the classifier prefers state text over a path
     reference_doc_text = """
     STANDARD SOFTWARE AGREEMENT TEMPLATE
     
@@ -89,20 +89,17 @@ def create_test_state():
     Rights may not be assigned without written consent of both parties.
     """
     
-    with open(ref_doc_path, 'w') as f:
-        f.write(reference_doc_text)
-    
     return ContractAnalysisState(
         target_document_path="/tmp/test_target.txt",
-        reference_document_path=ref_doc_path,
+        reference_document_path="",
         terminology_path="./data/templates/terminology.yaml",
         baseline_summary={},
         spreadsheet_template_path="",
         output_path="",
         processed_document_path="",
         document_text=test_document_text,
-        document_sentences=test_document_text.split('.'),
-        reference_document_text="",
+        document_sentences=extract_sentences(test_document_text),
+        reference_document_text=reference_doc_text,
         reference_document_sentences=[],
         terminology_data=test_terminology_data,
         classified_sentences=test_classified_sentences,
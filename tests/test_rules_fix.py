@@ -3,8 +3,19 @@
 
 import os
 import sys
+from contextlib import contextmanager
 from workflows.graph_builder import build_graph
 
+@contextmanager
+def _preserved_environ():
+    """Restore os.environ to its prior contents on exit."""
+    snapshot = dict(os.environ)
+    try:
+        yield
+    finally:
+        os.environ.clear()
+        os.environ.update(snapshot)
+
 def test_rules_disabled():
     """Test that rules are skipped when RULES_MODE_ENABLED=false"""
     print("\n" + "="*60)
@@ -14,8 +25,8 @@ def test_rules_disabled():
     # Set rules to disabled
     os.environ['RULES_MODE_ENABLED'] = 'false'
     
-    # Build the graph
-    app = build_graph()
+    # Only node membership is checked, so skip compiling the workflow
+    app = build_graph(dry_run=True)
     
     # Check the graph structure
     print("\nGraph nodes:")
@@ -23,7 +34,7 @@ def test_rules_disabled():
         print(f"  - {node}")
     
     # Check if rules nodes are in the graph
-    has_rules = 'rules_loader' in app.nodes or 'rule_compliance_checker' in app.nodes
+    has_rules = 'rules_loader' in app.nodes or 'rule_compliance_evaluator' in app.nodes
     
     if has_rules:
         print("\n❌ FAIL: Rules nodes found in graph when RULES_MODE_ENABLED=false")
@@ -42,8 +53,8 @@ def test_rules_enabled():
     os.environ['RULES_MODE_ENABLED'] = 'true'
     os.environ['RULES_PATH'] = '/dummy/path/rules.csv'  # Set a dummy path
     
-    # Build the graph
-    app = build_graph()
+    # Only node membership is checked, so skip compiling the workflow
+    app = build_graph(dry_run=True)
     
     # Check the graph structure
     print("\nGraph nodes:")
@@ -51,7 +62,7 @@ def test_rules_enabled():
         print(f"  - {node}")
     
     # Check if rules nodes are in the graph
-    has_rules = 'rules_loader' in app.nodes and 'rule_compliance_checker' in app.nodes
+    has_rules = 'rules_loader' in app.nodes and 'rule_compliance_evaluator' in app.nodes
     
     if has_rules:
         print("\n✅ PASS: Rules nodes correctly included when enabled")
@@ -70,8 +81,8 @@ def test_rules_enabled_no_path():
     os.environ['RULES_MODE_ENABLED'] = 'true'
     os.environ.pop('RULES_PATH', None)  # Remove RULES_PATH if it exists
     
-    # Build the graph
-    app = build_graph()
+    # Only node membership is checked, so skip compiling the workflow
+    app = build_graph(dry_run=True)
     
     # Check the graph structure
     print("\nGraph nodes:")
@@ -79,7 +90,7 @@ def test_rules_enabled_no_path():
         print(f"  - {node}")
     
     # Check if rules nodes are in the graph (they should be added, routing will decide at runtime)
-    has_rules = 'rules_loader' in app.nodes and 'rule_compliance_checker' in app.nodes
+    has_rules = 'rules_loader' in app.nodes and 'rule_compliance_evaluator' in app.nodes
     
     if has_rules:
         print("\n✅ PASS: Rules nodes included, routing will decide at runtime based on state")
@@ -94,11 +105,10 @@ def main():
     print("=========================================")
     
     results = []
-    
-    # Run tests
-    results.append(test_rules_disabled())
-    results.append(test_rules_enabled())
-    results.append(test_rules_enabled_no_path())
+    for test_fn in (test_rules_disabled, test_rules_enabled, test_rules_enabled_no_path):
+        # Each test sets rules env vars; undo them before the next one runs
+        with _preserved_environ():
+            results.append(test_fn())
     
     # Summary
     print("\n" + "="*60)
@@ -12,15 +12,12 @@ os.environ['FORCE_GRANITE'] = 'true'
 os.environ['DUAL_MODEL_ENABLED'] = 'false'
 os.environ['RULES_MODE_ENABLED'] = 'true'
 
-# Import required modules
-from utils.granite_client import GraniteClient
-
-def test_granite_client():
+def test_granite_client(granite_client):
     """Test if GraniteClient works correctly"""
     print("Testing GraniteClient...")
     
     try:
-        client = GraniteClient()
+        client = granite_client
         print(f"✅ Client initialized: {client.model_name}")
         
         # Test system message call
@@ -80,7 +77,8 @@ def main():
     results = []
     
     # Test GraniteClient
-    results.append(test_granite_client())
+    from utils.granite_client import granite_client
+    results.append(test_granite_client(granite_client))
     
     # Test RuleComplianceEvaluator
     results.append(test_rule_compliance_evaluator())
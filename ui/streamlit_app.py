@@ -1,10 +1,20 @@
+import itertools
 import os
-import tempfile
+import queue
+import shutil
 import sys
-from typing import List, Optional, Dict, Any, Deque
+import time
+import uuid
+from typing import List, Optional, Dict, Any, Deque, Set, Tuple
 import yaml
 from pathlib import Path
 
+# Prefer the libyaml-backed loader when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as _YamlSafeLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlSafeLoader
+
 # Ensure project root is on sys.path for module imports when run via Streamlit
 _THIS_DIR = os.path.dirname(os.path.abspath(__file__))
 _PROJECT_ROOT = os.path.dirname(_THIS_DIR)  # agentic-process
@@ -15,16 +25,81 @@ import streamlit as st
 from dotenv import load_dotenv
 from collections import deque
 
-from workflows.graph_builder import build_graph  # noqa: F401 (will be re-imported after env setup)
-from nodes.base_node import ProgressReporter, ProgressUpdate, NodeStatus
+from utils.json_io import loads_json, dumps_json
+from utils.progress import NodeStatus, ProgressUpdate
+
+# Display lookups shared by every progress update (node icons keyed by NodeStatus.value)
+_STATUS_ICONS: Dict[str, str] = {
+    "running": "🔄",
+    "completed": "✅",
+    "failed": "❌",
+    "skipped": "⏭️",
+    "retrying": "🔁",
+    "pending": "⏳"
+}
+_RULE_STATUS_EMOJI: Dict[str, str] = {
+    'compliant': '✅',
+    'non_compliant': '❌',
+    'partially_compliant': '⚠️',
+    'not_applicable': '➖',
+    'requires_review': '🔍'
+}
+_LLM_STATUS_COLOR: Dict[str, str] = {
+    'compliant': '🟢',
+    'non_compliant': '🔴',
+    'partially_compliant': '🟡',
+    'not_applicable': '⚪',
+    'requires_review': '🔵'
+}
+
+
+DOCUMENT_SETS_PATH = Path(_PROJECT_ROOT) / "config" / "document_sets.yaml"
+SAMPLE_DOCUMENTS_DIR = Path(_PROJECT_ROOT) / "sample_documents"
 
 
 def load_document_sets() -> Dict[str, Any]:
     """Load document sets configuration from YAML file"""
-    config_path = Path(_PROJECT_ROOT) / "config" / "document_sets.yaml"
+    # Key the cache on the file's mtime and size so edits are picked up on the next rerun
+    try:
+        stat = DOCUMENT_SETS_PATH.stat()
+        config_stamp = (stat.st_mtime, stat.st_size)
+    except OSError:
+        config_stamp = None
     
+    try:
+        return _load_document_sets(config_stamp)
+    except Exception as e:
+        st.error(f"Error loading document sets: {e}")
+        return {"document_sets": {}}
+
+
+def _index_directory_tree(root: Path) -> Dict[Path, Set[str]]:
+    """Entry names of every directory under root, gathered in a single walk."""
+    dir_index: Dict[Path, Set[str]] = {}
+    for dirpath, dirnames, filenames in os.walk(root):
+        dir_index[Path(dirpath)] = set(dirnames) | set(filenames)
+    return dir_index
+
+
+def _path_exists(path: Path, dir_index: Dict[Path, Set[str]]) -> bool:
+    """Check a path against one cached listing of its parent directory."""
+    parent = path.parent
+    names = dir_index.get(parent)
+    if names is None:
+        try:
+            with os.scandir(parent) as entries:
+                names = {entry.name for entry in entries}
+        except OSError:
+            names = set()
+        dir_index[parent] = names
+    return path.name in names
+
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _load_document_sets(config_stamp: Optional[Tuple[float, int]]) -> Dict[str, Any]:
+    """Parse and validate document sets; cached across reruns per config_stamp."""
     # Check if only AI addendum files exist (fallback mode)
-    if not config_path.exists():
+    if config_stamp is None:
         # Create a minimal configuration with just AI addendum
         ai_addendum_target = Path(_PROJECT_ROOT) / "sample_documents/target_docs/ai_addendum/AI-Services-Addendum-for-Procurement-Contracts-Aug.pdf"
         ai_addendum_ref = Path(_PROJECT_ROOT) / "sample_documents/standard_docs/ai_addendum/AI-Addendum.md"
@@ -51,63 +126,88 @@ def load_document_sets() -> Dict[str, Any]:
             }
         return {"document_sets": {}}
     
-    try:
-        with open(config_path, 'r') as f:
-            config = yaml.safe_load(f)
+    with open(DOCUMENT_SETS_PATH, 'r') as f:
+        config = yaml.load(f, Loader=_YamlSafeLoader)
+    
+    # Validate that referenced files exist. The sample documents tree is listed in
+    # one walk up front; other directories are listed lazily, once each.
+    dir_index = _index_directory_tree(SAMPLE_DOCUMENTS_DIR)
+    validated_sets = {}
+    for set_id, set_config in config.get("document_sets", {}).items():
+        # Check if reference document exists
+        ref_path = Path(_PROJECT_ROOT) / set_config.get("reference_document", "")
+        if not _path_exists(ref_path, dir_index):
+            continue
         
-        # Validate that referenced files exist
-        validated_sets = {}
-        for set_id, set_config in config.get("document_sets", {}).items():
-            # Check if reference document exists
-            ref_path = Path(_PROJECT_ROOT) / set_config.get("reference_document", "")
-            if not ref_path.exists():
-                continue
-            
-            # Check if at least one target document exists
-            valid_targets = []
-            for target in set_config.get("target_documents", []):
-                target_path = Path(_PROJECT_ROOT) / target.get("path", "")
-                if target_path.exists():
-                    valid_targets.append(target)
+        # Check if at least one target document exists
+        valid_targets = []
+        for target in set_config.get("target_documents", []):
+            target_path = Path(_PROJECT_ROOT) / target.get("path", "")
+            if _path_exists(target_path, dir_index):
+                valid_targets.append(target)
+        
+        if valid_targets:
+            set_config["target_documents"] = valid_targets
             
-            if valid_targets:
-                set_config["target_documents"] = valid_targets
+            # Check if rules file exists (optional)
+            rules_path = Path(_PROJECT_ROOT) / set_config.get("rules_file", "")
+            if not _path_exists(rules_path, dir_index):
+                set_config["rules_file"] = None
                 
-                # Check if rules file exists (optional)
-                rules_path = Path(_PROJECT_ROOT) / set_config.get("rules_file", "")
-                if not rules_path.exists():
-                    set_config["rules_file"] = None
-                    
-                validated_sets[set_id] = set_config
-        
-        config["document_sets"] = validated_sets
-        return config
-        
-    except Exception as e:
-        st.error(f"Error loading document sets: {e}")
-        return {"document_sets": {}}
+            validated_sets[set_id] = set_config
+    
+    config["document_sets"] = validated_sets
+    return config
+
+
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+UPLOADS_DIR = Path(_PROJECT_ROOT) / "data" / "uploads"
+UPLOAD_RETENTION_SECONDS = 24 * 60 * 60
+
+
+def cleanup_stale_uploads(max_age_seconds: float = UPLOAD_RETENTION_SECONDS) -> None:
+    """Remove upload session directories that have not been written to recently."""
+    if not UPLOADS_DIR.is_dir():
+        return
+    cutoff = time.time() - max_age_seconds
+    with os.scandir(UPLOADS_DIR) as entries:
+        for entry in entries:
+            try:
+                if entry.is_dir() and entry.stat().st_mtime < cutoff:
+                    shutil.rmtree(entry.path, ignore_errors=True)
+            except OSError:
+                continue
+
+
+def get_session_upload_dir() -> str:
+    """Persistent upload directory for the current Streamlit session."""
+    session_id = st.session_state.get('upload_session_id')
+    if session_id is None:
+        # New session: good moment to drop directories left behind by old ones
+        cleanup_stale_uploads()
+        session_id = uuid.uuid4().hex
+        st.session_state['upload_session_id'] = session_id
+    path = UPLOADS_DIR / session_id
+    path.mkdir(parents=True, exist_ok=True)
+    return str(path)
 
 
 def save_uploaded_file(upload, dest_dir: str) -> str:
     os.makedirs(dest_dir, exist_ok=True)
     path = os.path.join(dest_dir, upload.name)
-    with open(path, 'wb') as f:
-        f.write(upload.getbuffer())
+    part_path = path + '.part'
+    # Copy in bounded chunks rather than materializing the whole upload again,
+    # then rename so readers never see a partially written file
+    upload.seek(0)
+    with open(part_path, 'wb') as f:
+        shutil.copyfileobj(upload, f, length=UPLOAD_CHUNK_SIZE)
+    os.replace(part_path, path)
     return path
 
 
 def display_progress_update(update: ProgressUpdate, container):
     """Display a progress update in the Streamlit UI"""
-    status_icons = {
-        NodeStatus.RUNNING: "🔄",
-        NodeStatus.COMPLETED: "✅",
-        NodeStatus.FAILED: "❌",
-        NodeStatus.SKIPPED: "⏭️",
-        NodeStatus.RETRYING: "🔁",
-        NodeStatus.PENDING: "⏳"
-    }
-    
-    icon = status_icons.get(update.status, "⏳")
+    icon = _STATUS_ICONS.get(update.status.value, "⏳")
     
     # Format progress bar if available
     if update.progress is not None:
@@ -117,10 +217,332 @@ def display_progress_update(update: ProgressUpdate, container):
         container.info(f"{icon} **{update.node_name}**: {update.message}")
     
     # Show error details if failed
-    if update.status == NodeStatus.FAILED and update.details.get('error'):
+    if update.status is NodeStatus.FAILED and update.details.get('error'):
         container.error(f"Error: {update.details['error']}")
 
 
+# Environment flags that change how the workflow graph is configured and built
+WORKFLOW_ENV_KEYS = (
+    'USE_TEMPLATE_EXCEL',
+    'RULES_MODE_ENABLED',
+    'RULES_PATH',
+    'FORCE_GRANITE',
+    'USE_TUNED_MODEL',
+    'DUAL_MODEL_ENABLED',
+    'COMPARISON_ENABLED',
+    'USE_ENHANCED_ATTRIBUTION',
+)
+
+
+def get_workflow_worker():
+    """Return the server's workflow worker for the current workflow flags.
+    
+    Must be called after the environment (including .env) is finalized: the flags
+    are read from os.environ to key the shared cache, and a new worker process
+    inherits os.environ when it starts.
+    """
+    return _shared_workflow_worker(tuple(os.environ.get(k) for k in WORKFLOW_ENV_KEYS))
+
+
+@st.cache_resource(show_spinner=False, validate=lambda worker: worker.is_alive())
+def _shared_workflow_worker(flags_key: Tuple[Optional[str], ...]):
+    """One worker process per flag combination, shared by every session of this server.
+    
+    flags_key only keys the cache. A worker that has exited fails validation and
+    is replaced; live workers are daemon processes and stop with the server.
+    """
+    from workflows.process_worker import WorkflowWorker
+    
+    # The graph is built in a fresh process, so there is nothing to reload here
+    return WorkflowWorker()
+
+
+TERMINOLOGY_PATH = os.path.join(_PROJECT_ROOT, 'terminology', 'terms.yaml')
+COMPARISONS_DIR = os.path.join(_PROJECT_ROOT, 'data', 'output', 'comparisons')
+MASTER_PATH = os.path.join(COMPARISONS_DIR, 'contract_analysis_template_master.xlsx')
+COMPLIANCE_PATH = os.path.join(COMPARISONS_DIR, 'rule_compliance_master.xlsx')
+
+# Document-independent part of the initial workflow state
+_STATE_TEMPLATE: Dict[str, Any] = {
+    "terminology_path": TERMINOLOGY_PATH,
+    "baseline_summary": {},
+    "spreadsheet_template_path": '',
+    "output_path": '',
+    # Required placeholders
+    "processed_document_path": "",
+    "document_text": "",
+    "document_sentences": [],
+    "reference_document_text": "",
+    "reference_document_sentences": [],
+    "terminology_data": [],
+    "classified_sentences": [],
+    "reference_classified_sentences": [],
+    "extracted_data": {},
+    "extracted_entities": {},
+    "red_flag_analysis": "",
+    "questionnaire_responses": {},
+    "questionnaire_responses_granite": {},
+    "questionnaire_responses_ollama": {},
+    "model_comparison": {},
+    "active_model_branch": "both",
+    "final_spreadsheet_row": {},
+    "processing_errors": [],
+    "quality_metrics": {},
+    "overall_quality_score": None,
+    "manual_review_required": False,
+    "processing_warnings": [],
+    "workflow_status": "running",
+    "last_successful_node": None,
+    "current_processing_node": None,
+    "checkpoints": [],
+    "processing_start_time": "",
+    "processing_metadata": {},
+    "conversion_metadata": None,
+    "fallback_strategies_used": [],
+    "api_call_metrics": None,
+    "classification_metrics": None,
+}
+
+
+def _build_document_state(doc: str, reference_abs_path: str, rules_path: str | None) -> Dict[str, Any]:
+    """Initial workflow state for one target document.
+    
+    Placeholder lists and dicts are replaced with fresh empty ones so documents
+    running concurrently never share mutable state through the template.
+    """
+    state = {
+        key: type(value)() if isinstance(value, (dict, list)) else value
+        for key, value in _STATE_TEMPLATE.items()
+    }
+    state.update({
+        "target_document_path": os.path.abspath(doc),
+        "reference_document_path": reference_abs_path,
+        "rules_path": rules_path,
+    })
+    return state
+
+
+# Minimum seconds between repaints of throttled progress output (rule table, LLM responses)
+PROGRESS_RENDER_INTERVAL = 0.2
+
+# LLM responses longer than this are offered as a download instead of being
+# shipped inline (and hidden in a collapsed expander) for every rule
+LLM_JSON_INLINE_LIMIT = 4096
+# Unique widget keys for those download buttons within one script run
+_llm_json_keys = itertools.count()
+
+
+def _rule_result_row(rule_name: str, details: Dict[str, Any]) -> Dict[str, Any]:
+    """One row of the rule results table."""
+    status = details.get('status', 'unknown')
+    status_emoji = _RULE_STATUS_EMOJI.get(status, '❓')
+    severity = details.get('severity', 'medium')
+    if status == 'non_compliant' and severity == 'critical':
+        status_emoji = '🔴'
+    elif status == 'non_compliant' and severity == 'high':
+        status_emoji = '🟠'
+    confidence = details.get('confidence', 0) * 100
+    return {
+        "": status_emoji,
+        "Rule": rule_name,
+        "Status": status.replace('_', ' ').title(),
+        "Confidence": f"{confidence:.0f}%" if confidence > 0 else "",
+        "Severity": str(severity).upper() if status == 'non_compliant' else "",
+    }
+
+
+def _render_llm_response(model_name: str, rule_name: str, details: Dict[str, Any]) -> None:
+    """Render one completed LLM rule decision into the current container.
+    
+    The parsed response is memoized on details['_parsed'] for later consumers.
+    """
+    full_response = details.get('full_response', '')
+    st.success(f"✅ **{model_name}** completed: {rule_name}")
+    
+    # Show the formatted JSON response
+    try:
+        parsed = details.get('_parsed')
+        if parsed is None:
+            parsed = loads_json(full_response)
+            details['_parsed'] = parsed
+        
+        # Display key information prominently
+        status = parsed.get('status', 'unknown')
+        confidence = parsed.get('confidence', 0)
+        
+        # Color-code the status
+        status_color = _LLM_STATUS_COLOR.get(status, '⚫')
+        
+        st.markdown(f"### {status_color} LLM Decision: **{status.replace('_', ' ').title()}** (Confidence: {confidence*100:.0f}%)")
+        
+        # Show rationale
+        if 'rationale' in parsed:
+            st.markdown("**Rationale:**")
+            st.write(parsed['rationale'])
+        
+        # Show issues if non-compliant
+        if status == 'non_compliant' and 'specific_issues' in parsed:
+            st.markdown("**Specific Issues Found:**")
+            for issue in parsed['specific_issues']:
+                st.write(f"• {issue}")
+        
+        # Show the full JSON in an expander; large responses are downloaded on demand
+        if len(full_response) > LLM_JSON_INLINE_LIMIT:
+            st.download_button(
+                label="📄 Download Full JSON Response",
+                data=full_response,
+                file_name=f"{rule_name or 'llm_response'}.json",
+                mime="application/json",
+                key=f"llm_json_{next(_llm_json_keys)}",
+                # A rerun would abort the workflow run that is rendering this
+                on_click="ignore",
+            )
+        else:
+            with st.expander("📄 View Full JSON Response", expanded=False):
+                st.code(dumps_json(parsed), language='json')
+        
+    except Exception as e:
+        # If JSON parsing fails, show the raw response
+        st.error(f"Error parsing response: {e}")
+        st.code(full_response, language='text')
+
+
+def _create_document_view(doc: str):
+    """Create the status panel for one document and the callback that renders its progress."""
+    status = st.status(f"Processing {os.path.basename(doc)}", expanded=True)
+    
+    # Create containers for different types of updates
+    main_progress_bar = status.progress(0.0, text="Starting analysis...")
+    progress_container = status.container()
+    current_node_container = progress_container.empty()
+    llm_container = progress_container.container()  # For LLM streaming output
+    rules_container = progress_container.container()
+    details_container = progress_container.container()
+    
+    # Track recent updates and processed rules
+    # Last few completed nodes, shown in a fixed ring of slots
+    completed_slots = [details_container.empty() for _ in range(3)]
+    next_completed_slot: int = 0
+    processed_rules: Dict[str, Any] = {}
+    overall_progress: float = 0.0  # Track overall progress
+    rules_placeholder = rules_container.empty()
+    last_rules_render: float = 0.0
+    llm_events: Deque[Tuple[str, str, Dict[str, Any]]] = deque(maxlen=200)
+    last_llm_render: float = 0.0
+    
+    def render_rules():
+        """Replace the rules table with all rule results received so far."""
+        nonlocal last_rules_render
+        last_rules_render = time.monotonic()
+        if processed_rules:
+            rules_placeholder.dataframe(
+                [_rule_result_row(name, details) for name, details in processed_rules.items()],
+                hide_index=True,
+            )
+    
+    def render_llm_events():
+        """Render all buffered LLM responses in one container."""
+        nonlocal last_llm_render
+        last_llm_render = time.monotonic()
+        if not llm_events:
+            return
+        with llm_container.container():
+            while llm_events:
+                _render_llm_response(*llm_events.popleft())
+    
+    def update_callback(update: ProgressUpdate):
+        """Callback to display progress updates in Streamlit"""
+        nonlocal overall_progress, next_completed_slot
+        
+        # Bind once; NodeStatus members are singletons, so compare by identity
+        details = update.details or {}
+        node_status = update.status
+        
+        # Special handling for RuleComplianceEvaluator updates
+        if update.node_name == "RuleComplianceEvaluator":
+            # Check for LLM streaming phases
+            if 'phase' in details:
+                phase = details['phase']
+                rule_name = details.get('rule', '')
+                model_name = details.get('model', 'LLM')
+                
+                # Handle different LLM phases
+                if phase == 'llm_start':
+                    # Starting LLM analysis - just show a message
+                    llm_container.info(f"🤖 **{model_name}** analyzing rule: {rule_name}")
+                
+                elif phase == 'llm_complete':
+                    # LLM analysis complete - buffer the response; bursts are rendered together
+                    llm_events.append((model_name, rule_name, details))
+                    if time.monotonic() - last_llm_render >= PROGRESS_RENDER_INTERVAL:
+                        render_llm_events()
+            
+            # Check if this is a detailed rule analysis result
+            elif 'rule_name' in details:
+                rule_name = details['rule_name']
+                
+                # Skip duplicate updates for the same rule
+                if rule_name not in processed_rules:
+                    processed_rules[rule_name] = details
+                    
+                    # Repaint the rules table at most every PROGRESS_RENDER_INTERVAL seconds
+                    if time.monotonic() - last_rules_render >= PROGRESS_RENDER_INTERVAL:
+                        render_rules()
+                
+                # Update overall progress for rule analysis
+                if update.progress is not None:
+                    overall_progress = update.progress
+                    main_progress_bar.progress(overall_progress, text=f"Analyzing Rules: {int(overall_progress*100)}% complete")
+            
+            # Evaluator finished: show any rule results held back by throttling
+            elif node_status is NodeStatus.COMPLETED:
+                render_rules()
+            
+            # Skip general RuleComplianceEvaluator status updates to reduce clutter
+            return
+        
+        # Handle other node updates
+        if node_status is NodeStatus.RUNNING:
+            current_node_container.info(f"🔄 **Current Step**: {update.node_name}")
+            if update.progress is not None:
+                overall_progress = update.progress
+                main_progress_bar.progress(overall_progress, text=f"{update.node_name}: {int(overall_progress*100)}% complete")
+        
+        # Only show completed nodes (not running status)
+        elif node_status is NodeStatus.COMPLETED:
+            # Overwrite only the oldest slot instead of redrawing the whole list
+            completed_slots[next_completed_slot].success(f"✅ Completed: {update.node_name}")
+            next_completed_slot = (next_completed_slot + 1) % len(completed_slots)
+    
+    def flush():
+        """Render anything still held back by throttling."""
+        render_llm_events()
+        render_rules()
+    
+    status.update(label=f"Processing {os.path.basename(doc)}...", state="running")
+    return status, update_callback, flush
+
+
+def _finish_document_view(doc: str, status, result: Optional[Dict[str, Any]], error: Optional[str]) -> None:
+    """Show the outcome of one document's workflow run in its status panel."""
+    if error is not None:
+        status.update(label=f"❌ Failed: {os.path.basename(doc)}", state="error")
+        status.error(f"Error processing document: {error}")
+        return
+    
+    status.update(label=f"✅ Completed: {os.path.basename(doc)}", state="complete", expanded=False)
+    
+    # Show summary
+    if 'rule_compliance_summary' in result:
+        summary = result['rule_compliance_summary']
+        score = summary.get('compliance_score', 0) * 100
+        status.metric(
+            label="Compliance Score",
+            value=f"{score:.1f}%",
+            delta=f"{summary.get('compliant', 0)} compliant, {summary.get('non_compliant', 0)} non-compliant"
+        )
+
+
 def run_workflow_for_documents(doc_paths: List[str], reference_path: str, rules_path: str | None) -> None:
     # Ensure Granite-only env before imports are resolved
     # Always use template master for consistency
@@ -136,247 +558,56 @@ def run_workflow_for_documents(doc_paths: List[str], reference_path: str, rules_
     os.environ['COMPARISON_ENABLED'] = 'false'
     load_dotenv(override=True)
 
-    # Reload config modules so flags take effect, then import build_graph
-    import importlib
-    import utils.model_config as mc
-    mc = importlib.reload(mc)
-    import workflows.graph_builder as gb
-    gb = importlib.reload(gb)
-    app = gb.build_graph()
-
-    for doc in doc_paths:
-        state = {
-            "target_document_path": os.path.abspath(doc),
-            "reference_document_path": os.path.abspath(reference_path),
-            "terminology_path": os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'terminology', 'terms.yaml'),
-            "baseline_summary": {},
-            "spreadsheet_template_path": '',
-            "output_path": '',
-            "rules_path": rules_path,
-            # Required placeholders
-            "processed_document_path": "",
-            "document_text": "",
-            "document_sentences": [],
-            "reference_document_text": "",
-            "reference_document_sentences": [],
-            "terminology_data": [],
-            "classified_sentences": [],
-            "reference_classified_sentences": [],
-            "extracted_data": {},
-            "extracted_entities": {},
-            "red_flag_analysis": "",
-            "questionnaire_responses": {},
-            "questionnaire_responses_granite": {},
-            "questionnaire_responses_ollama": {},
-            "model_comparison": {},
-            "active_model_branch": "both",
-            "final_spreadsheet_row": {},
-            "processing_errors": [],
-            "quality_metrics": {},
-            "overall_quality_score": None,
-            "manual_review_required": False,
-            "processing_warnings": [],
-            "workflow_status": "running",
-            "last_successful_node": None,
-            "current_processing_node": None,
-            "checkpoints": [],
-            "processing_start_time": "",
-            "processing_metadata": {},
-            "conversion_metadata": None,
-            "fallback_strategies_used": [],
-            "api_call_metrics": None,
-            "classification_metrics": None,
-        }
-        with st.status(f"Processing {os.path.basename(doc)}", expanded=True) as status:
-            # Set up progress reporting
-            reporter = ProgressReporter()
-            reporter.clear_callbacks()
-            
-            # Create containers for different types of updates
-            main_progress_bar = status.progress(0.0, text="Starting analysis...")
-            progress_container = status.container()
-            current_node_container = progress_container.empty()
-            llm_container = progress_container.container()  # For LLM streaming output
-            rules_container = progress_container.container()
-            details_container = progress_container.container()
-            
-            # Track recent updates and processed rules
-            recent_updates: Deque[ProgressUpdate] = deque(maxlen=3)
-            processed_rules: Dict[str, Any] = {}
-            current_llm_output: Optional[Any] = None  # Track current LLM streaming
-            accumulated_response: str = ""  # Accumulate the streaming response
-            overall_progress: float = 0.0  # Track overall progress
-            
-            def update_callback(update: ProgressUpdate):
-                """Callback to display progress updates in Streamlit"""
-                nonlocal current_llm_output, accumulated_response, overall_progress
-                
-                # Special handling for RuleComplianceEvaluator updates
-                if update.node_name == "RuleComplianceEvaluator":
-                    # Check for LLM streaming phases
-                    if update.details and 'phase' in update.details:
-                        phase = update.details['phase']
-                        rule_name = update.details.get('rule', '')
-                        model_name = update.details.get('model', 'LLM')
-                        
-                        # Handle different LLM phases
-                        if phase == 'llm_start':
-                            # Starting LLM analysis - just show a message
-                            with llm_container:
-                                llm_container.empty()
-                                st.info(f"🤖 **{model_name}** analyzing rule: {rule_name}")
-                        
-                        elif phase == 'llm_complete':
-                            # LLM analysis complete - show the full response
-                            full_response = update.details.get('full_response', '')
-                            with llm_container:
-                                # Don't clear - accumulate all responses
-                                # llm_container.empty()  # REMOVED to keep history
-                                
-                                # Create a nice display of the LLM response
-                                col1, col2 = st.columns([3, 1])
-                                with col1:
-                                    st.success(f"✅ **{model_name}** completed: {rule_name}")
-                                
-                                # Show the formatted JSON response
-                                try:
-                                    import json
-                                    parsed = json.loads(full_response)
-                                    
-                                    # Display key information prominently
-                                    status = parsed.get('status', 'unknown')
-                                    confidence = parsed.get('confidence', 0)
-                                    
-                                    # Color-code the status
-                                    status_color = {
-                                        'compliant': '🟢',
-                                        'non_compliant': '🔴',
-                                        'partially_compliant': '🟡',
-                                        'not_applicable': '⚪',
-                                        'requires_review': '🔵'
-                                    }.get(status, '⚫')
-                                    
-                                    st.markdown(f"### {status_color} LLM Decision: **{status.replace('_', ' ').title()}** (Confidence: {confidence*100:.0f}%)")
-                                    
-                                    # Show rationale
-                                    if 'rationale' in parsed:
-                                        st.markdown("**Rationale:**")
-                                        st.write(parsed['rationale'])
-                                    
-                                    # Show issues if non-compliant
-                                    if status == 'non_compliant' and 'specific_issues' in parsed:
-                                        st.markdown("**Specific Issues Found:**")
-                                        for issue in parsed['specific_issues']:
-                                            st.write(f"• {issue}")
-                                    
-                                    # Show the full JSON in an expander
-                                    with st.expander("📄 View Full JSON Response", expanded=False):
-                                        st.code(json.dumps(parsed, indent=2), language='json')
-                                    
-                                except Exception as e:
-                                    # If JSON parsing fails, show the raw response
-                                    st.error(f"Error parsing response: {e}")
-                                    st.code(full_response, language='text')
-                    
-                    # Check if this is a detailed rule analysis result
-                    elif update.details and 'rule_name' in update.details:
-                        rule_name = update.details['rule_name']
-                        
-                        # Skip duplicate updates for the same rule
-                        if rule_name not in processed_rules:
-                            processed_rules[rule_name] = update.details
-                            
-                            # Display rule analysis in a clean format
-                            with rules_container:
-                                status_emoji = {
-                                    'compliant': '✅',
-                                    'non_compliant': '❌',
-                                    'partially_compliant': '⚠️',
-                                    'not_applicable': '➖',
-                                    'requires_review': '🔍'
-                                }.get(update.details['status'], '❓')
-                                
-                                # Create a nicely formatted rule result
-                                confidence = update.details.get('confidence', 0) * 100
-                                severity = update.details.get('severity', 'medium')
-                                
-                                # Build the display message
-                                msg = f"{status_emoji} **{rule_name}**: {update.details['status'].replace('_', ' ').title()}"
-                                if confidence > 0:
-                                    msg += f" ({confidence:.0f}% confidence)"
-                                
-                                # Color code based on status
-                                if update.details['status'] == 'non_compliant':
-                                    if severity == 'critical':
-                                        st.error(f"🔴 {msg} - CRITICAL")
-                                    elif severity == 'high':
-                                        st.warning(f"🟠 {msg} - HIGH PRIORITY")
-                                    else:
-                                        st.warning(msg)
-                                elif update.details['status'] == 'compliant':
-                                    st.success(msg)
-                                elif update.details['status'] == 'not_applicable':
-                                    st.info(msg)
-                                else:
-                                    st.warning(msg)
-                        
-                        # Update overall progress for rule analysis
-                        if update.progress is not None:
-                            overall_progress = update.progress
-                            main_progress_bar.progress(overall_progress, text=f"Analyzing Rules: {int(overall_progress*100)}% complete")
-                    
-                    # Skip general RuleComplianceEvaluator status updates to reduce clutter
-                    return
-                
-                # Handle other node updates
-                if update.status == NodeStatus.RUNNING:
-                    current_node_container.info(f"🔄 **Current Step**: {update.node_name}")
-                    if update.progress is not None:
-                        overall_progress = update.progress
-                        # Update the main progress bar with appropriate text
-                        if update.node_name == "RuleComplianceEvaluator":
-                            progress_text = f"Analyzing Rules: {int(overall_progress*100)}% complete"
-                        else:
-                            progress_text = f"{update.node_name}: {int(overall_progress*100)}% complete"
-                        main_progress_bar.progress(overall_progress, text=progress_text)
-                
-                # Only show completed nodes (not running status)
-                if update.status == NodeStatus.COMPLETED:
-                    recent_updates.append(update)
-                    
-                    # Display completed nodes
-                    with details_container:
-                        details_container.empty()  # Clear previous updates
-                        for recent_update in recent_updates:
-                            st.success(f"✅ Completed: {recent_update.node_name}")
-            
-            # Register the callback
-            reporter.register_callback(update_callback)
-            
-            # Run the workflow
-            status.update(label=f"Processing {os.path.basename(doc)}...", state="running")
-            
+    worker = get_workflow_worker()
+    
+    reference_abs_path = os.path.abspath(reference_path)
+    views = [_create_document_view(doc) for doc in doc_paths]
+    
+    # The worker runs documents concurrently (DOCUMENT_PARALLEL) and is shared with
+    # other sessions; this run's events arrive on its own queue. Map job ids to views.
+    events: queue.Queue = queue.Queue()
+    jobs = {
+        worker.submit(_build_document_state(doc, reference_abs_path, rules_path), events): index
+        for index, doc in enumerate(doc_paths)
+    }
+    
+    def finish(index: int, result: Optional[Dict[str, Any]] = None, error: Optional[str] = None):
+        views[index][2]()
+        _finish_document_view(doc_paths[index], views[index][0], result, error)
+    
+    def fail_remaining(error: str):
+        for index in jobs.values():
+            finish(index, error=error)
+        jobs.clear()
+    
+    # Render events as they arrive; all Streamlit calls stay on this script thread
+    while jobs:
+        try:
+            event = events.get(timeout=0.2)
+        except queue.Empty:
+            if not worker.is_alive():
+                fail_remaining("Workflow worker exited unexpectedly")
+            continue
+        
+        kind, job_id, payload = event
+        if kind == "fatal":
+            fail_remaining(payload)
+            break
+        index = jobs.get(job_id)
+        if index is None:
+            continue
+        
+        if kind == "progress":
             try:
-                result = app.invoke(state)
-                status.update(label=f"✅ Completed: {os.path.basename(doc)}", state="complete", expanded=False)
-                
-                # Show summary
-                if 'rule_compliance_summary' in result:
-                    summary = result['rule_compliance_summary']
-                    score = summary.get('compliance_score', 0) * 100
-                    st.metric(
-                        label="Compliance Score",
-                        value=f"{score:.1f}%",
-                        delta=f"{summary.get('compliant', 0)} compliant, {summary.get('non_compliant', 0)} non-compliant"
-                    )
-            
+                views[index][1](payload)
             except Exception as e:
-                status.update(label=f"❌ Failed: {os.path.basename(doc)}", state="error")
-                st.error(f"Error processing document: {str(e)}")
-            
-            finally:
-                # Clear callbacks to avoid memory leaks
-                reporter.clear_callbacks()
+                print(f"Error in progress callback: {e}")
+        else:
+            del jobs[job_id]
+            if kind == "result":
+                finish(index, result=payload)
+            else:
+                finish(index, error=payload)
 
 
 def main():
@@ -525,9 +756,10 @@ def main():
             
             # Handle additional uploaded documents
             if additional_docs:
-                with tempfile.TemporaryDirectory() as tmpdir:
-                    additional_paths = [save_uploaded_file(f, tmpdir) for f in additional_docs]
-                    target_paths.extend(additional_paths)
+                upload_dir = get_session_upload_dir()
+                additional_paths = [save_uploaded_file(f, upload_dir) for f in additional_docs]
+                # Build a new list so the selection kept in session state is not extended
+                target_paths = target_paths + additional_paths
             
             # Convert paths to absolute paths
             reference_path = str(Path(_PROJECT_ROOT) / reference_path)
@@ -545,11 +777,11 @@ def main():
                 st.error("Please upload at least one target document and a reference document.")
                 return
             
-            with tempfile.TemporaryDirectory() as tmpdir:
-                # Save uploads
-                reference_path = save_uploaded_file(reference_doc, tmpdir)
-                rules_path = save_uploaded_file(rules_file, tmpdir) if rules_file else None
-                target_paths = [save_uploaded_file(f, tmpdir) for f in docs]
+            # Save uploads; they must outlive this block since the workflow reads them later
+            upload_dir = get_session_upload_dir()
+            reference_path = save_uploaded_file(reference_doc, upload_dir)
+            rules_path = save_uploaded_file(rules_file, upload_dir) if rules_file else None
+            target_paths = [save_uploaded_file(f, upload_dir) for f in docs]
         else:
             st.error("Please select a document set or upload custom documents.")
             return
@@ -558,18 +790,17 @@ def main():
         if clear_history:
             # Prefer resetting the template master to preserve headers
             try:
+                from utils.output_organizer import master_excel_lock
                 from utils.template_excel_writer import reset_master_template_excel
-                comparisons_dir = os.path.join(_PROJECT_ROOT, 'data', 'output', 'comparisons')
-                master_template = os.path.join(comparisons_dir, 'contract_analysis_template_master.xlsx')
-                reset_master_template_excel(master_template, preserve_headers=True)
+                with master_excel_lock(MASTER_PATH):
+                    reset_master_template_excel(MASTER_PATH, preserve_headers=True)
             except Exception:
                 # Fallback: delete files
-                comparisons_dir = os.path.join(_PROJECT_ROOT, 'data', 'output', 'comparisons')
                 for fname in [
                     'contract_analysis_template_master.xlsx',
                     'contract_analysis_master.xlsx'
                 ]:
-                    fpath = os.path.join(comparisons_dir, fname)
+                    fpath = os.path.join(COMPARISONS_DIR, fname)
                     try:
                         if os.path.exists(fpath):
                             os.remove(fpath)
@@ -586,29 +817,27 @@ def main():
         
         # Original analysis results
         with col1:
-            master_path = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'data', 'output', 'comparisons', 'contract_analysis_template_master.xlsx')
-            if os.path.exists(master_path):
-                with open(master_path, 'rb') as f:
-                    st.download_button(
-                        label="📊 Download Analysis Results",
-                        data=f.read(),
-                        file_name="contract_analysis_results.xlsx",
-                        mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-                    )
+            if os.path.exists(MASTER_PATH):
+                # Read the workbook only when the user actually clicks download
+                st.download_button(
+                    label="📊 Download Analysis Results",
+                    data=Path(MASTER_PATH).read_bytes,
+                    file_name="contract_analysis_results.xlsx",
+                    mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+                )
             else:
                 st.info("Analysis results not found yet.")
         
         # Rule compliance results
         with col2:
-            compliance_path = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'data', 'output', 'comparisons', 'rule_compliance_master.xlsx')
-            if os.path.exists(compliance_path):
-                with open(compliance_path, 'rb') as f:
-                    st.download_button(
-                        label="⚖️ Download Compliance Report",
-                        data=f.read(),
-                        file_name="rule_compliance_report.xlsx",
-                        mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-                    )
+            if os.path.exists(COMPLIANCE_PATH):
+                # Read the workbook only when the user actually clicks download
+                st.download_button(
+                    label="⚖️ Download Compliance Report",
+                    data=Path(COMPLIANCE_PATH).read_bytes,
+                    file_name="rule_compliance_report.xlsx",
+                    mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+                )
             else:
                 st.info("Compliance report not available (requires rules file).")
 
@@ -2,14 +2,28 @@
 Streamlit UI that uses backend API for processing
 """
 
+import io
 import streamlit as st
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from urllib3.connection import HTTPConnection
+from urllib3.util.request import ACCEPT_ENCODING
 import os
+import socket
 import time
 import tempfile
 from pathlib import Path
 import json
-from typing import Optional, List, Dict, Any
+import hashlib
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, List, Dict, Any, Tuple
+
+try:
+    from requests_toolbelt.multipart.encoder import MultipartEncoder
+    MULTIPART_ENCODER_AVAILABLE = True
+except ImportError:
+    MULTIPART_ENCODER_AVAILABLE = False
 
 # Get backend URL from environment
 BACKEND_URL = os.getenv('BACKEND_URL', 'http://legal-doc-backend:8080')
@@ -19,15 +33,109 @@ if not BACKEND_URL.startswith('http'):
 # For external testing
 EXTERNAL_BACKEND_URL = 'https://legal-doc-api-legal-doc-test.apps.cluster-f7p6w.f7p6w.sandbox2014.opentlc.com'
 
+# Pre-configured document sets; paths are on the backend's filesystem
+SAMPLE_SETS = {
+    "AI Services Addendum": {
+        "reference": "/app/sample_documents/standard_docs/ai_addendum/AI-Addendum.md",
+        "target": "/app/sample_documents/target_docs/ai_addendum/AI-Services-Addendum-for-Procurement-Contracts-Aug.pdf",
+        "description": "AI services contract analysis"
+    },
+    "Software License Agreement": {
+        "reference": "/app/sample_documents/standard_docs/software_license_agreement/Software-License-Agreement.md",
+        "target": "/app/sample_documents/target_docs/software_license_agreement/Form of Software License Agreement.pdf",
+        "description": "Software license review"
+    },
+    "Business Associate Agreement": {
+        "reference": "/app/sample_documents/standard_docs/baa/BAA.md",
+        "target": "/app/sample_documents/target_docs/baa/model-business-associate-agreement.pdf",
+        "description": "HIPAA BAA compliance check"
+    }
+}
+
+# Seconds a successful health probe is trusted before the backend is probed again
+BACKEND_HEALTH_TTL = 60
+
+# Result downloads are read from the socket in chunks of this size
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
+
+# (file_type, button label, file name, MIME type) for each result offered on completion
+RESULT_DOWNLOADS = (
+    ('excel', "📊 Download Excel Results", "analysis_results.xlsx",
+     "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"),
+    ('yaml', "📄 Download YAML Results", "analysis_results.yaml", "text/yaml"),
+    ('markdown', "📝 Download Report", "analysis_report.md", "text/markdown"),
+)
+
+# Only what the progress section renders is requested from the job status endpoint
+STATUS_HISTORY_LIMIT = 5
+STATUS_FIELDS = ('progress', 'current_node', 'current_message', 'llm_output', 'progress_history', 'error')
+
+# A repeated "Start Analysis" reuses a cached job only while it is in one of these
+# states; a finished job is never reused, so the same documents can be re-run
+REUSABLE_JOB_STATES = ('pending', 'running')
+# Backend job states after which the status no longer changes. check_job_status
+# reports transport failures as status 'error'; those are retried, not final
+FINISHED_JOB_STATES = ('failed', 'completed')
+
+# Uploads sent to the backend at once
+UPLOAD_MAX_WORKERS = 8
+# Read size when hashing an upload to check whether the backend already has it
+UPLOAD_HASH_CHUNK_SIZE = 1024 * 1024
+
+# Job polling backs off while the status is unchanged and resets when it moves;
+# the progress fragment ticks every POLL_INTERVAL_MIN and only polls when due
+POLL_INTERVAL_MIN = 1.0
+POLL_INTERVAL_MAX = 10.0
+POLL_BACKOFF_FACTOR = 1.5
+
+# (connect, read) timeout for backend API calls, so a stalled backend cannot hang a rerun
+REQUEST_TIMEOUT = (5, 60)
+
+# TCP keepalive probes detect dead pooled connections; idle/interval options are Linux-only
+KEEPALIVE_SOCKET_OPTIONS = HTTPConnection.default_socket_options + [(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)]
+if hasattr(socket, 'TCP_KEEPIDLE'):
+    KEEPALIVE_SOCKET_OPTIONS += [
+        (socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, 30),
+        (socket.IPPROTO_TCP, socket.TCP_KEEPINTVL, 10),
+    ]
+
+class KeepAliveAdapter(HTTPAdapter):
+    """HTTPAdapter whose pooled connections enable TCP keepalive"""
+    def init_poolmanager(self, *args, **kwargs):
+        kwargs['socket_options'] = KEEPALIVE_SOCKET_OPTIONS
+        super().init_poolmanager(*args, **kwargs)
+
+@st.cache_resource
+def get_http_session() -> requests.Session:
+    """Shared HTTP session so backend calls reuse pooled keep-alive connections across reruns"""
+    session = requests.Session()
+    # Advertise every encoding urllib3 can decode here (zstd/br when zstandard/brotli are installed)
+    session.headers['Accept-Encoding'] = ACCEPT_ENCODING
+    # Retries cover connection errors for every method; status retries only apply to idempotent ones
+    adapter = KeepAliveAdapter(
+        pool_connections=50,
+        pool_maxsize=50,
+        max_retries=Retry(total=3, backoff_factor=0.2, status_forcelist=[502, 503, 504])
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
 def check_backend_health() -> bool:
-    """Check if backend is healthy"""
+    """Check if backend is healthy; a successful probe is reused for BACKEND_HEALTH_TTL seconds"""
+    cached = st.session_state.get('backend_health')
+    if cached and time.time() < cached[1]:
+        st.session_state['backend_url'] = cached[0]
+        return True
+    
     try:
         # Try internal URL first, then external
         for url in [BACKEND_URL, EXTERNAL_BACKEND_URL]:
             try:
-                response = requests.get(f"{url}/health", timeout=5)
+                response = get_http_session().get(f"{url}/health", timeout=5)
                 if response.status_code == 200:
                     st.session_state['backend_url'] = url
+                    st.session_state['backend_health'] = (url, time.time() + BACKEND_HEALTH_TTL)
                     return True
             except:
                 continue
@@ -35,20 +143,77 @@ def check_backend_health() -> bool:
     except:
         return False
 
-def upload_file_to_backend(file, backend_url: str, document_type: str = "document") -> Optional[str]:
-    """Upload file to backend and return file path"""
+def _post_upload(session: requests.Session, file, backend_url: str, document_type: str) -> Tuple[Optional[str], Optional[str]]:
+    """Upload one file; returns (file_path, None) or (None, error message).
+    
+    A file the backend already stores (same content hash) is not sent again.
+    Makes no Streamlit calls, so it can run on worker threads.
+    """
     try:
-        files = {'file': (file.name, file.getvalue(), file.type)}
-        data = {'document_type': document_type}
-        response = requests.post(f"{backend_url}/api/upload", files=files, data=data)
+        file.seek(0)
+        digest = hashlib.sha256()
+        for chunk in iter(lambda: file.read(UPLOAD_HASH_CHUNK_SIZE), b''):
+            digest.update(chunk)
+        existing = session.get(
+            f"{backend_url}/api/upload/{digest.hexdigest()}",
+            params={'filename': file.name},
+            timeout=REQUEST_TIMEOUT
+        )
+        if existing.status_code == 200:
+            return existing.json()['file_path'], None
+        
+        # Send the uploaded file object itself rather than a getvalue() copy
+        file.seek(0)
+        if MULTIPART_ENCODER_AVAILABLE:
+            # Streams the multipart body from the file instead of building it in memory
+            encoder = MultipartEncoder(fields={
+                'file': (file.name, file, file.type),
+                'document_type': document_type
+            })
+            response = session.post(
+                f"{backend_url}/api/upload",
+                data=encoder,
+                headers={'Content-Type': encoder.content_type},
+                timeout=REQUEST_TIMEOUT
+            )
+        else:
+            files = {'file': (file.name, file, file.type)}
+            data = {'document_type': document_type}
+            response = session.post(
+                f"{backend_url}/api/upload",
+                files=files,
+                data=data,
+                timeout=REQUEST_TIMEOUT
+            )
         if response.status_code == 200:
-            return response.json()['file_path']
+            return response.json()['file_path'], None
         else:
-            st.error(f"Failed to upload {file.name}: {response.text}")
-            return None
+            return None, f"Failed to upload {file.name}: {response.text}"
     except Exception as e:
-        st.error(f"Error uploading {file.name}: {str(e)}")
-        return None
+        return None, f"Error uploading {file.name}: {str(e)}"
+
+def upload_file_to_backend(file, backend_url: str, document_type: str = "document") -> Optional[str]:
+    """Upload file to backend and return file path"""
+    file_path, error = _post_upload(get_http_session(), file, backend_url, document_type)
+    if error:
+        st.error(error)
+    return file_path
+
+def upload_files_to_backend(uploads: List[Tuple[Any, str]], backend_url: str) -> List[Optional[str]]:
+    """Upload (file, document_type) pairs concurrently; returns file paths in the same order"""
+    if not uploads:
+        return []
+    session = get_http_session()
+    with ThreadPoolExecutor(max_workers=min(UPLOAD_MAX_WORKERS, len(uploads))) as executor:
+        results = list(executor.map(
+            lambda upload: _post_upload(session, upload[0], backend_url, upload[1]),
+            uploads
+        ))
+    # Report failures from the script thread
+    for _, error in results:
+        if error:
+            st.error(error)
+    return [file_path for file_path, _ in results]
 
 def start_analysis(
     backend_url: str,
@@ -65,10 +230,11 @@ def start_analysis(
             "options": {}
         }
         
-        response = requests.post(
+        response = get_http_session().post(
             f"{backend_url}/api/analyze",
             json=payload,
-            headers={"Content-Type": "application/json"}
+            headers={"Content-Type": "application/json"},
+            timeout=REQUEST_TIMEOUT
         )
         
         if response.status_code == 200:
@@ -80,28 +246,195 @@ def start_analysis(
         st.error(f"Error starting analysis: {str(e)}")
         return None
 
+def analysis_job_key(reference_path: str, target_paths: List[str], rules_path: Optional[str]) -> str:
+    """Key identifying an analysis request by its inputs.
+    
+    Uploads are deduplicated by content hash, so re-uploading identical files
+    yields the same backend paths and therefore the same key.
+    """
+    payload = json.dumps([reference_path, sorted(target_paths), rules_path])
+    return hashlib.sha256(payload.encode()).hexdigest()
+
 def check_job_status(backend_url: str, job_id: str) -> Dict[str, Any]:
-    """Check job status"""
+    """Check job status; an unchanged status is served from the last response via its ETag"""
     try:
-        response = requests.get(f"{backend_url}/api/jobs/{job_id}")
+        # (job_id, etag, status) of the last full response
+        cached = st.session_state.get('job_status_cache')
+        headers = {}
+        if cached and cached[0] == job_id:
+            headers['If-None-Match'] = cached[1]
+        
+        response = get_http_session().get(
+            f"{backend_url}/api/jobs/{job_id}",
+            params={'history_limit': STATUS_HISTORY_LIMIT, 'fields': ','.join(STATUS_FIELDS)},
+            headers=headers,
+            timeout=REQUEST_TIMEOUT
+        )
+        if response.status_code == 304:
+            return cached[2]
         if response.status_code == 200:
-            return response.json()
+            status = response.json()
+            etag = response.headers.get('ETag')
+            if etag:
+                st.session_state['job_status_cache'] = (job_id, etag, status)
+            return status
         else:
             return {"status": "error", "error": response.text}
     except Exception as e:
         return {"status": "error", "error": str(e)}
 
-def download_results(backend_url: str, job_id: str, file_type: str) -> Optional[bytes]:
-    """Download results from backend"""
+def _fetch_result(session: requests.Session, backend_url: str, job_id: str, file_type: str) -> Optional[io.BytesIO]:
+    """Download one result file, streamed in chunks into a buffer; safe to run on worker threads"""
     try:
-        response = requests.get(f"{backend_url}/api/jobs/{job_id}/download/{file_type}")
-        if response.status_code == 200:
-            return response.content
-        else:
-            return None
+        with session.get(
+            f"{backend_url}/api/jobs/{job_id}/download/{file_type}",
+            stream=True,
+            timeout=REQUEST_TIMEOUT
+        ) as response:
+            if response.status_code != 200:
+                return None
+            buffer = io.BytesIO()
+            for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                buffer.write(chunk)
+        buffer.seek(0)
+        return buffer
     except:
         return None
 
+def download_results(backend_url: str, job_id: str, file_type: str) -> Optional[io.BytesIO]:
+    """Download results from backend"""
+    return _fetch_result(get_http_session(), backend_url, job_id, file_type)
+
+def download_all_results(backend_url: str, job_id: str, file_types: List[str]) -> Dict[str, Optional[io.BytesIO]]:
+    """Download several result files concurrently; kept per job since results no longer change"""
+    cached = st.session_state.get('job_downloads')
+    if cached and cached[0] == job_id:
+        return cached[1]
+    
+    session = get_http_session()
+    with ThreadPoolExecutor(max_workers=len(file_types)) as executor:
+        buffers = executor.map(
+            lambda file_type: _fetch_result(session, backend_url, job_id, file_type),
+            file_types
+        )
+        downloads = dict(zip(file_types, buffers))
+    # Retry missing files on the next rerun rather than remembering the failure
+    if all(buffer is not None for buffer in downloads.values()):
+        st.session_state['job_downloads'] = (job_id, downloads)
+    return downloads
+
+def poll_job_status(backend_url: str, job_id: str) -> Optional[Dict[str, Any]]:
+    """Last status reported by the backend, refetched only once the current poll interval has elapsed.
+    
+    A failed request is not cached as the job's status: its message is kept in
+    job_poll['transport_error'] and the request is retried after the backoff.
+    Returns None until the backend has answered once.
+    """
+    poll = st.session_state.get('job_poll')
+    if poll and poll['job_id'] != job_id:
+        poll = None
+    if poll and poll['status'] is not None:
+        # A finished job's status no longer changes
+        if st.session_state.get('finished_job_id') == job_id or time.time() < poll['next_poll']:
+            return poll['status']
+    elif poll and time.time() < poll['next_poll']:
+        return None
+    
+    status = check_job_status(backend_url, job_id)
+    
+    if status['status'] == 'error':
+        # Transport failure: keep the last real status and retry after backing off
+        poll_interval = min(poll['interval'] * POLL_BACKOFF_FACTOR, POLL_INTERVAL_MAX) if poll else POLL_INTERVAL_MIN
+        st.session_state['job_poll'] = {
+            'job_id': job_id,
+            'status': poll['status'] if poll else None,
+            'snapshot': poll['snapshot'] if poll else None,
+            'transport_error': status.get('error') or 'Unknown error',
+            'interval': poll_interval,
+            'next_poll': time.time() + poll_interval
+        }
+        return st.session_state['job_poll']['status']
+    
+    # Poll quickly while the job is moving, back off while it is idle
+    snapshot = (
+        status['status'],
+        status.get('progress'),
+        status.get('current_node'),
+        status.get('current_message'),
+        len(status.get('progress_history') or [])
+    )
+    if poll and poll['snapshot'] == snapshot:
+        poll_interval = min(poll['interval'] * POLL_BACKOFF_FACTOR, POLL_INTERVAL_MAX)
+    else:
+        poll_interval = POLL_INTERVAL_MIN
+    st.session_state['job_poll'] = {
+        'job_id': job_id,
+        'status': status,
+        'snapshot': snapshot,
+        'transport_error': None,
+        'interval': poll_interval,
+        'next_poll': time.time() + poll_interval
+    }
+    return status
+
+def render_job_progress(backend_url: str, job_id: str):
+    """Render the progress section for one job; main() runs this as an auto-refreshing fragment"""
+    status = poll_job_status(backend_url, job_id)
+    
+    transport_error = st.session_state['job_poll']['transport_error']
+    if transport_error:
+        st.warning(f"Could not reach the backend, retrying: {transport_error}")
+    if status is None:
+        return
+    
+    if status['status'] in FINISHED_JOB_STATES:
+        if st.session_state.get('finished_job_id') != job_id:
+            # Rerun the whole app once so the fragment is recreated without its timer
+            st.session_state['finished_job_id'] = job_id
+            st.rerun()
+    
+    if status['status'] == 'failed':
+        st.error(f"Analysis failed: {status.get('error', 'Unknown error')}")
+    elif status['status'] == 'completed':
+        st.success("✅ Analysis completed!")
+        
+        # Download buttons
+        downloads = download_all_results(backend_url, job_id, [download[0] for download in RESULT_DOWNLOADS])
+        for column, (file_type, label, file_name, mime) in zip(st.columns(len(RESULT_DOWNLOADS)), RESULT_DOWNLOADS):
+            with column:
+                data = downloads[file_type]
+                if data:
+                    st.download_button(label=label, data=data, file_name=file_name, mime=mime)
+    else:
+        # Show progress bar
+        progress = status.get('progress', 0.0)
+        st.progress(progress, text=f"Overall Progress: {int(progress * 100)}%")
+        
+        # Show current status as one element whose label changes, not a rebuilt column layout
+        current_node = status.get('current_node', 'Unknown')
+        current_message = status.get('current_message', '')
+        st.status(
+            f"{status['status'].upper()} · **{current_node}**: {current_message}",
+            state="running",
+            expanded=False
+        )
+        
+        # Show LLM output if available
+        llm_output = status.get('llm_output')
+        if llm_output:
+            with st.expander("🤖 LLM Output", expanded=True):
+                st.code(llm_output, language="text")
+        
+        # Show progress history
+        history = status.get('progress_history', [])
+        if history:
+            with st.expander("📜 Progress History", expanded=False):
+                for entry in history[-STATUS_HISTORY_LIMIT:]:
+                    timestamp = entry.get('timestamp', '')
+                    node = entry.get('node', '')
+                    message = entry.get('message', '')
+                    st.text(f"[{timestamp.split('T')[1][:8] if timestamp else ''}] {node}: {message}")
+
 def main():
     st.set_page_config(
         page_title="Legal Document Analysis",
@@ -127,26 +460,8 @@ def main():
     with st.expander("📚 Load Sample Documents"):
         st.write("Choose a pre-configured document set for testing:")
         
-        sample_sets = {
-            "AI Services Addendum": {
-                "reference": "/app/sample_documents/standard_docs/ai_addendum/AI-Addendum.md",
-                "target": "/app/sample_documents/target_docs/ai_addendum/AI-Services-Addendum-for-Procurement-Contracts-Aug.pdf",
-                "description": "AI services contract analysis"
-            },
-            "Software License Agreement": {
-                "reference": "/app/sample_documents/standard_docs/software_license_agreement/Software-License-Agreement.md",
-                "target": "/app/sample_documents/target_docs/software_license_agreement/Form of Software License Agreement.pdf",
-                "description": "Software license review"
-            },
-            "Business Associate Agreement": {
-                "reference": "/app/sample_documents/standard_docs/baa/BAA.md",
-                "target": "/app/sample_documents/target_docs/baa/model-business-associate-agreement.pdf",
-                "description": "HIPAA BAA compliance check"
-            }
-        }
-        
-        cols = st.columns(len(sample_sets))
-        for idx, (name, info) in enumerate(sample_sets.items()):
+        cols = st.columns(len(SAMPLE_SETS))
+        for idx, (name, info) in enumerate(SAMPLE_SETS.items()):
             with cols[idx]:
                 if st.button(name, key=f"sample_{idx}", use_container_width=True):
                     st.session_state['use_sample'] = True
@@ -211,35 +526,50 @@ def main():
             st.stop()
         else:
             with st.spinner("Uploading files..."):
-                # Upload files
-                reference_path = upload_file_to_backend(reference_file, backend_url, "reference")
+                # Upload all files at once over the pooled session
+                uploads = [(reference_file, "reference")]
+                uploads += [(target_file, "target") for target_file in target_files]
+                if rules_file:
+                    uploads.append((rules_file, "rules"))
+                uploaded_paths = upload_files_to_backend(uploads, backend_url)
+                
+                reference_path = uploaded_paths[0]
                 if not reference_path:
                     st.stop()
                 
-                target_paths = []
-                for target_file in target_files:
-                    path = upload_file_to_backend(target_file, backend_url, "target")
-                    if path:
-                        target_paths.append(path)
+                target_paths = [path for path in uploaded_paths[1:1 + len(target_files)] if path]
                 
-                rules_path = None
-                if rules_file:
-                    rules_path = upload_file_to_backend(rules_file, backend_url, "rules")
+                rules_path = uploaded_paths[-1] if rules_file else None
         
         # Start analysis (for both sample and uploaded documents)
         if reference_path and target_paths:
-            with st.spinner("Starting analysis..."):
-                job_id = start_analysis(backend_url, reference_path, target_paths, rules_path)
+            # Re-clicking with the same inputs reuses the job still running for them
+            job_cache = st.session_state.setdefault('job_cache', {})
+            job_key = analysis_job_key(reference_path, target_paths, rules_path)
+            job_id = job_cache.get(job_key)
+            if job_id and check_job_status(backend_url, job_id)['status'] not in REUSABLE_JOB_STATES:
+                job_id = None
+            
+            if job_id:
+                st.info(f"Analysis already started for these documents. Job ID: {job_id}")
+            else:
+                with st.spinner("Starting analysis..."):
+                    job_id = start_analysis(backend_url, reference_path, target_paths, rules_path)
                 
                 if job_id:
                     st.success(f"Analysis started! Job ID: {job_id}")
-                    st.session_state['current_job_id'] = job_id
-                    # Clear sample flag after use
-                    if 'use_sample' in st.session_state:
-                        del st.session_state['use_sample']
+                    job_cache[job_key] = job_id
                 else:
                     st.error("Failed to start analysis")
                     st.stop()
+            
+            st.session_state['current_job_id'] = job_id
+            # A reused job is still running, so make sure its progress section polls again
+            if st.session_state.get('finished_job_id') == job_id:
+                del st.session_state['finished_job_id']
+            # Clear sample flag after use
+            if 'use_sample' in st.session_state:
+                del st.session_state['use_sample']
     
     # Job monitoring section
     if 'current_job_id' in st.session_state:
@@ -247,92 +577,9 @@ def main():
         
         job_id = st.session_state['current_job_id']
         
-        # Create placeholders for different sections
-        progress_placeholder = st.empty()
-        status_placeholder = st.empty()
-        llm_output_placeholder = st.empty()
-        history_placeholder = st.empty()
-        result_placeholder = st.empty()
-        
-        # Poll for status
-        while True:
-            status = check_job_status(backend_url, job_id)
-            
-            if status['status'] == 'error':
-                status_placeholder.error(f"Error: {status.get('error', 'Unknown error')}")
-                break
-            elif status['status'] == 'failed':
-                status_placeholder.error(f"Analysis failed: {status.get('error', 'Unknown error')}")
-                break
-            elif status['status'] == 'completed':
-                with result_placeholder.container():
-                    st.success("✅ Analysis completed!")
-                    
-                    # Download buttons
-                    col1, col2, col3 = st.columns(3)
-                    
-                    with col1:
-                        excel_data = download_results(backend_url, job_id, 'excel')
-                        if excel_data:
-                            st.download_button(
-                                label="📊 Download Excel Results",
-                                data=excel_data,
-                                file_name="analysis_results.xlsx",
-                                mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
-                            )
-                    
-                    with col2:
-                        yaml_data = download_results(backend_url, job_id, 'yaml')
-                        if yaml_data:
-                            st.download_button(
-                                label="📄 Download YAML Results",
-                                data=yaml_data,
-                                file_name="analysis_results.yaml",
-                                mime="text/yaml"
-                            )
-                    
-                    with col3:
-                        md_data = download_results(backend_url, job_id, 'markdown')
-                        if md_data:
-                            st.download_button(
-                                label="📝 Download Report",
-                                data=md_data,
-                                file_name="analysis_report.md",
-                                mime="text/markdown"
-                            )
-                break
-            else:
-                # Show progress bar
-                progress = status.get('progress', 0.0)
-                progress_placeholder.progress(progress, text=f"Overall Progress: {int(progress * 100)}%")
-                
-                # Show current status
-                with status_placeholder.container():
-                    col1, col2 = st.columns([1, 3])
-                    with col1:
-                        st.metric("Status", status['status'].upper())
-                    with col2:
-                        current_node = status.get('current_node', 'Unknown')
-                        current_message = status.get('current_message', '')
-                        st.info(f"**{current_node}**: {current_message}")
-                
-                # Show LLM output if available
-                llm_output = status.get('llm_output')
-                if llm_output:
-                    with llm_output_placeholder.expander("🤖 LLM Output", expanded=True):
-                        st.code(llm_output, language="text")
-                
-                # Show progress history
-                history = status.get('progress_history', [])
-                if history:
-                    with history_placeholder.expander("📜 Progress History", expanded=False):
-                        for entry in history[-5:]:  # Show last 5 entries
-                            timestamp = entry.get('timestamp', '')
-                            node = entry.get('node', '')
-                            message = entry.get('message', '')
-                            st.text(f"[{timestamp.split('T')[1][:8] if timestamp else ''}] {node}: {message}")
-                
-                time.sleep(1)  # Poll every second for more responsive updates
+        # Poll and redraw only the progress section; the timer stops once the job finished
+        job_active = st.session_state.get('finished_job_id') != job_id
+        st.fragment(run_every=POLL_INTERVAL_MIN if job_active else None)(render_job_progress)(backend_url, job_id)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
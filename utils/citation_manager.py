@@ -3,16 +3,49 @@ Citation Manager
 Handles citation extraction, validation, and formatting with page anchors
 """
 
+import os
 import re
+from bisect import bisect_right
+from collections import Counter, defaultdict
+from itertools import chain
 from typing import List, Dict, Any, Optional, Tuple
 from dataclasses import dataclass, field
 import logging
 from difflib import SequenceMatcher
 
+from utils.edit_distance import substring_edit_distances
+from utils.json_io import dumps_json
+
+try:
+    from rapidfuzz import fuzz, process
+    RAPIDFUZZ_AVAILABLE = True
+except ImportError:
+    fuzz = None
+    process = None
+    RAPIDFUZZ_AVAILABLE = False
+
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    ahocorasick = None
+    AHOCORASICK_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+# Lookups remembered per document before the table is reset
+FIND_CACHE_SIZE = 4096
+
+# Minimum similarity for a fuzzy citation match
+FUZZY_THRESHOLD = 0.8
+
+_QUOTE_RE = re.compile(r'"([^"]+)"')
+_ANCHOR_RE = re.compile(r'([^"]+)\s*\[\[page=(\d+)\]\]')
+_TEXT_ANCHOR_RE = re.compile(r'([^[]+)\s*\[\[page=(\d+)\]\]')
+_PAGE_ANCHOR_RE = re.compile(r'\[\[page=(\d+)\]\]')
+
 
-@dataclass
+@dataclass(slots=True)
 class Citation:
     """Represents a citation with page anchor"""
     text: str
@@ -20,7 +53,8 @@ class Citation:
     start_char: int
     end_char: int
     confidence: float = 1.0
-    metadata: Dict[str, Any] = field(default_factory=dict)
+    # None rather than a per-instance empty dict; most citations carry no metadata
+    metadata: Optional[Dict[str, Any]] = None
     
     @property
     def anchor(self) -> str:
@@ -45,11 +79,11 @@ class Citation:
                 "end": self.end_char
             },
             "confidence": self.confidence,
-            "metadata": self.metadata
+            "metadata": self.metadata or {}
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class CitationValidation:
     """Result of citation validation"""
     is_valid: bool
@@ -63,12 +97,18 @@ class CitationManager:
     
     def __init__(self):
         """Initialize citation manager"""
-        self.page_anchor_pattern = re.compile(r'\[\[page=(\d+)\]\]')
+        self.page_anchor_pattern = _PAGE_ANCHOR_RE
         self.stats = {
             "citations_extracted": 0,
             "citations_validated": 0,
             "validation_failures": 0
         }
+        # (page_map, its length, breakpoints) for the last page map seen
+        self._page_breakpoints_cache = None
+        # (document, document.lower()) for the last document lowercased
+        self._document_lower_cache = None
+        # (document, {(text, hint_position, fuzzy): location}) for the last document searched
+        self._find_cache = None
     
     def extract_citations(
         self,
@@ -76,7 +116,8 @@ class CitationManager:
         document_text: str,
         page_map: Optional[Dict[int, int]] = None,
         min_length: int = 20,
-        max_length: int = 500
+        max_length: int = 500,
+        total_pages: Optional[int] = None
     ) -> List[Citation]:
         """
         Extract citations from text
@@ -87,33 +128,38 @@ class CitationManager:
             page_map: Mapping of character position to page
             min_length: Minimum citation length
             max_length: Maximum citation length
+            total_pages: Page count, used to estimate pages when page_map is missing
             
         Returns:
             List of extracted citations
         """
         citations = []
+        # Shared by every case-insensitive lookup below
+        document_lower = self._lower_document(document_text)
         
-        # Extract quoted text
-        quote_pattern = re.compile(r'"([^"]+)"')
+        # Extract quoted text within the length constraints
+        quotes = [
+            match.group(1) for match in _QUOTE_RE.finditer(text)
+            if min_length <= len(match.group(1)) <= max_length
+        ]
         
-        for match in quote_pattern.finditer(text):
-            quoted_text = match.group(1)
-            
-            # Check length constraints
-            if len(quoted_text) < min_length or len(quoted_text) > max_length:
-                continue
-            
+        # Locate every quote in one scan of the document
+        text_index = self.build_text_index(quotes, document_text, document_lower)
+        
+        for quoted_text in quotes:
             # Find in document
-            location = self._find_in_document(quoted_text, document_text)
+            location = self._find_in_document(
+                quoted_text,
+                document_text,
+                text_index=text_index,
+                document_lower=document_lower
+            )
             
             if location:
                 start, end = location
                 
                 # Get page number
-                if page_map and start in page_map:
-                    page = page_map[start]
-                else:
-                    page = self._estimate_page(start, len(document_text))
+                page = self._resolve_page(page_map, start, len(document_text), total_pages)
                 
                 citation = Citation(
                     text=quoted_text,
@@ -127,9 +173,7 @@ class CitationManager:
                 self.stats["citations_extracted"] += 1
         
         # Also look for text with page anchors already
-        anchor_pattern = re.compile(r'([^"]+)\s*\[\[page=(\d+)\]\]')
-        
-        for match in anchor_pattern.finditer(text):
+        for match in _ANCHOR_RE.finditer(text):
             citation_text = match.group(1).strip()
             page = int(match.group(2))
             
@@ -137,7 +181,7 @@ class CitationManager:
                 continue
             
             # Find in document
-            location = self._find_in_document(citation_text, document_text)
+            location = self._find_in_document(citation_text, document_text, document_lower=document_lower)
             
             if location:
                 start, end = location
@@ -160,7 +204,8 @@ class CitationManager:
         text: str,
         document_text: str,
         hint_position: Optional[int] = None,
-        page_map: Optional[Dict[int, int]] = None
+        page_map: Optional[Dict[int, int]] = None,
+        total_pages: Optional[int] = None
     ) -> Optional[Citation]:
         """
         Create a citation from text
@@ -170,6 +215,7 @@ class CitationManager:
             document_text: Original document
             hint_position: Hint for where to look
             page_map: Page mapping
+            total_pages: Page count, used to estimate the page when page_map is missing
             
         Returns:
             Citation or None if not found
@@ -183,10 +229,7 @@ class CitationManager:
         start, end = location
         
         # Get page
-        if page_map and start in page_map:
-            page = page_map[start]
-        else:
-            page = self._estimate_page(start, len(document_text))
+        page = self._resolve_page(page_map, start, len(document_text), total_pages)
         
         return Citation(
             text=text,
@@ -200,7 +243,9 @@ class CitationManager:
         citation: Citation,
         document_text: str,
         page_map: Optional[Dict[int, int]] = None,
-        require_exact: bool = True
+        require_exact: bool = True,
+        text_index: Optional[Dict[str, Optional[Tuple[int, int]]]] = None,
+        document_lower: Optional[str] = None
     ) -> CitationValidation:
         """
         Validate a citation against document
@@ -210,6 +255,8 @@ class CitationManager:
             document_text: Original document
             page_map: Page mapping
             require_exact: Require exact match
+            text_index: Exact locations from build_text_index for this document
+            document_lower: document_text.lower(), when the caller already has it
             
         Returns:
             Validation result
@@ -220,7 +267,9 @@ class CitationManager:
         location = self._find_in_document(
             citation.text,
             document_text,
-            fuzzy=not require_exact
+            fuzzy=not require_exact,
+            text_index=text_index,
+            document_lower=document_lower
         )
         
         if not location:
@@ -231,8 +280,8 @@ class CitationManager:
             start, end = location
             
             # Verify page number if we have page map
-            if page_map and start in page_map:
-                actual_page = page_map[start]
+            actual_page = self._lookup_page(page_map, start)
+            if actual_page is not None:
                 if actual_page != citation.page:
                     validation.warnings.append(
                         f"Page mismatch: cited page {citation.page}, actual page {actual_page}"
@@ -248,8 +297,8 @@ class CitationManager:
             else:
                 validation.match_score = 0.8  # Fuzzy match
         
-        # Validate page anchor format
-        if not re.match(r'^\[\[page=\d+\]\]$', citation.anchor):
+        # The anchor is rendered from page, so it is well-formed whenever page is
+        if not (isinstance(citation.page, int) and citation.page >= 0):
             validation.errors.append(f"Invalid anchor format: {citation.anchor}")
             validation.is_valid = False
         
@@ -281,10 +330,8 @@ class CitationManager:
         
         if group_by_page:
             # Group by page number
-            by_page = {}
+            by_page = defaultdict(list)
             for citation in citations:
-                if citation.page not in by_page:
-                    by_page[citation.page] = []
                 by_page[citation.page].append(citation)
             
             # Sort by page
@@ -293,29 +340,20 @@ class CitationManager:
             sorted_pages = None
         
         if style == "markdown":
-            lines = []
-            
             if group_by_page and sorted_pages:
-                for page in sorted_pages:
-                    lines.append(f"\n**Page {page}:**")
-                    for citation in by_page[page]:
-                        lines.append(f"- {citation.format()}")
-            else:
-                for citation in citations:
-                    lines.append(f"- {citation.format()}")
-            
-            return "\n".join(lines)
+                return "\n".join(chain.from_iterable(
+                    (f"\n**Page {page}:**", *(f"- {citation.format()}" for citation in by_page[page]))
+                    for page in sorted_pages
+                ))
+            return "\n".join(f"- {citation.format()}" for citation in citations)
         
         elif style == "json":
-            import json
-            citations_data = [c.to_dict() for c in citations]
-            return json.dumps(citations_data, indent=2)
+            return dumps_json([c.to_dict() for c in citations])
         
         else:  # text
-            lines = []
-            for i, citation in enumerate(citations, 1):
-                lines.append(f"{i}. {citation.format()}")
-            return "\n".join(lines)
+            return "\n".join(
+                f"{i}. {citation.format()}" for i, citation in enumerate(citations, 1)
+            )
     
     def extract_page_anchors(self, text: str) -> List[Tuple[str, int]]:
         """
@@ -330,9 +368,7 @@ class CitationManager:
         results = []
         
         # Pattern for text with anchor
-        pattern = re.compile(r'([^[]+)\s*\[\[page=(\d+)\]\]')
-        
-        for match in pattern.finditer(text):
+        for match in _TEXT_ANCHOR_RE.finditer(text):
             text_part = match.group(1).strip()
             page = int(match.group(2))
             results.append((text_part, page))
@@ -363,12 +399,22 @@ class CitationManager:
         if sentences:
             annotated = []
             current_pos = 0
+            text_length = len(text)
             
             for sentence in sentences:
-                # Find sentence in text
-                sentence_pos = text.find(sentence, current_pos)
+                # Sentences usually follow on after whitespace; check there before searching
+                next_pos = current_pos
+                while next_pos < text_length and text[next_pos].isspace():
+                    next_pos += 1
+                if sentence and not sentence[0].isspace() and text.startswith(sentence, next_pos):
+                    sentence_pos = next_pos
+                else:
+                    # Find sentence in text
+                    sentence_pos = text.find(sentence, current_pos)
                 if sentence_pos >= 0:
-                    page = page_map.get(sentence_pos, 1)
+                    page = self._lookup_page(page_map, sentence_pos)
+                    if page is None:
+                        page = 1
                     annotated.append(f"{sentence} [[page={page}]]")
                     current_pos = sentence_pos + len(sentence)
                 else:
@@ -378,18 +424,74 @@ class CitationManager:
         
         else:
             # Add anchor at end with dominant page
-            pages = list(page_map.values())
-            if pages:
-                most_common_page = max(set(pages), key=pages.count)
-                return f"{text} [[page={most_common_page}]]"
-            return text
+            most_common_page = Counter(page_map.values()).most_common(1)[0][0]
+            return f"{text} [[page={most_common_page}]]"
+    
+    def build_text_index(
+        self,
+        texts: List[str],
+        document: str,
+        document_lower: Optional[str] = None
+    ) -> Dict[str, Optional[Tuple[int, int]]]:
+        """
+        Locate many texts in one document in a single pass per case variant
+        
+        Uses an Aho-Corasick automaton when pyahocorasick is installed; otherwise
+        returns an empty index and lookups fall back to str.find.
+        
+        Args:
+            texts: Texts to locate
+            document: Document to search
+            document_lower: document.lower(), when the caller already has it
+            
+        Returns:
+            Text to first exact (else case-insensitive) (start, end), or None if neither matched
+        """
+        unique_texts = {text for text in texts if text}
+        if not AHOCORASICK_AVAILABLE or not unique_texts:
+            return {}
+        
+        index = {}
+        
+        # Case-sensitive pass; matches arrive in end order, so the first hit is str.find's
+        automaton = ahocorasick.Automaton()
+        for text in unique_texts:
+            automaton.add_word(text, text)
+        automaton.make_automaton()
+        for end, text in automaton.iter(document):
+            if text not in index:
+                start = end - len(text) + 1
+                index[text] = (start, start + len(text))
+        
+        # Case-insensitive pass for the rest
+        remaining = unique_texts - index.keys()
+        if remaining:
+            automaton = ahocorasick.Automaton()
+            patterns = {}
+            for text in remaining:
+                patterns.setdefault(text.lower(), []).append(text)
+            for pattern in patterns:
+                automaton.add_word(pattern, pattern)
+            automaton.make_automaton()
+            if document_lower is None:
+                document_lower = self._lower_document(document)
+            for end, pattern in automaton.iter(document_lower):
+                start = end - len(pattern) + 1
+                for text in patterns.pop(pattern, []):
+                    index[text] = (start, start + len(text))
+        
+        for text in unique_texts - index.keys():
+            index[text] = None
+        return index
     
     def _find_in_document(
         self,
         text: str,
         document: str,
         hint_position: Optional[int] = None,
-        fuzzy: bool = False
+        fuzzy: bool = False,
+        text_index: Optional[Dict[str, Optional[Tuple[int, int]]]] = None,
+        document_lower: Optional[str] = None
     ) -> Optional[Tuple[int, int]]:
         """
         Find text in document
@@ -399,10 +501,95 @@ class CitationManager:
             document: Document to search
             hint_position: Hint for search position
             fuzzy: Allow fuzzy matching
+            text_index: Exact locations from build_text_index for this document
+            document_lower: document.lower(); computed here only if needed and not given
             
         Returns:
             (start, end) positions or None
         """
+        locations = self._document_locations(document)
+        key = (text, hint_position, fuzzy)
+        if key in locations:
+            return locations[key]
+        
+        location = self._search_document(
+            text,
+            document,
+            hint_position,
+            fuzzy,
+            text_index=text_index,
+            document_lower=document_lower
+        )
+        if len(locations) >= FIND_CACHE_SIZE:
+            locations.clear()
+        locations[key] = location
+        return location
+    
+    def _document_locations(self, document: str) -> Dict[Tuple[str, Optional[int], bool], Optional[Tuple[int, int]]]:
+        """_find_in_document's lookup table for document, replacing any other document's"""
+        # Keyed on the document object itself (held, so it cannot be recycled)
+        cache = self._find_cache
+        if cache is None or cache[0] is not document:
+            cache = (document, {})
+            self._find_cache = cache
+        return cache[1]
+    
+    def screen_fuzzy_misses(
+        self,
+        texts: List[str],
+        document: str,
+        document_lower: Optional[str] = None
+    ) -> None:
+        """
+        Record which texts cannot fuzzy-match document, scoring them all at once
+        
+        Scores every text with rapidfuzz's process.cdist, which runs natively across
+        all cores. Texts below the fuzzy threshold are remembered as not found, so
+        fuzzy lookups for them skip the search. No-op without rapidfuzz or on a
+        single core.
+        
+        Args:
+            texts: Texts that will be looked up with fuzzy matching
+            document: Document to search
+            document_lower: document.lower(), when the caller already has it
+        """
+        unique_texts = list({text for text in texts if text})
+        # On one core the screen only repeats work the lookups do anyway
+        if not RAPIDFUZZ_AVAILABLE or len(unique_texts) < 2 or (os.cpu_count() or 1) < 2:
+            return
+        if document_lower is None:
+            document_lower = self._lower_document(document)
+        
+        # Same scorer and cutoff as _fuzzy_find; scores below the cutoff come back as 0
+        scores = process.cdist(
+            [text.lower() for text in unique_texts],
+            [document_lower],
+            scorer=fuzz.partial_ratio,
+            score_cutoff=FUZZY_THRESHOLD * 100,
+            workers=-1
+        )
+        
+        locations = self._document_locations(document)
+        for text, score in zip(unique_texts, scores[:, 0]):
+            if score == 0:
+                locations[(text, None, True)] = None
+    
+    def _search_document(
+        self,
+        text: str,
+        document: str,
+        hint_position: Optional[int] = None,
+        fuzzy: bool = False,
+        text_index: Optional[Dict[str, Optional[Tuple[int, int]]]] = None,
+        document_lower: Optional[str] = None
+    ) -> Optional[Tuple[int, int]]:
+        """_find_in_document without the per-document lookup cache"""
+        if hint_position is None and text_index is not None and text in text_index:
+            location = text_index[text]
+            if location is not None or not fuzzy:
+                return location
+            return self._fuzzy_find(text, document, document_lower=document_lower)
+        
         # Try exact match first
         if hint_position is not None:
             # Search near hint
@@ -421,13 +608,15 @@ class CitationManager:
             return (pos, pos + len(text))
         
         # Try case-insensitive
-        pos = document.lower().find(text.lower())
+        if document_lower is None:
+            document_lower = self._lower_document(document)
+        pos = document_lower.find(text.lower())
         if pos >= 0:
             return (pos, pos + len(text))
         
         # Try fuzzy matching if allowed
         if fuzzy:
-            return self._fuzzy_find(text, document)
+            return self._fuzzy_find(text, document, document_lower=document_lower)
         
         return None
     
@@ -435,7 +624,8 @@ class CitationManager:
         self,
         text: str,
         document: str,
-        threshold: float = 0.8
+        threshold: float = FUZZY_THRESHOLD,
+        document_lower: Optional[str] = None
     ) -> Optional[Tuple[int, int]]:
         """
         Fuzzy find text in document
@@ -444,18 +634,53 @@ class CitationManager:
             text: Text to find
             document: Document to search
             threshold: Similarity threshold
+            document_lower: document.lower(), when the caller already has it
             
         Returns:
             (start, end) positions or None
         """
+        if document_lower is None:
+            document_lower = self._lower_document(document)
+        
+        if RAPIDFUZZ_AVAILABLE:
+            # Best-aligned substring in one native call instead of a Python sliding window
+            alignment = fuzz.partial_ratio_alignment(
+                text.lower(),
+                document_lower,
+                score_cutoff=threshold * 100
+            )
+            if alignment is None or alignment.score < threshold * 100:
+                return None
+            return (alignment.dest_start, alignment.dest_end)
+        
         text_len = len(text)
         best_match = None
         best_score = 0
         
+        # Lowercase once, not once per window
+        text_lower = text.lower()
+        
+        # A window scoring ratio r shares at least r * text_len characters with text,
+        # so its edit distance is at most 2 * text_len * (1 - r); skip windows whose
+        # best alignment ending at the same position is already further than that
+        max_distance = int(2 * text_len * (1 - threshold) + 1e-9)
+        distances = substring_edit_distances(text_lower, document_lower)
+        
+        # SequenceMatcher indexes seq2, so the fixed text goes there and is indexed once
+        matcher = SequenceMatcher(None, autojunk=False)
+        matcher.set_seq2(text_lower)
+        
         # Slide window through document
-        for i in range(len(document) - text_len + 1):
-            window = document[i:i + text_len]
-            score = self._calculate_similarity(text, window)
+        for i in range(len(document_lower) - text_len + 1):
+            if distances[i + text_len - 1] > max_distance:
+                continue
+            window = document_lower[i:i + text_len]
+            if window == text_lower:
+                score = 1.0
+            else:
+                matcher.set_seq1(window)
+                # Windows that cannot beat the current best are pruned, not scored
+                score = self._matcher_ratio(matcher, max(threshold, best_score))
             
             if score > best_score and score >= threshold:
                 best_score = score
@@ -465,10 +690,102 @@ class CitationManager:
     
     def _calculate_similarity(self, text1: str, text2: str) -> float:
         """Calculate similarity between two texts"""
-        return SequenceMatcher(None, text1.lower(), text2.lower()).ratio()
+        # Exact citations are the common case; SequenceMatcher does not short-circuit them
+        if text1 == text2:
+            return 1.0
+        return self._lowered_similarity(text1.lower(), text2.lower())
     
-    def _estimate_page(self, position: int, doc_length: int) -> int:
+    def _lowered_similarity(self, a: str, b: str, cutoff: float = 0.0) -> float:
+        """
+        Similarity of two already-lowercased texts
+        
+        Args:
+            a: First text
+            b: Second text
+            cutoff: Scores below this may be reported as 0.0 without being computed
+            
+        Returns:
+            Similarity between 0.0 and 1.0
+        """
+        if a == b:
+            return 1.0
+        if RAPIDFUZZ_AVAILABLE:
+            return fuzz.ratio(a, b, score_cutoff=cutoff * 100) / 100.0
+        # autojunk would drop frequent characters from texts over 200 chars
+        return self._matcher_ratio(SequenceMatcher(None, a, b, autojunk=False), cutoff)
+    
+    @staticmethod
+    def _matcher_ratio(matcher: SequenceMatcher, cutoff: float = 0.0) -> float:
+        """matcher.ratio(), or 0.0 when its cheap upper bounds are already below cutoff"""
+        if cutoff > 0 and (matcher.real_quick_ratio() < cutoff or matcher.quick_ratio() < cutoff):
+            return 0.0
+        return matcher.ratio()
+    
+    def _lower_document(self, document: str) -> str:
+        """
+        document.lower(), reused while the same document string is passed in
+        
+        Per-citation callers (validate_citation, create_citation) run in loops over
+        one document; without this each case-insensitive miss lowercases all of it.
+        """
+        cached = self._document_lower_cache
+        if cached is not None and cached[0] is document:
+            return cached[1]
+        document_lower = document.lower()
+        self._document_lower_cache = (document, document_lower)
+        return document_lower
+    
+    def _page_breakpoints(self, page_map: Dict[int, int]) -> Tuple[List[int], List[int]]:
+        """
+        Sorted positions where the page changes, and the page starting at each
+        
+        Callers pass the same (often one-entry-per-character) map for every
+        citation of a document, so the last conversion is reused while the map
+        object and its size are unchanged.
+        """
+        cached = self._page_breakpoints_cache
+        if cached is not None and cached[0] is page_map and cached[1] == len(page_map):
+            return cached[2]
+        
+        positions = []
+        pages = []
+        for position, page in sorted(page_map.items()):
+            if not pages or page != pages[-1]:
+                positions.append(position)
+                pages.append(page)
+        
+        breakpoints = (positions, pages)
+        self._page_breakpoints_cache = (page_map, len(page_map), breakpoints)
+        return breakpoints
+    
+    def _lookup_page(self, page_map: Optional[Dict[int, int]], position: int) -> Optional[int]:
+        """Page containing position per page_map, or None if the map does not cover it"""
+        if not page_map:
+            return None
+        positions, pages = self._page_breakpoints(page_map)
+        index = bisect_right(positions, position) - 1
+        return pages[index] if index >= 0 else None
+    
+    def _resolve_page(
+        self,
+        page_map: Optional[Dict[int, int]],
+        position: int,
+        doc_length: int,
+        total_pages: Optional[int] = None
+    ) -> int:
+        """Page containing position, estimated only when there is no page_map"""
+        if not page_map:
+            return self._estimate_page(position, doc_length, total_pages)
+        positions, pages = self._page_breakpoints(page_map)
+        # Text before the first mapped position belongs to the first mapped page
+        return pages[max(bisect_right(positions, position) - 1, 0)]
+    
+    def _estimate_page(self, position: int, doc_length: int, total_pages: Optional[int] = None) -> int:
         """Estimate page number from position"""
+        if total_pages:
+            # Spread the document evenly over its known page count
+            chars_per_page = max(doc_length // total_pages, 1)
+            return min((position // chars_per_page) + 1, total_pages)
         # Assume ~3000 characters per page
         chars_per_page = 3000
         page = (position // chars_per_page) + 1
@@ -493,7 +810,8 @@ citation_manager = CitationManager()
 def extract_citations(
     text: str,
     document_text: str,
-    page_map: Optional[Dict[int, int]] = None
+    page_map: Optional[Dict[int, int]] = None,
+    total_pages: Optional[int] = None
 ) -> List[Citation]:
     """
     Convenience function to extract citations
@@ -502,17 +820,24 @@ def extract_citations(
         text: Text containing citations
         document_text: Original document
         page_map: Page mapping
+        total_pages: Page count, used to estimate pages when page_map is missing
         
     Returns:
         List of citations
     """
-    return citation_manager.extract_citations(text, document_text, page_map)
+    return citation_manager.extract_citations(
+        text,
+        document_text,
+        page_map,
+        total_pages=total_pages
+    )
 
 
 def validate_citations(
     citations: List[Citation],
     document_text: str,
-    page_map: Optional[Dict[int, int]] = None
+    page_map: Optional[Dict[int, int]] = None,
+    require_exact: bool = True
 ) -> List[CitationValidation]:
     """
     Validate multiple citations
@@ -521,16 +846,36 @@ def validate_citations(
         citations: Citations to validate
         document_text: Original document
         page_map: Page mapping
+        require_exact: Require exact match
         
     Returns:
         List of validation results
     """
+    # Lowercase once and locate all citation texts in one pass over the document
+    document_lower = citation_manager._lower_document(document_text)
+    text_index = citation_manager.build_text_index(
+        [citation.text for citation in citations],
+        document_text,
+        document_lower
+    )
+    
+    if not require_exact:
+        # Rule out fuzzy misses for every text the exact pass did not place, in one call
+        citation_manager.screen_fuzzy_misses(
+            [citation.text for citation in citations if text_index.get(citation.text) is None],
+            document_text,
+            document_lower
+        )
+    
     results = []
     for citation in citations:
         validation = citation_manager.validate_citation(
             citation,
             document_text,
-            page_map
+            page_map,
+            require_exact=require_exact,
+            text_index=text_index,
+            document_lower=document_lower
         )
         results.append(validation)
     return results
\ No newline at end of file
@@ -4,6 +4,7 @@ Provides traceability and verification support for contract analysis results.
 """
 
 import re
+import threading
 from typing import Dict, List, Any, Optional, Tuple
 from dataclasses import dataclass
 from enum import Enum
@@ -42,6 +43,8 @@ class CitationTracker:
         self.citations = {}
         self.sentence_registry = {}
         self.next_citation_id = 1
+        # Guards ID allocation when questions are answered concurrently
+        self._id_lock = threading.Lock()
     
     def register_sentence(self, sentence: str, sentence_index: int, 
                          page_number: Optional[int] = None, 
@@ -59,16 +62,30 @@ class CitationTracker:
         }
         return sentence_id
     
+    def reserve_ids(self, count: int) -> range:
+        """
+        Reserve a block of citation numbers for later create_citation calls.
+        """
+        with self._id_lock:
+            start = self.next_citation_id
+            self.next_citation_id += count
+        return range(start, start + count)
+    
     def create_citation(self, source_text: str, citation_type: CitationType,
                        sentence_id: Optional[str] = None,
                        page_number: Optional[int] = None,
                        section_name: Optional[str] = None,
-                       confidence: float = 1.0) -> Citation:
+                       confidence: float = 1.0,
+                       citation_number: Optional[int] = None) -> Citation:
         """
         Create a new citation entry.
+        Pass citation_number from reserve_ids() to use a pre-allocated ID.
         """
-        citation_id = f"cite_{self.next_citation_id:04d}"
-        self.next_citation_id += 1
+        if citation_number is None:
+            with self._id_lock:
+                citation_number = self.next_citation_id
+                self.next_citation_id += 1
+        citation_id = f"cite_{citation_number:04d}"
         
         # Determine location string with page anchor format
         location_parts = []
@@ -0,0 +1,138 @@
+"""
+Approximate substring search helpers.
+
+Implements Myers' bit-parallel edit distance search. Uses a Numba-compiled
+kernel when numba is installed and falls back to Python integers otherwise.
+"""
+
+from typing import Dict, Sequence
+
+try:
+    import numpy as np
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    np = None
+    njit = None
+    NUMBA_AVAILABLE = False
+
+
+def substring_edit_distances(pattern: str, text: str) -> Sequence[int]:
+    """
+    Edit distance from pattern to the best substring of text ending at each position.
+
+    Args:
+        pattern: Text to search for
+        text: Text to search in
+
+    Returns:
+        One Levenshtein distance per character of text
+    """
+    if not pattern:
+        return [0] * len(text)
+    if NUMBA_AVAILABLE:
+        return _numba_distances(pattern, text)
+    return _python_distances(pattern, text)
+
+
+def _python_distances(pattern: str, text: str) -> Sequence[int]:
+    """Myers' search with one arbitrary-precision integer per bit vector."""
+    m = len(pattern)
+    mask = (1 << m) - 1
+    high = 1 << (m - 1)
+
+    peq: Dict[str, int] = {}
+    for i, char in enumerate(pattern):
+        peq[char] = peq.get(char, 0) | (1 << i)
+
+    pv = mask
+    mv = 0
+    score = m
+    distances = []
+    for char in text:
+        eq = peq.get(char, 0)
+        xv = eq | mv
+        xh = (((eq & pv) + pv) ^ pv) | eq
+        ph = mv | (~(xh | pv) & mask)
+        mh = pv & xh
+        if ph & high:
+            score += 1
+        elif mh & high:
+            score -= 1
+        # Row 0 is all zeros when searching, so nothing is shifted in
+        ph = (ph << 1) & mask
+        mh = (mh << 1) & mask
+        pv = mh | (~(xv | ph) & mask)
+        mv = ph & xv
+        distances.append(score)
+    return distances
+
+
+def _numba_distances(pattern: str, text: str) -> Sequence[int]:
+    """Myers' search over 64-bit blocks, compiled with Numba."""
+    pattern_codes = np.frombuffer(pattern.encode('utf-32-le'), dtype=np.uint32)
+    text_codes = np.frombuffer(text.encode('utf-32-le'), dtype=np.uint32)
+
+    # Map characters to a dense alphabet; id 0 is any character not in the pattern
+    alphabet = np.unique(pattern_codes)
+    slots = np.minimum(np.searchsorted(alphabet, text_codes), len(alphabet) - 1)
+    text_ids = np.where(alphabet[slots] == text_codes, slots + 1, 0).astype(np.int64)
+    pattern_ids = np.searchsorted(alphabet, pattern_codes) + 1
+
+    m = len(pattern)
+    blocks = (m + 63) // 64
+    peq = np.zeros((len(alphabet) + 1, blocks), dtype=np.uint64)
+    for i in range(m):
+        peq[pattern_ids[i], i // 64] |= np.uint64(1) << np.uint64(i % 64)
+
+    return _myers_kernel(peq, text_ids, m)
+
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True)
+    def _myers_kernel(peq, text_ids, m):
+        blocks = peq.shape[1]
+        one = np.uint64(1)
+        high = one << np.uint64(63)
+        last_high = one << np.uint64((m - 1) % 64)
+        pvs = np.full(blocks, np.uint64(0xFFFFFFFFFFFFFFFF), dtype=np.uint64)
+        mvs = np.zeros(blocks, dtype=np.uint64)
+        distances = np.empty(text_ids.shape[0], dtype=np.int64)
+        score = m
+
+        for j in range(text_ids.shape[0]):
+            char_id = text_ids[j]
+            # Horizontal delta carried into the next block; row 0 contributes none
+            hin = 0
+            for b in range(blocks):
+                pv = pvs[b]
+                mv = mvs[b]
+                eq = peq[char_id, b]
+                xv = eq | mv
+                if hin < 0:
+                    eq |= one
+                xh = (((eq & pv) + pv) ^ pv) | eq
+                ph = mv | ~(xh | pv)
+                mh = pv & xh
+
+                block_high = last_high if b == blocks - 1 else high
+                hout = 0
+                if ph & block_high:
+                    hout = 1
+                elif mh & block_high:
+                    hout = -1
+
+                ph = ph << one
+                mh = mh << one
+                if hin < 0:
+                    mh |= one
+                elif hin > 0:
+                    ph |= one
+                pvs[b] = mh | ~(xv | ph)
+                mvs[b] = ph & xv
+                hin = hout
+
+            score += hin
+            distances[j] = score
+
+        return distances
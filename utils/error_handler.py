@@ -31,6 +31,10 @@ class ErrorCategory(Enum):
     CONFIGURATION = "configuration"
 
 
+class FatalNodeError(RuntimeError):
+    """Raised by a node when the workflow must not continue past it."""
+
+
 @dataclass
 class ErrorContext:
     """Comprehensive error context for tracking and recovery."""
@@ -339,6 +343,7 @@ class ErrorHandler:
         
         # Critical errors that should stop processing
         critical_conditions = [
+            isinstance(error, FatalNodeError),
             'missing required configuration' in error_message.lower(),
             'authorization' in error_message.lower() and 'failed' in error_message.lower(),
             error_type in ['ImportError', 'ModuleNotFoundError'] and 'critical' in error_message.lower()
@@ -9,7 +9,7 @@ from dataclasses import dataclass, field
 import logging
 
 from utils.rule_manager import Rule, EvidenceRequirements
-from utils.citation_manager import Citation, citation_manager
+from utils.citation_manager import Citation, validate_citations
 from utils.deterministic_checker import DeterministicResult
 from utils.llm_judge import LLMJudgment
 
@@ -196,15 +196,15 @@ class EvidenceValidator:
     ) -> EvidenceValidationResult:
         """Validate individual citations"""
         
-        for citation in citations:
-            # Validate citation exists in document
-            citation_validation = citation_manager.validate_citation(
-                citation,
-                document_text,
-                page_map,
-                require_exact=requirements.require_exact_quotes
-            )
-            
+        # Validate citations exist in document, as one batch
+        citation_validations = validate_citations(
+            citations,
+            document_text,
+            page_map,
+            require_exact=requirements.require_exact_quotes
+        )
+        
+        for citation, citation_validation in zip(citations, citation_validations):
             if citation_validation.is_valid:
                 validation.valid_citations += 1
             else:
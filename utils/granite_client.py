@@ -8,7 +8,7 @@ import time
 import json
 import random
 import requests
-from typing import Dict, Any, Union
+from typing import Dict, Any, Optional, Tuple, Union
 from functools import wraps
 from dotenv import load_dotenv
 
@@ -142,19 +142,26 @@ class GraniteClient:
         }
         
         self.chat_url = f"{self.api_url}/v1/chat/completions"
+        
+        # Persistent session so retries and follow-up calls reuse the
+        # keep-alive TCP/TLS connection instead of re-handshaking
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        adapter = requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=16)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
     
-    @retry_with_exponential_backoff(
-        max_retries=5,
-        base_delay=1.0,
-        max_delay=60.0,
-        retry_on_status_codes=(429, 500, 502, 503, 504)
-    )
-    def _make_request(self, payload: Dict[str, Any]) -> requests.Response:
+    def _send_request(
+        self,
+        payload: Dict[str, Any],
+        timeout: Union[float, Tuple[float, float]] = 30
+    ) -> requests.Response:
         """
-        Make a request to the Granite API with retry logic.
+        Make a single request to the Granite API, without retries.
         
         Args:
             payload: The request payload
+            timeout: Seconds, or a (connect, read) tuple, passed to requests
             
         Returns:
             The response object
@@ -165,11 +172,11 @@ class GraniteClient:
             GraniteRateLimitError: For rate limiting (429)
         """
         try:
-            response = requests.post(
+            response = self.session.post(
                 self.chat_url, 
                 json=payload, 
                 headers=self.headers,
-                timeout=30  # 30 second timeout
+                timeout=timeout
             )
             
             # Check for HTTP errors
@@ -189,6 +196,20 @@ class GraniteClient:
         except requests.exceptions.RequestException as e:
             raise GraniteAPIError(f"Request failed: {e}")
     
+    @retry_with_exponential_backoff(
+        max_retries=5,
+        base_delay=1.0,
+        max_delay=60.0,
+        retry_on_status_codes=(429, 500, 502, 503, 504)
+    )
+    def _make_request(
+        self,
+        payload: Dict[str, Any],
+        timeout: Union[float, Tuple[float, float]] = 30
+    ) -> requests.Response:
+        """Make a request to the Granite API with retry logic (see _send_request)."""
+        return self._send_request(payload, timeout=timeout)
+    
     def call_api_streaming(
         self,
         prompt: str,
@@ -220,7 +241,7 @@ class GraniteClient:
         }
         
         try:
-            response = requests.post(
+            response = self.session.post(
                 self.chat_url,
                 json=payload,
                 headers=self.headers,
@@ -265,6 +286,8 @@ class GraniteClient:
         return_metadata: bool = False,
         stream: bool = False,
         stream_callback=None,
+        timeout: Union[float, Tuple[float, float]] = 30,
+        max_attempts: Optional[int] = None,
         **kwargs
     ) -> Union[str, Dict[str, Any]]:
         """
@@ -277,6 +300,9 @@ class GraniteClient:
             return_metadata: If True, return dict with content and metadata
             stream: If True, use streaming mode
             stream_callback: Callback for streaming mode
+            timeout: Request timeout in seconds, or a (connect, read) tuple
+            max_attempts: Total attempts including retries (default: the
+                client's standard policy of up to six attempts)
             **kwargs: Additional parameters for the API call
             
         Returns:
@@ -311,8 +337,15 @@ class GraniteClient:
             **kwargs
         }
         
+        if max_attempts is None:
+            send = self._make_request
+        else:
+            send = retry_with_exponential_backoff(
+                max_retries=max(0, max_attempts - 1)
+            )(self._send_request)
+        
         try:
-            response = self._make_request(payload)
+            response = send(payload, timeout=timeout)
             response_json = response.json()
             
             if 'choices' in response_json and response_json['choices']:
@@ -383,7 +416,7 @@ class GraniteClient:
             }
             
             try:
-                response = requests.post(
+                response = self.session.post(
                     self.chat_url,
                     json=payload,
                     headers=self.headers,
@@ -0,0 +1,46 @@
+"""
+JSON parsing and output helpers.
+
+Uses orjson when it is installed and falls back to the standard library.
+"""
+
+import json
+from typing import Any
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
+
+
+def dump_json(data: Any, path: str) -> None:
+    """Write data as 2-space indented JSON, stringifying unsupported types."""
+    if ORJSON_AVAILABLE:
+        # Pass datetimes through to default=str so both paths format them alike
+        option = orjson.OPT_INDENT_2 | orjson.OPT_PASSTHROUGH_DATETIME
+        with open(path, 'wb') as f:
+            f.write(orjson.dumps(data, option=option, default=str))
+        return
+    
+    # json.dump streams many small chunks through the pure-Python indenting
+    # encoder; building the string once and writing it in a single call is cheaper
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(json.dumps(data, indent=2, default=str))
+
+
+
+def loads_json(text: Any) -> Any:
+    """Parse JSON from str or bytes."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(text)
+    return json.loads(text)
+
+
+def dumps_json(data: Any) -> str:
+    """Serialize data as 2-space indented JSON text, stringifying unsupported types."""
+    if ORJSON_AVAILABLE:
+        option = orjson.OPT_INDENT_2 | orjson.OPT_PASSTHROUGH_DATETIME
+        return orjson.dumps(data, option=option, default=str).decode('utf-8')
+    return json.dumps(data, indent=2, default=str)
@@ -7,7 +7,12 @@ Resilient model calling utilities that enforce schema adherence by:
 - Appending corrective user messages and retrying when Granite drifts
 """
 
+import copy
+import hashlib
 import json
+import os
+import threading
+from collections import OrderedDict
 from typing import Dict, Any, List, Tuple, Optional
 
 from .granite_client import granite_client, GraniteAPIError
@@ -35,6 +40,32 @@ def _validate_schema_classification(payload: Dict[str, Any], allowed: List[str])
     return True, ""
 
 
+# Process-local memo of validated classifications, keyed by prompt digest.
+# Classification runs on worker threads, so every access holds the lock.
+SCHEMA_CACHE_MAX_ENTRIES = 512
+_schema_cache: "OrderedDict[bytes, Dict[str, Any]]" = OrderedDict()
+_schema_cache_lock = threading.Lock()
+
+
+def _schema_cache_key(system_message: str, user_message: str, allowed_classes: List[str],
+                      max_attempts: int) -> bytes:
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(system_message.encode("utf-8"))
+    digest.update(b"\0")
+    digest.update(user_message.encode("utf-8"))
+    digest.update(b"\0")
+    digest.update(",".join(sorted(allowed_classes)).encode("utf-8"))
+    digest.update(b"\0")
+    digest.update(str(max_attempts).encode("utf-8"))
+    return digest.digest()
+
+
+def clear_schema_cache() -> None:
+    """Drop all memoized schema-validated responses."""
+    with _schema_cache_lock:
+        _schema_cache.clear()
+
+
 DEFAULT_RETRY_MESSAGES = [
     (
         "Please correct your response to strictly follow the schema:\n"
@@ -60,7 +91,18 @@ def call_with_schema_retry(
     - Validates JSON and content values
     - On failure, appends a corrective user message and retries
     Returns the parsed JSON on success or raises GraniteAPIError after attempts.
+    Validated responses are memoized per prompt unless LLM_CACHE is set to something other than "1".
     """
+    use_cache = os.getenv("LLM_CACHE", "1") == "1"
+    if use_cache:
+        key = _schema_cache_key(system_message, user_message, allowed_classes, max_attempts)
+        with _schema_cache_lock:
+            cached = _schema_cache.get(key)
+            if cached is not None:
+                _schema_cache.move_to_end(key)
+        if cached is not None:
+            return copy.deepcopy(cached)
+
     messages = [
         {"role": "system", "content": system_message},
         {"role": "user", "content": user_message},
@@ -77,6 +119,12 @@ def call_with_schema_retry(
             else:
                 ok, why = _validate_schema_classification(parsed, allowed_classes)
                 if ok:
+                    if use_cache:
+                        entry = copy.deepcopy(parsed)
+                        with _schema_cache_lock:
+                            _schema_cache[key] = entry
+                            if len(_schema_cache) > SCHEMA_CACHE_MAX_ENTRIES:
+                                _schema_cache.popitem(last=False)
                     return parsed
                 last_error = f"Attempt {attempt}: schema/content validation failed: {why}; raw={text[:200]}"
         except GraniteAPIError as e:
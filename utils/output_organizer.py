@@ -10,7 +10,9 @@ Manages structured output organization with:
 
 import os
 import json
+import threading
 import pandas as pd
+from contextlib import contextmanager
 from datetime import datetime
 from typing import Dict, Any, Tuple
 from pathlib import Path
@@ -25,6 +27,43 @@ try:
 except ImportError:
     EXCEL_AVAILABLE = False
 
+try:
+    import fcntl
+    FCNTL_AVAILABLE = True
+except ImportError:
+    fcntl = None
+    FCNTL_AVAILABLE = False
+
+# Fallback when fcntl is unavailable (Windows): serializes this process only
+_master_excel_thread_lock = threading.Lock()
+
+
+@contextmanager
+def master_excel_lock(excel_path: str):
+    """
+    Hold an exclusive lock on a master Excel file for a read-modify-write.
+    
+    Documents can be analyzed concurrently (threads, or separate UI/API processes),
+    so updates take an flock on a sidecar "<excel_path>.lock" file and wait their
+    turn instead of overwriting each other's rows. Not reentrant.
+    
+    Args:
+        excel_path: Path to the master Excel file
+    """
+    if not FCNTL_AVAILABLE:
+        with _master_excel_thread_lock:
+            yield
+        return
+    
+    os.makedirs(os.path.dirname(excel_path) or '.', exist_ok=True)
+    with open(f"{excel_path}.lock", 'a') as lock_file:
+        fcntl.flock(lock_file, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+
 class OutputOrganizer:
     """Manages structured output organization for contract analysis."""
     
@@ -48,7 +87,7 @@ class OutputOrganizer:
         Create a run-specific directory and return paths for outputs.
         
         Args:
-            run_id: Unique run identifier (e.g., "20250623_172309")
+            run_id: Unique run identifier (e.g., "20250623_172309_123456_1a2b3c4d")
             document_path: Path to the target document
             reference_path: Path to the reference document
             
@@ -130,6 +169,16 @@ class OutputOrganizer:
         Returns:
             Path to the updated Excel file
         """
+        excel_path = self.get_master_excel_path(use_template_format=use_template_format)
+        with master_excel_lock(excel_path):
+            return self._update_master_excel(
+                analysis_data, run_id, document_path, reference_path, use_template_format
+            )
+    
+    def _update_master_excel(self, analysis_data: Dict[str, Any], run_id: str,
+                             document_path: str, reference_path: str,
+                             use_template_format: bool) -> str:
+        """Body of update_master_excel; the caller holds master_excel_lock."""
         if use_template_format:
             # Use the specialized template Excel writer (includes dynamic rule columns)
             excel_path = self.get_master_excel_path(use_template_format=True)
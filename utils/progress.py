@@ -0,0 +1,46 @@
+"""
+Progress update types shared by workflow nodes and the UI.
+
+Standard library only, so the UI can import these (and unpickle updates sent
+from a workflow worker process) without loading the nodes package.
+"""
+
+from datetime import datetime
+from enum import Enum
+from typing import Dict, Any, Optional
+
+
+class NodeStatus(Enum):
+    """Node execution statuses"""
+    PENDING = "pending"
+    RUNNING = "running"
+    COMPLETED = "completed"
+    FAILED = "failed"
+    SKIPPED = "skipped"
+    RETRYING = "retrying"
+
+
+class ProgressUpdate:
+    """Structured progress update from a node"""
+    def __init__(self,
+                 node_name: str,
+                 status: NodeStatus,
+                 message: str,
+                 progress: Optional[float] = None,
+                 details: Optional[Dict[str, Any]] = None):
+        self.node_name = node_name
+        self.status = status
+        self.message = message
+        self.progress = progress  # 0.0 to 1.0
+        self.details = details or {}
+        self.timestamp = datetime.now()
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'node_name': self.node_name,
+            'status': self.status.value,
+            'message': self.message,
+            'progress': self.progress,
+            'details': self.details,
+            'timestamp': self.timestamp.isoformat()
+        }
@@ -5,7 +5,10 @@ Retrieval utilities for selecting candidate clauses per rule.
 """
 from __future__ import annotations
 
-from typing import List, Dict, Any, Tuple, Optional
+from typing import List, Dict, Any, Tuple, Optional, Callable
+from collections import Counter
+from functools import lru_cache
+import heapq
 import math
 import re
 import os
@@ -14,47 +17,83 @@ import json
 DEFAULT_K1 = 1.5
 DEFAULT_B = 0.75
 
+_TOKEN_RE = re.compile(r"[a-z0-9_]+")
+
 
 def _tokenize(text: str) -> List[str]:
     text = (text or "").lower()
     # Simple tokenization: alphanumerics only
-    tokens = re.findall(r"[a-z0-9_]+", text)
+    tokens = _TOKEN_RE.findall(text)
     return tokens
 
 
-def _build_index(sentences: List[str]) -> Tuple[List[List[str]], Dict[str, int], float]:
-    tokenized: List[List[str]] = [_tokenize(s) for s in sentences]
-    df: Dict[str, int] = {}
-    for terms in tokenized:
-        seen = set()
-        for t in terms:
-            if t in seen:
-                continue
-            seen.add(t)
-            df[t] = df.get(t, 0) + 1
-    avgdl = sum(len(terms) for terms in tokenized) / (len(tokenized) or 1)
-    return tokenized, df, avgdl
-
+def _build_index(sentences: List[str]) -> Tuple[List[Counter], List[int], Dict[str, int], float]:
+    tf_counts: List[Counter] = []
+    lengths: List[int] = []
+    df: Counter = Counter()
+    for s in sentences:
+        terms = _tokenize(s)
+        counts = Counter(terms)
+        tf_counts.append(counts)
+        lengths.append(len(terms))
+        df.update(counts.keys())
+    avgdl = sum(lengths) / (len(lengths) or 1)
+    return tf_counts, lengths, dict(df), avgdl
+
+
+@lru_cache(maxsize=4)
+def _cached_index(sentences: Tuple[str, ...]) -> Tuple[List[Counter], List[int], Dict[str, int], float]:
+    """Index a sentence list once; every rule evaluated against it reuses the result."""
+    return _build_index(list(sentences))
+
+
+def _compile_rule_scorer(
+    query_terms: List[str],
+    df: Dict[str, int],
+    n_docs: int,
+    avgdl: float,
+    k1: float,
+    b: float,
+) -> Optional[Callable[[Counter, int], float]]:
+    """Specialize BM25 to one rule's query terms over one corpus.
+
+    IDF weights are bound into the closure up front, so the per-sentence call
+    only does term-frequency lookups. Returns None when no query term occurs
+    in the corpus.
+    """
+    # Only query terms that occur in the corpus can contribute
+    weights = tuple(
+        (q, math.log((n_docs - df[q] + 0.5) / (df[q] + 0.5) + 1.0))
+        for q in query_terms if q in df
+    )
+    if not weights:
+        return None
+    avg = avgdl or 1
+    k1_plus_1 = k1 + 1
+
+    def score(tf_counts: Counter, length: int) -> float:
+        if not length:
+            return 0.0
+        norm = k1 * (1 - b + b * (length / avg))
+        total = 0.0
+        for q, w in weights:
+            tf = tf_counts.get(q, 0)
+            if tf:
+                total += w * (tf * k1_plus_1) / (tf + norm)
+        return total
 
-def _bm25_score(query_terms: List[str], terms: List[str], df: Dict[str, int], N: int, avgdl: float, k1: float, b: float) -> float:
-    if not terms:
-        return 0.0
-    score = 0.0
-    doclen = len(terms)
-    tf_counts: Dict[str, int] = {}
-    for t in terms:
-        tf_counts[t] = tf_counts.get(t, 0) + 1
-    for q in query_terms:
-        if q not in df:
-            continue
-        n_q = df[q]
-        idf = math.log((N - n_q + 0.5) / (n_q + 0.5) + 1.0)
-        tf = tf_counts.get(q, 0)
-        denom = tf + k1 * (1 - b + b * (doclen / (avgdl or 1)))
-        score += idf * (tf * (k1 + 1)) / (denom or 1)
     return score
 
 
+def _bm25_scores(query_terms: List[str], sentences: List[str], k1: float, b: float) -> List[float]:
+    """Score every sentence for one rule against the (cached) corpus index."""
+    tf_counts, lengths, df, avgdl = _cached_index(tuple(sentences))
+    scorer = _compile_rule_scorer(query_terms, df, len(lengths), avgdl, k1, b)
+    if scorer is None:
+        return [0.0] * len(lengths)
+    return [scorer(counts, length) for counts, length in zip(tf_counts, lengths)]
+
+
 def _merge_window(sentences: List[str], center_idx: int, window: int) -> Tuple[str, List[int]]:
     if window <= 0:
         return sentences[center_idx], [center_idx]
@@ -65,6 +104,37 @@ def _merge_window(sentences: List[str], center_idx: int, window: int) -> Tuple[s
     return chunk, indices
 
 
+def _collect_windows(
+    sentences: List[str],
+    ranked,
+    top_k: int,
+    window: int,
+) -> List[Dict[str, Any]]:
+    """Turn ranked (index, score) pairs into de-duplicated windowed candidates.
+
+    The span is checked before the chunk is joined, so duplicate windows cost
+    no string building.
+    """
+    last = len(sentences) - 1
+    results: List[Dict[str, Any]] = []
+    seen_spans = set()
+    for idx, score in ranked:
+        span_key = (max(0, idx - window), min(last, idx + window)) if window > 0 else (idx, idx)
+        if span_key in seen_spans:
+            continue
+        seen_spans.add(span_key)
+        chunk, indices = _merge_window(sentences, idx, window)
+        results.append({
+            "index": idx,
+            "score": float(score),
+            "chunk": chunk,
+            "sentence_indices": indices,
+        })
+        if len(results) >= top_k:
+            break
+    return results
+
+
 def build_query_terms(rule: Dict[str, Any]) -> List[str]:
     terms: List[str] = []
     for field in ("name", "description", "rule_text"):
@@ -96,33 +166,16 @@ def retrieve_top_k_for_rule(
     if not sentences:
         return []
     query_terms = build_query_terms(rule)
-    tokenized, df, avgdl = _build_index(sentences)
-    N = len(tokenized)
-
-    scored: List[Tuple[int, float]] = []
-    for idx, terms in enumerate(tokenized):
-        score = _bm25_score(query_terms, terms, df, N, avgdl, k1, b)
-        if score > 0:
-            scored.append((idx, score))
+    scores = _bm25_scores(query_terms, sentences, k1, b)
 
-    scored.sort(key=lambda x: x[1], reverse=True)
-    results: List[Dict[str, Any]] = []
-    seen_spans = set()
-    for idx, score in scored[: max(top_k * (window * 2 + 1), top_k)]:
-        chunk, indices = _merge_window(sentences, idx, window)
-        span_key = (indices[0], indices[-1])
-        if span_key in seen_spans:
-            continue
-        seen_spans.add(span_key)
-        results.append({
-            "index": idx,
-            "score": float(score),
-            "chunk": chunk,
-            "sentence_indices": indices,
-        })
-        if len(results) >= top_k:
-            break
-    return results
+    # Partial selection instead of sorting every scored sentence
+    limit = max(top_k * (window * 2 + 1), top_k)
+    scored = heapq.nlargest(
+        limit,
+        ((idx, score) for idx, score in enumerate(scores) if score > 0),
+        key=lambda x: x[1],
+    )
+    return _collect_windows(sentences, scored, top_k, window)
 
 
 def env_top_k(default: int = 8) -> int:
@@ -232,11 +285,7 @@ def retrieve_top_k_hybrid(
 
     # BM25 baseline
     query_terms = build_query_terms(rule)
-    tokenized, df, avgdl = _build_index(sentences)
-    N = len(tokenized)
-    bm25_scores: List[float] = []
-    for terms in tokenized:
-        bm25_scores.append(_bm25_score(query_terms, terms, df, N, avgdl, k1, b))
+    bm25_scores = _bm25_scores(query_terms, sentences, k1, b)
     bm25_norm = _normalize_scores(bm25_scores)
 
     # Optional embeddings
@@ -255,27 +304,13 @@ def retrieve_top_k_hybrid(
             cos_norm = _normalize_scores(cosims)
             hybrid_scores = [alpha * cos + (1 - alpha) * bm for cos, bm in zip(cos_norm, bm25_norm)]
 
-    # Rank and window merge
-    ranked = sorted(list(enumerate(hybrid_scores)), key=lambda x: x[1], reverse=True)
-    results: List[Dict[str, Any]] = []
-    seen_spans = set()
-    for idx, score in ranked:
-        if score <= 0:
-            continue
-        chunk, indices = _merge_window(sentences, idx, window)
-        span_key = (indices[0], indices[-1])
-        if span_key in seen_spans:
-            continue
-        seen_spans.add(span_key)
-        results.append({
-            "index": idx,
-            "score": float(score),
-            "chunk": chunk,
-            "sentence_indices": indices,
-        })
-        if len(results) >= top_k:
-            break
-    return results
+    # Rank positive scores only, then window merge
+    ranked = sorted(
+        ((idx, score) for idx, score in enumerate(hybrid_scores) if score > 0),
+        key=lambda x: x[1],
+        reverse=True,
+    )
+    return _collect_windows(sentences, ranked, top_k, window)
 
 
 def get_candidates_for_rule(
@@ -319,10 +354,20 @@ def fallback_retrieve_top_k_from_text(
     if not document_text:
         return []
     query_terms = set(build_query_terms(rule))
+    if not query_terms:
+        return []
+    # One compiled scan rejects paragraphs without any whole-token query term
+    # before paying for tokenization and set construction
+    term_re = re.compile(
+        r"(?<![a-z0-9_])(?:" + "|".join(map(re.escape, query_terms)) + r")(?![a-z0-9_])"
+    )
     paragraphs = [p.strip() for p in document_text.split("\n\n") if p.strip()]
     scored: List[Tuple[int, float]] = []
     for idx, p in enumerate(paragraphs):
-        toks = set(_tokenize(p))
+        p_lower = p.lower()
+        if not term_re.search(p_lower):
+            continue
+        toks = set(_TOKEN_RE.findall(p_lower))
         overlap = len(query_terms.intersection(toks))
         if overlap > 0:
             # Simple score: term overlap weighted by length
@@ -11,6 +11,8 @@ import json
 from datetime import datetime
 from typing import Dict, Any, List
 
+from utils.output_organizer import master_excel_lock
+
 try:
     import openpyxl
     from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
@@ -232,17 +234,20 @@ class RuleComplianceMasterWriter:
             print("❌ Excel update requires openpyxl library")
             return
         
-        wb = self.initialize_master_workbook()
         doc_name = os.path.basename(document_path)
         
-        # Update each sheet
-        self._update_compliance_matrix(wb, doc_name, analysis_data)
-        self._update_document_summary(wb, doc_name, analysis_data)
-        self._update_critical_issues(wb, doc_name, analysis_data)
-        
-        # Save workbook
-        os.makedirs(os.path.dirname(self.master_path), exist_ok=True)
-        wb.save(self.master_path)
+        # Hold the lock across load and save so concurrent runs don't drop each other's rows
+        with master_excel_lock(self.master_path):
+            wb = self.initialize_master_workbook()
+            
+            # Update each sheet
+            self._update_compliance_matrix(wb, doc_name, analysis_data)
+            self._update_document_summary(wb, doc_name, analysis_data)
+            self._update_critical_issues(wb, doc_name, analysis_data)
+            
+            # Save workbook
+            os.makedirs(os.path.dirname(self.master_path), exist_ok=True)
+            wb.save(self.master_path)
         
         print(f"✅ Updated master compliance workbook: {self.master_path}")
     
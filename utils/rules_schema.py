@@ -46,6 +46,16 @@ def derive_keywords_if_missing(name: str, description: str) -> List[str]:
     return result[:6]
 
 
+def normalize_keywords(raw: Any) -> List[str]:
+    """Lowercased, stripped, de-duplicated keywords from a CSV string or list."""
+    if isinstance(raw, str):
+        items = raw.split(",")
+    else:
+        items = list(raw or [])
+    # dict.fromkeys de-duplicates while preserving order
+    return list(dict.fromkeys(k for k in (_safe_str(i).lower() for i in items) if k))
+
+
 def coerce_default_status(value: str) -> str:
     v = _safe_str(value).lower()
     # Map common synonyms
@@ -72,12 +82,9 @@ def normalize_rule_row(row: Dict[str, Any]) -> Dict[str, Any]:
     default_status = coerce_default_status(row.get("default") or row.get("default_status") or "unknown")
     severity = coerce_severity(row.get("severity") or "")
 
-    # keywords/exceptions can be CSV string or list
-    keywords_raw = row.get("keywords")
-    if isinstance(keywords_raw, str):
-        keywords = [k.strip() for k in keywords_raw.split(",") if k.strip()]
-    else:
-        keywords = list(keywords_raw or [])
+    # keywords/exceptions can be CSV string or list; keywords are normalized
+    # once here so retrieval does not re-split or re-lowercase them per sentence
+    keywords = normalize_keywords(row.get("keywords"))
 
     exceptions_raw = row.get("exceptions")
     if isinstance(exceptions_raw, str):
@@ -4,6 +4,7 @@ Maps sentences to their page numbers based on document page anchors
 """
 
 import re
+from bisect import bisect_right
 from typing import List, Dict, Tuple, Any
 
 
@@ -15,6 +16,9 @@ class SentencePageMapper:
     def __init__(self):
         self.page_boundaries = []
         self.current_document = None
+        self._boundary_positions = []
+        # (document_text, clean anchor starts, cumulative anchor offsets)
+        self._anchor_index = None
     
     def extract_page_boundaries(self, document_text: str) -> List[Tuple[int, int]]:
         """
@@ -37,8 +41,25 @@ class SentencePageMapper:
         boundaries.sort(key=lambda x: x[1])
         
         self.page_boundaries = boundaries
+        self._boundary_positions = [pos for _, pos in boundaries]
+        self._index_anchor_offsets(document_text)
         return boundaries
     
+    def _index_anchor_offsets(self, document_text: str) -> Tuple[List[int], List[int]]:
+        """
+        Precompute anchor start positions in clean-text coordinates together with
+        the cumulative number of anchor characters removed up to each anchor.
+        """
+        starts = []
+        offsets = []
+        offset = 0
+        for match in self.ANCHOR_PATTERN.finditer(document_text):
+            starts.append(match.start() - offset)
+            offset += len(match.group(0))
+            offsets.append(offset)
+        self._anchor_index = (document_text, starts, offsets)
+        return starts, offsets
+    
     def get_page_for_position(self, position: int) -> int:
         """
         Get page number for a character position in the document.
@@ -46,14 +67,11 @@ class SentencePageMapper:
         if not self.page_boundaries:
             return 1
         
-        current_page = 1
-        for page_num, page_pos in self.page_boundaries:
-            if position >= page_pos:
-                current_page = page_num
-            else:
-                break
+        index = bisect_right(self._boundary_positions, position) - 1
+        if index < 0:
+            return 1
         
-        return current_page
+        return self.page_boundaries[index][0]
     
     def map_sentences_to_pages(self, 
                                sentences: List[str], 
@@ -103,17 +121,16 @@ class SentencePageMapper:
         """
         Map a position in clean text to original text position.
         """
-        # Count anchors before this position
-        anchors_before = 0
-        offset = 0
-        
-        for match in self.ANCHOR_PATTERN.finditer(original_text):
-            anchor_start = match.start() - offset
-            if anchor_start <= clean_pos:
-                offset += len(match.group(0))
-                anchors_before += 1
-            else:
-                break
+        # Offsets are indexed once per document; reuse them only for that same text
+        index = self._anchor_index
+        if index is not None and index[0] is original_text:
+            starts, offsets = index[1], index[2]
+        else:
+            starts, offsets = self._index_anchor_offsets(original_text)
+        
+        # Anchors at or before this position
+        anchors_before = bisect_right(starts, clean_pos)
+        offset = offsets[anchors_before - 1] if anchors_before else 0
         
         return clean_pos + offset
     
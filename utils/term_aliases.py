@@ -7,6 +7,7 @@ Provides:
 """
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import Dict, Set
 
 
@@ -71,17 +72,21 @@ def rule_id_to_canonical(rule_id: str) -> str:
     return mapping.get(rid, rid)
 
 
+@lru_cache(maxsize=1)
+def _alias_index() -> Dict[str, str]:
+    """Flattened alias -> canonical lookup, built once."""
+    aliases = get_term_aliases()
+    # Canonical keys win over aliases; the first canonical listing an alias wins
+    index = {canonical: canonical for canonical in aliases}
+    for canonical, alias_set in aliases.items():
+        for alias in alias_set:
+            index.setdefault(alias, canonical)
+    return index
+
+
 def alias_to_canonical(term: str) -> str:
     """Map any alias or canonical label to its canonical term key; returns original if unknown."""
     t = (term or "").lower().strip()
-    aliases = get_term_aliases()
-    # direct match to a canonical key
-    if t in aliases:
-        return t
-    # search aliases
-    for canonical, alias_set in aliases.items():
-        if t in alias_set:
-            return canonical
-    return term
+    return _alias_index().get(t, term)
 
 
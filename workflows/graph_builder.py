@@ -4,9 +4,10 @@ from utils.state_logger import initialize_state_logger
 from utils.enhanced_state_logger import initialize_enhanced_logger
 from utils.selective_state_logger import initialize_selective_logger
 from utils.enhanced_node_wrapper import create_enhanced_logged_node
-from utils.model_config import get_questionnaire_processor, is_dual_model_enabled
+from utils.model_config import get_questionnaire_processor, is_dual_model_enabled, model_config
 from dotenv import load_dotenv
 import os
+import functools
 from datetime import datetime
 
 # Import the node functions directly from the 'nodes' package
@@ -181,8 +182,29 @@ def decide_rules_processing(state: ContractAnalysisState) -> str:
         print("Rules processing DISABLED or no rules path - skipping to reference_classifier")
         return "reference_classifier"
 
-def build_graph():
-    """Builds and compiles the LangGraph workflow with enhanced state logging."""
+# Environment flags that change the compiled graph; build_graph() reuses a
+# compiled graph while these stay the same
+_GRAPH_ENV_KEYS = (
+    'RULES_MODE_ENABLED',
+    'RULES_PATH',
+    'DUAL_MODEL_ENABLED',
+    'USE_TUNED_MODEL',
+    'USE_ENHANCED_ATTRIBUTION',
+)
+
+
+def _dry_run_node(state: ContractAnalysisState) -> dict:
+    """Placeholder node callable for build_graph(dry_run=True)."""
+    return {}
+
+
+def build_graph(dry_run: bool = False):
+    """Builds and compiles the LangGraph workflow with enhanced state logging.
+
+    Compiled graphs are cached per configuration; call build_graph.cache_clear()
+    to force a fresh build. With dry_run=True the same graph is wired with
+    placeholder node callables and compiled without logging, for introspection.
+    """
     # Initialize state logging
     # Load only the agent-local .env (monorepo-safe)
     agent_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
@@ -198,6 +220,11 @@ def build_graph():
     if rules_mode_override is not None:
         os.environ['RULES_MODE_ENABLED'] = rules_mode_override
     
+    if dry_run:
+        rules_enabled = os.getenv('RULES_MODE_ENABLED', 'false').lower() in ('true', '1', 'yes', 'on')
+        node_names = _node_functions(rules_enabled, get_questionnaire_processor())
+        return _wire_workflow({name: _dry_run_node for name in node_names}, rules_enabled).compile()
+    
     # Use selective logging to reduce file count
     use_selective = os.getenv('USE_SELECTIVE_LOGGING', 'true').lower() in ('1', 'true', 'yes', 'on')
     
@@ -211,16 +238,22 @@ def build_graph():
         initialize_enhanced_logger(logs_dir=logs_dir)
         print("Using FULL state logging (all nodes)")
     
-    workflow = StateGraph(ContractAnalysisState)
+    env_key = tuple(os.environ.get(k, '') for k in _GRAPH_ENV_KEYS)
+    # model_config settings are part of the cache key, so a config change rebuilds
+    use_tuned_model = bool(getattr(model_config, 'use_tuned_model', False))
+    return _build_compiled_graph(env_key, use_tuned_model)
+
 
+@functools.lru_cache(maxsize=8)
+def _build_compiled_graph(env_key: tuple, use_tuned_model: bool):
+    """Compile the workflow for one configuration (see _GRAPH_ENV_KEYS and build_graph)."""
     # Get the appropriate questionnaire processor based on configuration
     questionnaire_processor_func = get_questionnaire_processor()
     
     # Determine processor type for logging
-    from utils.model_config import model_config
     if os.getenv('USE_ENHANCED_ATTRIBUTION', '').lower() in ('1', 'true', 'yes', 'on'):
         processor_name = "questionnaire_processor_enhanced"
-    elif model_config.use_tuned_model:
+    elif use_tuned_model:
         processor_name = "questionnaire_processor_tuned"
     elif is_dual_model_enabled():
         processor_name = "questionnaire_processor_dual"
@@ -228,59 +261,61 @@ def build_graph():
         processor_name = "questionnaire_processor"
     print(f"Using processor: {processor_name}")
 
-    # Wrap nodes with enhanced logging functionality
-    # Use enhanced logging for better state tracking
-    logged_preflight_check = create_enhanced_logged_node(preflight_check, "preflight_check")
-    logged_pdf_converter = create_enhanced_logged_node(convert_pdf_to_markdown, "pdf_converter")
-    logged_loader = create_enhanced_logged_node(load_and_prep_document, "loader")
-    logged_entity_extractor = create_enhanced_logged_node(extract_entities_from_document, "entity_extractor")
-    logged_target_classifier = create_enhanced_logged_node(classify_and_validate_sentences, "target_classifier")
-    logged_reference_classifier = create_enhanced_logged_node(classify_reference_document, "reference_classifier")
-    logged_questionnaire_processor = create_enhanced_logged_node(questionnaire_processor_func, processor_name)
-    logged_yaml_populator = create_enhanced_logged_node(questionnaire_yaml_populator_node, "yaml_populator")
-    
-    # Critic nodes
-    logged_pdf_critic = create_enhanced_logged_node(pdf_conversion_critic_node, "pdf_critic")
-    logged_classification_critic = create_enhanced_logged_node(classification_coverage_critic_node, "classification_critic")
-    logged_questionnaire_critic = create_enhanced_logged_node(questionnaire_completeness_critic_node, "questionnaire_critic")
-    logged_citation_critic = create_enhanced_logged_node(citation_critic_node, "citation_critic")
-
     # Rules mode: conditional based on RULES_MODE_ENABLED
     # Check if rules should be loaded
     rules_enabled = os.getenv('RULES_MODE_ENABLED', 'false').lower() in ('true', '1', 'yes', 'on')
     
     if rules_enabled:
         print("Rules mode ENABLED - loading rules nodes")
-        from nodes import rules_loader
-        from nodes.rule_compliance_evaluator import evaluate_document_compliance
-        logged_rules_loader = create_enhanced_logged_node(rules_loader, "rules_loader")
-        logged_rule_compliance_evaluator = create_enhanced_logged_node(evaluate_document_compliance, "rule_compliance_evaluator")
     else:
         print("Rules mode DISABLED - rules nodes will not be loaded")
-        logged_rules_loader = None
-        logged_rule_compliance_evaluator = None
 
-    # Add logged nodes to workflow
-    workflow.add_node("preflight_check", logged_preflight_check)
-    workflow.add_node("pdf_converter", logged_pdf_converter)
-    workflow.add_node("loader", logged_loader)
-    workflow.add_node("entity_extractor", logged_entity_extractor)
-    workflow.add_node("target_classifier", logged_target_classifier)
-    workflow.add_node("reference_classifier", logged_reference_classifier)
-    workflow.add_node("questionnaire_processor", logged_questionnaire_processor)
-    
-    # Add all critic nodes
-    workflow.add_node("pdf_critic", logged_pdf_critic)
-    workflow.add_node("classification_critic", logged_classification_critic)
-    workflow.add_node("questionnaire_critic", logged_questionnaire_critic)
-    workflow.add_node("citation_critic", logged_citation_critic)
-    
-    workflow.add_node("yaml_populator", logged_yaml_populator)
+    # Wrap nodes with enhanced logging functionality
+    # Use enhanced logging for better state tracking
+    logged_nodes = {
+        name: create_enhanced_logged_node(func, processor_name if name == "questionnaire_processor" else name)
+        for name, func in _node_functions(rules_enabled, questionnaire_processor_func).items()
+    }
+
+    # Compile the graph
+    app = _wire_workflow(logged_nodes, rules_enabled).compile()
+    return app
+
+
+def _node_functions(rules_enabled: bool, questionnaire_processor_func) -> dict:
+    """Node name -> node callable, in the order the nodes are added to the graph."""
+    node_funcs = {
+        "preflight_check": preflight_check,
+        "pdf_converter": convert_pdf_to_markdown,
+        "loader": load_and_prep_document,
+        "entity_extractor": extract_entities_from_document,
+        "target_classifier": classify_and_validate_sentences,
+        "reference_classifier": classify_reference_document,
+        "questionnaire_processor": questionnaire_processor_func,
+        
+        # Critic nodes
+        "pdf_critic": pdf_conversion_critic_node,
+        "classification_critic": classification_coverage_critic_node,
+        "questionnaire_critic": questionnaire_completeness_critic_node,
+        "citation_critic": citation_critic_node,
+        
+        "yaml_populator": questionnaire_yaml_populator_node,
+    }
     
     # Only add rules nodes if rules are enabled
     if rules_enabled:
-        workflow.add_node("rules_loader", logged_rules_loader)
-        workflow.add_node("rule_compliance_evaluator", logged_rule_compliance_evaluator)
+        from nodes import rules_loader
+        from nodes.rule_compliance_evaluator import evaluate_document_compliance
+        node_funcs["rules_loader"] = rules_loader
+        node_funcs["rule_compliance_evaluator"] = evaluate_document_compliance
+    return node_funcs
+
+
+def _wire_workflow(nodes: dict, rules_enabled: bool) -> StateGraph:
+    """Add the given node callables to a StateGraph and define the execution flow."""
+    workflow = StateGraph(ContractAnalysisState)
+    for name, node in nodes.items():
+        workflow.add_node(name, node)
 
     # Define the execution flow
     workflow.set_entry_point("preflight_check")
@@ -349,7 +384,7 @@ def build_graph():
     )
     
     workflow.add_edge("yaml_populator", END)
+    return workflow
 
-    # Compile the graph
-    app = workflow.compile()
-    return app
\ No newline at end of file
+
+build_graph.cache_clear = _build_compiled_graph.cache_clear
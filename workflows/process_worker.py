@@ -0,0 +1,137 @@
+"""
+Out-of-process workflow runner.
+
+A WorkflowWorker owns a child process that imports the workflow modules and
+compiles the graph once, under the environment it was started with. Documents
+are submitted as initial states; progress updates and results come back over
+a multiprocessing queue, so the calling process never imports or reloads the
+graph itself. One worker can serve several callers (e.g. Streamlit sessions):
+each submit names the queue its job's events are routed to.
+"""
+
+import contextvars
+import multiprocessing
+import os
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Optional
+
+# Only these keys of the final state are sent back; the full state can be large
+# and is not guaranteed to be picklable
+RESULT_KEYS = ('rule_compliance_summary', 'workflow_status', 'processing_errors')
+
+# Job whose workflow is running in the current context; LangGraph copies
+# contexts into its executor threads, so node progress reports keep it
+_current_job: contextvars.ContextVar[Optional[int]] = contextvars.ContextVar('current_job', default=None)
+
+
+def _worker_main(jobs, events, max_workers: int) -> None:
+    """Child process entry point: build the graph, then run jobs until told to stop."""
+    try:
+        from nodes.base_node import ProgressReporter
+        from workflows.graph_builder import build_graph
+        app = build_graph()
+    except Exception as e:
+        events.put(("fatal", None, f"Failed to build workflow: {e}"))
+        return
+
+    reporter = ProgressReporter()
+    reporter.clear_callbacks()
+
+    def forward_update(update) -> None:
+        job_id = _current_job.get()
+        if job_id is not None:
+            events.put(("progress", job_id, update))
+
+    reporter.register_callback(forward_update)
+
+    def run_job(job_id: int, state: Dict[str, Any]) -> None:
+        _current_job.set(job_id)
+        try:
+            result = app.invoke(state)
+            events.put(("result", job_id, {k: result[k] for k in RESULT_KEYS if k in result}))
+        except Exception as e:
+            events.put(("error", job_id, str(e)))
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        while True:
+            job = jobs.get()
+            if job is None:
+                break
+            executor.submit(run_job, *job)
+
+
+class WorkflowWorker:
+    """A child process running workflow jobs with the environment it was started under."""
+
+    def __init__(self, max_workers: Optional[int] = None):
+        if max_workers is None:
+            max_workers = max(1, int(os.getenv('DOCUMENT_PARALLEL', '4')))
+        # spawn: a fresh interpreter, no inherited threads or half-imported modules
+        ctx = multiprocessing.get_context('spawn')
+        self._jobs = ctx.Queue()
+        self._events = ctx.Queue()
+        self._next_job_id = 0
+        # job id -> queue of the caller that submitted it; guarded by _routes_lock
+        self._routes: Dict[int, queue.Queue] = {}
+        self._routes_lock = threading.Lock()
+        self._fatal_event = None
+        self._process = ctx.Process(
+            target=_worker_main,
+            args=(self._jobs, self._events, max_workers),
+            daemon=True,
+        )
+        self._process.start()
+        threading.Thread(target=self._route_events, name='workflow-worker-events', daemon=True).start()
+
+    def is_alive(self) -> bool:
+        return self._process.is_alive()
+
+    def submit(self, state: Dict[str, Any], events: queue.Queue) -> int:
+        """Queue one document's initial state; returns the job id used in events.
+
+        The job's (kind, job_id, payload) events are put on events. kind is
+        "progress" (payload: ProgressUpdate), "result" (payload: dict of
+        RESULT_KEYS), "error" (payload: message) or "fatal" (job_id None,
+        sent once to every caller with unfinished jobs).
+        """
+        with self._routes_lock:
+            job_id = self._next_job_id
+            self._next_job_id += 1
+            if self._fatal_event is not None:
+                # The child could not build the graph and has exited
+                events.put(self._fatal_event)
+                return job_id
+            self._routes[job_id] = events
+        self._jobs.put((job_id, state))
+        return job_id
+
+    def _route_events(self) -> None:
+        """Forward events from the child process to the queue of the job's submitter."""
+        while True:
+            try:
+                event = self._events.get()
+            except (EOFError, OSError):
+                return
+            kind, job_id = event[0], event[1]
+            with self._routes_lock:
+                if kind == "fatal":
+                    self._fatal_event = event
+                    targets = list({id(q): q for q in self._routes.values()}.values())
+                    self._routes.clear()
+                elif kind == "progress":
+                    targets = [self._routes[job_id]] if job_id in self._routes else []
+                else:
+                    target = self._routes.pop(job_id, None)
+                    targets = [target] if target is not None else []
+            for target in targets:
+                target.put(event)
+
+    def close(self, timeout: float = 5.0) -> None:
+        """Ask the worker to finish queued jobs and exit; terminate it if it does not."""
+        if self._process.is_alive():
+            self._jobs.put(None)
+            self._process.join(timeout)
+        if self._process.is_alive():
+            self._process.terminate()